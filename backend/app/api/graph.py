@@ -1,4 +1,9 @@
-from fastapi import APIRouter, Depends
+import json
+import zlib
+from typing import Dict, Iterable, Iterator, List
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 
 from ..models.api import (
     GraphNeighborResponse,
@@ -11,6 +16,9 @@ from ..security.dependencies import (
 
 router = APIRouter()
 
+_EXPORT_FLUSH_LINES = 512
+
+
 @router.get("/graph/neighbors/{node_id}", response_model=GraphNeighborResponse)
 def get_graph_neighbors(
     node_id: str,
@@ -18,3 +26,63 @@ def get_graph_neighbors(
     service: GraphService = Depends(get_graph_service),
 ) -> GraphNeighborResponse:
     return service.get_neighbors(node_id)
+
+
+@router.get("/graph/export")
+def export_graph(
+    after: str | None = Query(default=None, description="Resume after this record cursor"),
+    compress: bool = Query(default=False, description="gzip-encode the NDJSON stream"),
+    _principal: Principal = Depends(authorize_graph_read),
+    service: GraphService = Depends(get_graph_service),
+) -> StreamingResponse:
+    try:
+        records = service.iter_export(after=after)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return _ndjson_response(records, compress=compress)
+
+
+@router.get("/graph/subgraph/export")
+def export_subgraph(
+    ids: List[str] = Query(..., description="Seed node ids"),
+    hops: int = Query(default=1, ge=1, le=4),
+    after: str | None = Query(default=None, description="Resume after this record cursor"),
+    compress: bool = Query(default=False, description="gzip-encode the NDJSON stream"),
+    _principal: Principal = Depends(authorize_graph_read),
+    service: GraphService = Depends(get_graph_service),
+) -> StreamingResponse:
+    try:
+        records = service.iter_subgraph_export(ids, max_hops=hops, after=after)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return _ndjson_response(records, compress=compress)
+
+
+def _ndjson_response(records: Iterator[Dict[str, object]], *, compress: bool) -> StreamingResponse:
+    headers = {"Content-Encoding": "gzip"} if compress else {}
+    return StreamingResponse(
+        _encode_ndjson(records, compress=compress), media_type="application/x-ndjson", headers=headers
+    )
+
+
+def _encode_ndjson(records: Iterable[Dict[str, object]], *, compress: bool) -> Iterator[bytes]:
+    """Encode records as NDJSON chunks of ``_EXPORT_FLUSH_LINES`` lines.
+
+    Compressed chunks end on a sync flush, so an interrupted download still inflates to
+    whole lines and the client can resume from the last cursor it decoded.
+    """
+
+    compressor = zlib.compressobj(wbits=31) if compress else None
+    lines: List[bytes] = []
+    for record in records:
+        lines.append(json.dumps(record, separators=(",", ":"), default=str).encode("utf-8") + b"\n")
+        if len(lines) >= _EXPORT_FLUSH_LINES:
+            chunk = b"".join(lines)
+            lines.clear()
+            yield chunk if compressor is None else compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+    chunk = b"".join(lines)
+    if compressor is None:
+        if chunk:
+            yield chunk
+        return
+    yield compressor.compress(chunk) + compressor.flush()
@@ -46,15 +46,25 @@ class Settings(BaseSettings):
 
     vector_backend: Literal["qdrant", "chroma", "memory"] = Field(default="qdrant")
     vector_dir: Path = Field(default=Path("storage/vector"))
+    vector_memory_persist: bool = Field(default=True)
     ingestion_chroma_dir: Path = Field(default=Path("storage/chroma"))
     chroma_collection: str = Field(default="cocounsel_documents")
     ingestion_llama_cache_dir: Path = Field(default=Path("storage/llama_cache"))
     forensics_dir: Path = Field(default=Path("storage/forensics"))
     forensics_chain_path: Path = Field(default=Path("storage/forensics_chain/ledger.jsonl"))
+    forensics_chain_checkpoint_interval: int = Field(default=1024)
+    # Dedicated HMAC key for ledger checkpoints, kept apart from ``secret_key`` so JWT key
+    # rotation does not invalidate them. Unset disables checkpoints; verify starts at genesis.
+    forensics_checkpoint_key: Optional[str] = Field(default=None, min_length=32)
     timeline_path: Path = Field(default=Path("storage/timeline.jsonl"))
     job_store_dir: Path = Field(default=Path("storage/jobs"))
     encryption_key: str = Field(default="a_very_secret_key_for_document_encryption_32_bytes_long", min_length=32) # Added
     document_storage_path: Path = Field(default=Path("storage/documents")) # Renamed from document_store_dir for clarity
+    keyword_index_dir: Path = Field(default=Path("storage/keyword_index"))
+    graph_memory_persist: bool = Field(default=False)
+    graph_memory_dir: Path = Field(default=Path("storage/graph"))
+    graph_journal_compact_events: int = Field(default=100_000, ge=1)
+    graph_export_page_size: int = Field(default=5_000, ge=1)
     ingestion_workspace_dir: Path = Field(default=Path("storage/workspaces"))
     agent_threads_dir: Path = Field(default=Path("storage/agent_threads"))
     agent_retry_attempts: int = Field(default=3, ge=1)
@@ -98,6 +108,7 @@ class Settings(BaseSettings):
     knowledge_catalog_path: Path = Field(default=Path("docs/knowledge/catalog.json"))
     knowledge_content_dir: Path = Field(default=Path("docs/knowledge/best_practices"))
     knowledge_progress_path: Path = Field(default=Path("storage/knowledge/progress.json"))
+    knowledge_index_dir: Path = Field(default=Path("storage/knowledge/index"))
 
     privilege_classifier_threshold: float = Field(default=0.68)
     privilege_policy_review_threshold: float = Field(default=0.68)
@@ -163,6 +174,10 @@ class Settings(BaseSettings):
     billing_support_overrides: Dict[str, str] = Field(default_factory=dict)
     billing_health_soft_threshold: float = Field(default=0.8)
     billing_health_hard_threshold: float = Field(default=0.95)
+    billing_write_behind: bool = Field(default=True)
+    billing_journal_flush_seconds: float = Field(default=1.0)
+    billing_snapshot_interval_seconds: float = Field(default=300.0)
+    billing_journal_compact_events: int = Field(default=10_000)
 
     voice_enabled: bool = Field(default=True)
     voice_sessions_dir: Path = Field(default=Path("storage/voice/sessions"))
@@ -206,6 +221,10 @@ class Settings(BaseSettings):
     ingestion_chunk_overlap: int = Field(default=60)
     ingestion_max_triplets_per_chunk: int = Field(default=12)
     ingestion_graph_batch_size: int = Field(default=64)
+    ingestion_embedding_batch_size: int = Field(default=64)
+    ingestion_embedding_cache_max_entries: int = Field(default=250_000)
+    ingestion_pipeline_window: int = Field(default=8)
+    ingestion_process_workers: int = Field(default=1)
     ingestion_hf_model: str = Field(default="sentence-transformers/all-MiniLM-L6-v2")
     ingestion_hf_dimensions: Optional[int] = Field(default=None)
     ingestion_hf_device: Optional[str] = Field(default=None)
@@ -222,6 +241,8 @@ class Settings(BaseSettings):
     ingestion_azure_openai_api_version: Optional[str] = Field(default="2024-05-01-preview")
     ingestion_tesseract_languages: str = Field(default="eng")
     ingestion_tesseract_path: Optional[Path] = Field(default=None)
+    ingestion_ocr_workers: int = Field(default=4)
+    ingestion_ocr_cache_max_entries: int = Field(default=100_000)
     ingestion_vision_endpoint: Optional[str] = Field(default=None)
     ingestion_vision_model: Optional[str] = Field(default=None)
     ingestion_vision_api_key: Optional[str] = Field(default=None)
@@ -253,7 +274,14 @@ class Settings(BaseSettings):
 
     retrieval_max_search_window: int = Field(default=60)
     retrieval_graph_hop_window: int = Field(default=12)
+    retrieval_graph_max_hops: int = Field(default=2, ge=1, le=4)
     retrieval_cross_encoder_model: Optional[str] = Field(default=None)
+    retrieval_warmup_on_startup: bool = Field(default=True)
+    retrieval_vector_timeout_seconds: Optional[float] = Field(default=2.0, gt=0.0)
+    retrieval_graph_timeout_seconds: Optional[float] = Field(default=2.0, gt=0.0)
+    retrieval_keyword_timeout_seconds: Optional[float] = Field(default=1.0, gt=0.0)
+    # Queries expected to retrieve at once; the shared retriever pool gets three threads each.
+    retrieval_concurrent_queries: int = Field(default=16, ge=1)
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -1,16 +1,23 @@
+from .config import get_settings
 from .services.agents import get_agents_service
 from .services.ingestion import (
     get_ingestion_worker,
     shutdown_ingestion_worker,
 )
+from .services.retrieval import reset_retrieval_service, warm_retrieval_service
+from .telemetry.billing import shutdown_billing_registry
 
 def register_events(app):
     @app.on_event("startup")
     def start_background_workers() -> None:
         get_ingestion_worker()
         get_agents_service()
+        if get_settings().retrieval_warmup_on_startup:
+            warm_retrieval_service()
 
 
     @app.on_event("shutdown")
     def stop_background_workers() -> None:
         shutdown_ingestion_worker(timeout=5.0)
+        reset_retrieval_service()
+        shutdown_billing_registry()
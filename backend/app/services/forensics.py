@@ -156,7 +156,11 @@ class ForensicsService:
         self.settings = get_settings()
         self.base_dir = self.settings.forensics_dir
         self.base_dir.mkdir(parents=True, exist_ok=True)
-        self.chain_ledger = ForensicsChainLedger(self.settings.forensics_chain_path)
+        self.chain_ledger = ForensicsChainLedger(
+            self.settings.forensics_chain_path,
+            signing_key=self.settings.forensics_checkpoint_key,
+            checkpoint_interval=self.settings.forensics_chain_checkpoint_interval,
+        )
 
     # region public API
     def build_document_artifact(
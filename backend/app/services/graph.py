@@ -2,8 +2,12 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+import gc
+from itertools import islice
+import logging
 import re
-from typing import Any, Dict, Iterable, List, Literal, Optional, Sequence, Set, Tuple
+from threading import Lock, RLock, Thread
+from typing import Any, Dict, Iterable, Iterator, List, Literal, Optional, Sequence, Set, Tuple
 
 try:  # pragma: no cover - optional dependency for runtime graph enrichment
     from neo4j import GraphDatabase
@@ -18,7 +22,9 @@ except ModuleNotFoundError:  # pragma: no cover - fallback for tests
     GraphDatabase = _StubGraphDatabase  # type: ignore[assignment]
 
 from ..config import get_settings
+from ..storage.graph_snapshot import GraphSnapshotStore
 from .errors import WorkflowAbort, WorkflowComponent, WorkflowError, WorkflowSeverity
+from .graph_cypher import MemoryGraphIndexes, plan_cypher
 
 try:  # Optional NetworkX support for analytics/community detection
     import networkx as nx  # type: ignore
@@ -55,6 +61,8 @@ except ImportError:  # pragma: no cover - optional dependency
     KnowledgeGraphIndex = None  # type: ignore
     _LlamaNeo4jPropertyGraphStore = None  # type: ignore
 
+_logger = logging.getLogger(__name__)
+
 
 @dataclass
 class _FallbackLabelledNode:
@@ -215,14 +223,145 @@ _EntityNodeFactory = (
     _LlamaEntityNode if _LlamaEntityNode is not None else _FallbackLabelledNode
 )
 _RelationFactory = _LlamaRelation if _LlamaRelation is not None else _FallbackRelation
-@dataclass
+
+_SEARCHABLE_ENTITY_TYPES = frozenset({"Entity", "Organization", "Person", "Location", "Event"})
+_ENTITY_FULLTEXT_INDEX = "entity_label_fulltext"
+# Upper bound on expansion depth; each extra hop multiplies the frontier by the mean degree.
+_MAX_EXPAND_HOPS = 4
+
+
+def _trigrams(text: str) -> Set[str]:
+    return {text[index : index + 3] for index in range(len(text) - 2)}
+
+
+_EXHAUSTED = object()
+
+
+def _round_robin(groups: Dict[str, List[Any]]) -> Iterator[Tuple[str, Any]]:
+    """Yield ``(key, item)`` taking one item from each group in turn until all are empty."""
+
+    iterators = [(key, iter(items)) for key, items in groups.items()]
+    while iterators:
+        remaining = []
+        for key, items in iterators:
+            item = next(items, _EXHAUSTED)
+            if item is _EXHAUSTED:
+                continue
+            remaining.append((key, items))
+            yield key, item
+        iterators = remaining
+
+
+def _node_labels_for(node_type: str) -> Tuple[str, ...]:
+    """Labels a memory-mode node answers to in Cypher.
+
+    Neo4j stores every entity under ``:Entity`` whatever its inferred type, so entity
+    types are indexed under ``Entity`` as well as their own type.
+    """
+
+    if node_type in _SEARCHABLE_ENTITY_TYPES and node_type != "Entity":
+        return (node_type, "Entity")
+    return (node_type,)
+
+
+def _entity_search_terms(properties: Dict[str, object]) -> Tuple[str, ...]:
+    """Return the lower-cased label followed by any aliases of an entity."""
+
+    terms: List[str] = [str(properties.get("label", "")).lower()]
+    aliases = properties.get("aliases")
+    if isinstance(aliases, str):
+        aliases = [aliases]
+    for alias in aliases or []:
+        value = str(alias).lower()
+        if value and value not in terms:
+            terms.append(value)
+    return tuple(terms)
+
+
+def _entity_match_rank(term: str, texts: Sequence[str]) -> Tuple[int, int, int] | None:
+    """Rank how well ``term`` matches an entity: exact, prefix, word start, then infix.
+
+    Label matches beat alias matches and shorter texts beat longer ones. ``None`` means
+    ``term`` is not a substring of any text.
+    """
+
+    best: Tuple[int, int, int] | None = None
+    for position, text in enumerate(texts):
+        offset = text.find(term)
+        if offset < 0:
+            continue
+        if text == term:
+            tier = 0
+        elif offset == 0:
+            tier = 1
+        elif not text[offset - 1].isalnum():
+            tier = 2
+        else:
+            tier = 3
+        rank = (tier, min(position, 1), len(text))
+        if best is None or rank < best:
+            best = rank
+    return best
+
+
+class _TrigramIndex:
+    """Character-trigram postings over entity search terms.
+
+    A query of three or more characters only visits ids present in every posting list of
+    its trigrams, intersected smallest first; shorter queries scan the indexed terms.
+    """
+
+    def __init__(self) -> None:
+        self._postings: Dict[str, Set[str]] = {}
+        self._terms: Dict[str, Tuple[str, ...]] = {}
+
+    def __len__(self) -> int:
+        return len(self._terms)
+
+    def terms(self, key: str) -> Tuple[str, ...]:
+        return self._terms.get(key, ())
+
+    def add(self, key: str, terms: Tuple[str, ...]) -> None:
+        if self._terms.get(key) == terms:
+            return
+        self.remove(key)
+        self._terms[key] = terms
+        for gram in set().union(*(_trigrams(text) for text in terms)):
+            self._postings.setdefault(gram, set()).add(key)
+
+    def remove(self, key: str) -> None:
+        terms = self._terms.pop(key, None)
+        if terms is None:
+            return
+        for gram in set().union(*(_trigrams(text) for text in terms)):
+            postings = self._postings.get(gram)
+            if postings is None:
+                continue
+            postings.discard(key)
+            if not postings:
+                del self._postings[gram]
+
+    def candidates(self, term: str) -> Iterable[str]:
+        grams = _trigrams(term)
+        if not grams:
+            return list(self._terms)
+        postings = sorted((self._postings.get(gram, set()) for gram in grams), key=len)
+        result = set(postings[0])
+        for posting in postings[1:]:
+            if not result:
+                break
+            result &= posting
+        return result
+
+
+@dataclass(slots=True)
 class GraphNode:
     id: str
     type: str
     properties: Dict[str, object]
 
 
-@dataclass
+@dataclass(slots=True)
 class GraphEdge:
     source: str
     target: str
@@ -274,6 +413,10 @@ class GraphCommunitySummary:
 class GraphSubgraph:
     nodes: Dict[str, GraphNode] = field(default_factory=dict)
     edges: Dict[Tuple[str, str, str, str | None], GraphEdge] = field(default_factory=dict)
+    # Per node: hop distance from the nearest seed and the best product of edge weights
+    # along a path of that length. Seeds have ``hops == 0`` and ``weights == 1.0``.
+    hops: Dict[str, int] = field(default_factory=dict)
+    weights: Dict[str, float] = field(default_factory=dict)
 
     def to_payload(self) -> Dict[str, List[Dict[str, object]]]:
         return {
@@ -302,6 +445,32 @@ class GraphSubgraph:
         return documents
 
 
+def _parse_export_cursor(after: str | None) -> Tuple[str, int]:
+    """Split an export cursor into its section and the last position already sent."""
+
+    if not after:
+        return "nodes", -1
+    section, _, raw_position = after.partition(":")
+    if section not in {"nodes", "edges"} or not raw_position.lstrip("-").isdigit():
+        raise ValueError(f"Invalid graph export cursor '{after}'")
+    return section, int(raw_position)
+
+
+def _export_node(cursor: str, node: GraphNode) -> Dict[str, object]:
+    return {"cursor": cursor, "kind": "node", "id": node.id, "type": node.type, "properties": dict(node.properties)}
+
+
+def _export_edge(cursor: str, edge: GraphEdge) -> Dict[str, object]:
+    return {
+        "cursor": cursor,
+        "kind": "edge",
+        "source": edge.source,
+        "target": edge.target,
+        "type": edge.type,
+        "properties": dict(edge.properties),
+    }
+
+
 @dataclass(slots=True)
 class GraphExecutionResult:
     question: str
@@ -466,6 +635,16 @@ class GraphStrategyBrief:
         }
 
 
+@dataclass(slots=True)
+class _GraphRankings:
+    """Node rankings computed for one ``GraphService._graph_version``."""
+
+    version: int
+    generated_at: str
+    focus: List[Tuple[str, int]]
+    leverage: List[Tuple[str, float]]
+
+
 class GraphService:
     def __init__(self) -> None:
         self.settings = get_settings()
@@ -483,6 +662,50 @@ class GraphService:
         self._community_cache: GraphCommunitySummary | None = None
         self._strategy_cache: GraphStrategyBrief | None = None
         self._nx_graph = nx.DiGraph() if nx is not None else None
+        # Incremental community assignment served to retrieval. Structural mutations bump
+        # ``_graph_version`` and mark their nodes dirty; a refresh recomputes only the
+        # connected components containing dirty nodes. ``_community_lock`` guards the
+        # mirrors a background refresh reads (``_nx_graph`` and ``_edge_cache``).
+        self._community_lock = Lock()
+        self._community_refresh_lock = Lock()
+        self._graph_version = 0
+        self._community_version: int | None = None
+        self._community_dirty: Set[str] = set()
+        self._community_assignment: Dict[str, str] = {}
+        self._community_members: Dict[str, Set[str]] = {}
+        self._community_payloads: Dict[str, GraphCommunity] = {}
+        self._community_algorithm = "greedy_modularity" if nx is not None else "connected_components"
+        self._community_generated_at: str | None = None
+        self._community_sequence = 0
+        self._community_thread: Thread | None = None
+        # Focus and leverage rankings for strategy briefs, recomputed off the request path
+        # whenever ``_graph_version`` moves on. ``_edge_degree`` counts ``_edge_cache``
+        # entries per endpoint and is maintained as edges are recorded.
+        self._edge_degree: Dict[str, int] = {}
+        # ``_edge_cache`` keys incident to each node, mapped to their ``_edge_order``
+        # position. Maintained under ``_community_lock`` so a refresh can gather the edges
+        # of the touched components without scanning the whole cache.
+        self._edge_incident: Dict[str, Dict[Tuple[str, str, str, str | None], int]] = {}
+        # Node ids per type, the label index the in-memory Cypher planner scans.
+        self._node_labels: Dict[str, Dict[str, None]] = {}
+        # Append-only insertion order of ``_node_cache``/``_edge_cache``. The graph never
+        # deletes, so a position is a stable cursor for resumable exports.
+        self._node_order: List[str] = []
+        self._edge_order: List[Tuple[str, str, str, str | None]] = []
+        self._rankings: _GraphRankings | None = None
+        self._rankings_refresh_lock = Lock()
+        self._rankings_thread: Thread | None = None
+        # After a snapshot reload the networkx and LlamaIndex property-graph mirrors are
+        # rebuilt on first use rather than eagerly, since each duplicates the whole graph.
+        self._property_graph_hydrated = True
+        self._nx_hydrated = True
+        self._snapshot_store: GraphSnapshotStore | None = None
+        self._replaying_snapshot = False
+        # Held across each memory-mode upsert (store write, journal append and cache update)
+        # so a snapshot captures whole upserts; ``_snapshot_lock`` serialises compactions.
+        self._write_lock = RLock()
+        self._snapshot_lock = Lock()
+        self._compaction_thread: Thread | None = None
         if self.mode == "neo4j":
             try:
                 self.driver = GraphDatabase.driver(
@@ -491,14 +714,26 @@ class GraphService:
                 )
             except ModuleNotFoundError:
                 self.mode = "memory"
-                self._nodes = {}
-                self._edges = {}
             else:
                 self._ensure_constraints()
                 self._seed_ontology()
         if self.mode == "memory":
             self._nodes: Dict[str, GraphNode] = {}
             self._edges: Dict[Tuple[str, str, str, str | None], GraphEdge] = {}
+            # Adjacency indexes over ``_edges`` keys. Inner dicts are used as ordered
+            # sets; ``_edge_sequence`` preserves global insertion order for callers
+            # that previously iterated ``_edges`` directly.
+            self._out_edges: Dict[str, Dict[Tuple[str, str, str, str | None], None]] = {}
+            self._in_edges: Dict[str, Dict[Tuple[str, str, str, str | None], None]] = {}
+            self._doc_edges: Dict[str, Dict[Tuple[str, str, str, str | None], None]] = {}
+            self._edge_sequence: Dict[Tuple[str, str, str, str | None], int] = {}
+            self._entity_text_index = _TrigramIndex()
+            if self.settings.graph_memory_persist:
+                self._snapshot_store = GraphSnapshotStore(
+                    self.settings.graph_memory_dir,
+                    compact_every=self.settings.graph_journal_compact_events,
+                )
+                self._load_memory_snapshot()
             self._seed_ontology()
         if KnowledgeGraphIndex is not None and StorageContext is not None:
             try:
@@ -511,6 +746,10 @@ class GraphService:
         def run(tx) -> None:
             tx.run("CREATE CONSTRAINT document_id IF NOT EXISTS FOR (d:Document) REQUIRE d.id IS UNIQUE")
             tx.run("CREATE CONSTRAINT entity_id IF NOT EXISTS FOR (e:Entity) REQUIRE e.id IS UNIQUE")
+            tx.run(
+                f"CREATE FULLTEXT INDEX {_ENTITY_FULLTEXT_INDEX} IF NOT EXISTS "
+                "FOR (e:Entity) ON EACH [e.label, e.aliases]"
+            )
         with self.driver.session() as session:
             session.execute_write(run)
 
@@ -559,7 +798,8 @@ class GraphService:
             )
             if self.mode == "memory":
                 key = (root_id, "ONTOLOGY_CHILD", child_id, None)
-                self._edges.setdefault(key, relation)
+                if key not in self._edges:
+                    self._store_memory_edge(key, relation)
             self._record_edge(relation)
 
     # region Upserts
@@ -571,9 +811,12 @@ class GraphService:
             )
             with self.driver.session() as session:
                 session.execute_write(lambda tx: tx.run(query, id=doc_id, title=title, metadata=metadata))
-        else:
-            self._nodes[doc_id] = GraphNode(id=doc_id, type="Document", properties={"title": title, **metadata})
-        self._register_node(doc_id, "Document", {"title": title, **metadata})
+        with self._write_lock:
+            if self.mode == "memory":
+                self._store_memory_node(
+                    GraphNode(id=doc_id, type="Document", properties={"title": title, **metadata})
+                )
+            self._register_node(doc_id, "Document", {"title": title, **metadata})
 
     def upsert_entity(self, entity_id: str, entity_type: str, properties: Dict[str, object]) -> None:
         if self.mode == "neo4j":
@@ -585,9 +828,7 @@ class GraphService:
                 session.execute_write(
                     lambda tx: tx.run(query, id=entity_id, type=entity_type, properties=properties)
                 )
-        else:
-            self._nodes[entity_id] = GraphNode(id=entity_id, type=entity_type, properties=properties)
-        self._register_node(entity_id, entity_type, properties)
+        self._apply_entity(entity_id, entity_type, properties)
 
     def merge_relation(
         self,
@@ -611,6 +852,85 @@ class GraphService:
                         properties=properties,
                     )
                 )
+        self._apply_relation(source_id, relation_type, target_id, properties)
+
+    def write_batch(
+        self,
+        entities: Sequence[Tuple[str, str, Dict[str, object]]],
+        relations: Sequence[Tuple[str, str, str, Dict[str, object]]],
+    ) -> None:
+        """Upsert ``entities`` then merge ``relations`` as a single unit of work.
+
+        In Neo4j mode the batch runs in one write transaction: one ``UNWIND`` merge for the
+        entities and one per relation type, since relationship types cannot be parameterised.
+        """
+
+        if not entities and not relations:
+            return
+        if self.mode == "neo4j":
+            entity_rows = [
+                {"id": entity_id, "type": entity_type, "properties": properties}
+                for entity_id, entity_type, properties in entities
+            ]
+            relation_rows: Dict[str, List[Dict[str, object]]] = {}
+            for source_id, relation_type, target_id, properties in relations:
+                relation_rows.setdefault(relation_type, []).append(
+                    {"source_id": source_id, "target_id": target_id, "properties": properties}
+                )
+
+            def run(tx) -> None:
+                if entity_rows:
+                    tx.run(
+                        "UNWIND $rows AS row "
+                        "MERGE (e:Entity {id: row.id}) "
+                        "SET e.type = row.type, e += row.properties",
+                        rows=entity_rows,
+                    )
+                for relation_type, rows in relation_rows.items():
+                    tx.run(
+                        "UNWIND $rows AS row "
+                        "MATCH (s {id: row.source_id}), (t {id: row.target_id}) "
+                        f"MERGE (s)-[r:{relation_type}]->(t) "
+                        "SET r += row.properties",
+                        rows=rows,
+                    )
+
+            with self.driver.session() as session:
+                session.execute_write(run)
+        for entity_id, entity_type, properties in entities:
+            self._apply_entity(entity_id, entity_type, properties)
+        for source_id, relation_type, target_id, properties in relations:
+            self._apply_relation(source_id, relation_type, target_id, properties)
+
+    def batch_writer(self, batch_size: int | None = None) -> "GraphBatchWriter":
+        """Return a writer that buffers upserts and flushes them via :meth:`write_batch`."""
+
+        size = batch_size if batch_size is not None else self.settings.ingestion_graph_batch_size
+        return GraphBatchWriter(self, size)
+
+    def _apply_entity(self, entity_id: str, entity_type: str, properties: Dict[str, object]) -> None:
+        with self._write_lock:
+            if self.mode == "memory":
+                self._store_memory_node(GraphNode(id=entity_id, type=entity_type, properties=properties))
+            self._register_node(entity_id, entity_type, properties)
+
+    def _apply_relation(
+        self,
+        source_id: str,
+        relation_type: str,
+        target_id: str,
+        properties: Dict[str, object],
+    ) -> None:
+        with self._write_lock:
+            self._apply_relation_locked(source_id, relation_type, target_id, properties)
+
+    def _apply_relation_locked(
+        self,
+        source_id: str,
+        relation_type: str,
+        target_id: str,
+        properties: Dict[str, object],
+    ) -> None:
         key = self._edge_key(source_id, relation_type, target_id, properties)
         if self.mode == "memory":
             existing = self._edges.get(key)
@@ -629,7 +949,7 @@ class GraphService:
                     type=relation_type,
                     properties=properties,
                 )
-            self._edges[key] = edge
+            self._store_memory_edge(key, edge)
         else:
             existing = self._edge_cache.get(key)
             if existing:
@@ -701,57 +1021,165 @@ class GraphService:
         if node_id not in self._nodes:
             raise KeyError(node_id)
         neighbor_nodes = {node_id: self._nodes[node_id]}
-        edges = [
-            edge
-            for edge in self._edges.values()
-            if edge.source == node_id or edge.target == node_id
-        ]
+        edges = [self._edges[key] for key in self._incident_edge_keys(node_id)]
         for edge in edges:
             neighbor_nodes.setdefault(edge.source, self._nodes.get(edge.source, GraphNode(edge.source, "Unknown", {})))
             neighbor_nodes.setdefault(edge.target, self._nodes.get(edge.target, GraphNode(edge.target, "Unknown", {})))
-            self._record_edge(edge)
         return list(neighbor_nodes.values()), edges
 
     def subgraph(self, node_ids: Iterable[str]) -> GraphSubgraph:
-        unique_ids = list(dict.fromkeys(node_ids))
-        if not unique_ids:
+        return self.expand(node_ids, max_hops=1)
+
+    def expand(
+        self,
+        seed_ids: Iterable[str],
+        *,
+        max_hops: int = 1,
+        edge_limit: int | None = None,
+    ) -> GraphSubgraph:
+        """Expand every seed up to ``max_hops`` in one breadth-first traversal.
+
+        Each depth takes one incident edge per frontier node in turn, so ``edge_limit`` keeps
+        the closest relations without letting one hub entity use the whole budget. Depth is
+        capped at ``_MAX_EXPAND_HOPS``. In Neo4j mode the levels run in one read transaction.
+        """
+
+        seeds = list(dict.fromkeys(seed_ids))
+        max_hops = min(int(max_hops), _MAX_EXPAND_HOPS)
+        if not seeds or max_hops < 1:
             return GraphSubgraph()
-        aggregated_nodes: Dict[str, GraphNode] = {}
-        aggregated_edges: Dict[Tuple[str, str, str, str | None], GraphEdge] = {}
-        for node_id in unique_ids:
-            try:
-                node_list, edge_list = self.neighbors(node_id)
-            except KeyError:
-                continue
-            for node in node_list:
-                aggregated_nodes[node.id] = node
-            for edge in edge_list:
-                key = self._edge_key(edge.source, edge.type, edge.target, edge.properties)
-                existing = aggregated_edges.get(key)
-                if existing is None:
-                    aggregated_edges[key] = edge
-                else:
-                    merged = self._merge_properties(existing.properties, edge.properties)
-                    aggregated_edges[key] = GraphEdge(
-                        source=edge.source,
-                        target=edge.target,
-                        type=edge.type,
-                        properties=merged,
+        if self.mode == "neo4j":
+            return self._expand_neo4j(seeds, max_hops, edge_limit)
+        expansion = GraphSubgraph()
+        frontier: List[str] = []
+        for seed in seeds:
+            if seed in self._nodes:
+                expansion.nodes[seed] = self._nodes[seed]
+                expansion.hops[seed] = 0
+                expansion.weights[seed] = 1.0
+                frontier.append(seed)
+        for depth in range(1, max_hops + 1):
+            next_frontier: List[str] = []
+            incident = {node_id: self._incident_edge_keys(node_id) for node_id in frontier}
+            for node_id, key in _round_robin(incident):
+                if key in expansion.edges:
+                    continue
+                edge = self._edges[key]
+                other = edge.target if edge.source == node_id else edge.source
+                other_node = self._nodes.get(other, GraphNode(other, "Unknown", {}))
+                if self._expansion_step(expansion, key, edge, node_id, other_node, depth):
+                    next_frontier.append(other)
+                if edge_limit is not None and len(expansion.edges) >= edge_limit:
+                    return expansion
+            if not next_frontier:
+                break
+            frontier = next_frontier
+        return expansion
+
+    def _expansion_step(
+        self,
+        expansion: GraphSubgraph,
+        key: Tuple[str, str, str, str | None],
+        edge: GraphEdge,
+        node_id: str,
+        other: GraphNode,
+        depth: int,
+    ) -> bool:
+        """Record ``edge`` reached from ``node_id``; return whether ``other`` is newly found."""
+
+        expansion.edges[key] = edge
+        weight = expansion.weights[node_id] * self._edge_weight(edge)
+        if other.id not in expansion.hops:
+            expansion.nodes[other.id] = other
+            expansion.hops[other.id] = depth
+            expansion.weights[other.id] = weight
+            return True
+        if expansion.hops[other.id] == depth and weight > expansion.weights[other.id]:
+            expansion.weights[other.id] = weight
+        return False
+
+    def _expand_neo4j(self, seeds: List[str], max_hops: int, edge_limit: int | None) -> GraphSubgraph:
+        seed_query = "MATCH (seed) WHERE seed.id IN $seed_ids RETURN seed"
+        # One query per level keeps shortest-hop semantics without enumerating whole paths;
+        # the per-node LIMIT bounds what a hub can return to the remaining edge budget.
+        hop_query = (
+            "MATCH (n) WHERE n.id IN $frontier "
+            "CALL { WITH n MATCH (n)-[r]-(m) RETURN r, m"
+            + (" LIMIT $per_node" if edge_limit is not None else "")
+            + " } RETURN n.id AS node_id, r, m"
+        )
+
+        def traverse(tx: Any) -> GraphSubgraph:
+            expansion = GraphSubgraph()
+            for record in tx.run(seed_query, seed_ids=seeds):
+                seed = self._node_from_neo4j(record["seed"])
+                expansion.nodes[seed.id] = seed
+                expansion.hops[seed.id] = 0
+                expansion.weights[seed.id] = 1.0
+            frontier = [seed for seed in seeds if seed in expansion.hops]
+            for depth in range(1, max_hops + 1):
+                if not frontier:
+                    break
+                per_node = None if edge_limit is None else edge_limit - len(expansion.edges)
+                incident: Dict[str, List[Any]] = {node_id: [] for node_id in frontier}
+                for record in tx.run(hop_query, frontier=frontier, per_node=per_node):
+                    incident.setdefault(record["node_id"], []).append((record["r"], record["m"]))
+                next_frontier: List[str] = []
+                for node_id, (rel, raw) in _round_robin(incident):
+                    edge = GraphEdge(
+                        source=rel.start_node["id"],
+                        target=rel.end_node["id"],
+                        type=rel.type,
+                        properties=dict(rel),
                     )
-        return GraphSubgraph(nodes=aggregated_nodes, edges=aggregated_edges)
+                    key = self._edge_key(edge.source, edge.type, edge.target, edge.properties)
+                    if key in expansion.edges:
+                        continue
+                    self._record_edge(edge)
+                    other = self._node_from_neo4j(raw)
+                    if self._expansion_step(expansion, key, edge, node_id, other, depth):
+                        next_frontier.append(other.id)
+                    if edge_limit is not None and len(expansion.edges) >= edge_limit:
+                        return expansion
+                frontier = next_frontier
+            return expansion
+
+        with self.driver.session() as session:
+            return session.execute_read(traverse)
+
+    def _node_from_neo4j(self, raw: Any) -> GraphNode:
+        node = GraphNode(
+            id=raw["id"],
+            type=next(iter(raw.labels)) if raw.labels else "Unknown",
+            properties=dict(raw),
+        )
+        self._register_node(node.id, node.type, node.properties)
+        return node
+
+    def _edge_weight(self, edge: GraphEdge) -> float:
+        weight = self._coerce_float(edge.properties.get("weight"))
+        if weight is None:
+            return 1.0
+        return min(max(weight, 0.0), 1.0)
 
     def search_entities(self, query: str, limit: int = 5) -> List[GraphNode]:
+        """Return entities whose label or an alias contains ``query``, best matches first."""
+
         if not query:
             return []
         term = query.lower()
         if self.mode == "neo4j":
+            tokens = re.findall(r"\w+", term)
+            if not tokens:
+                return []
             stmt = (
-                "MATCH (e:Entity) WHERE toLower(e.label) CONTAINS $term "
-                "RETURN e LIMIT $limit"
+                "CALL db.index.fulltext.queryNodes($index, $search) YIELD node, score "
+                "RETURN node AS e, score ORDER BY score DESC LIMIT $limit"
             )
+            search = " AND ".join(f"{token}*" for token in tokens)
             with self.driver.session() as session:
                 result = session.execute_read(
-                    lambda tx: list(tx.run(stmt, term=term, limit=limit))
+                    lambda tx: list(tx.run(stmt, index=_ENTITY_FULLTEXT_INDEX, search=search, limit=limit))
                 )
             nodes: List[GraphNode] = []
             for record in result:
@@ -764,15 +1192,13 @@ class GraphService:
                     )
                 )
             return nodes
-        matches: List[GraphNode] = []
-        for node in self._nodes.values():
-            if node.type not in {"Entity", "Organization", "Person", "Location", "Event"}:
-                continue
-            label = str(node.properties.get("label", "")).lower()
-            if term in label:
-                matches.append(node)
-        matches.sort(key=lambda node: node.properties.get("label", ""))
-        return matches[:limit]
+        ranked: List[Tuple[Tuple[int, int, int], str, str]] = []
+        for node_id in self._entity_text_index.candidates(term):
+            rank = _entity_match_rank(term, self._entity_text_index.terms(node_id))
+            if rank is not None:
+                ranked.append((rank, self._entity_text_index.terms(node_id)[0], node_id))
+        ranked.sort()
+        return [self._nodes[node_id] for _, _, node_id in ranked[:limit]]
 
     def document_entities(self, doc_ids: Iterable[str]) -> Dict[str, List[GraphNode]]:
         ids = list(dict.fromkeys(doc_ids))
@@ -798,18 +1224,116 @@ class GraphService:
                 mapping.setdefault(record["doc_id"], []).append(graph_node)
             return mapping
 
-        for edge in self._edges.values():
-            if edge.type != "MENTIONS":
-                continue
-            if edge.source not in mapping:
-                continue
-            node = self._nodes.get(edge.target)
-            if node is None:
-                continue
-            mapping[edge.source].append(node)
+        for doc_id in ids:
+            for key in self._out_edges.get(doc_id, {}):
+                if key[1] != "MENTIONS":
+                    continue
+                node = self._nodes.get(key[2])
+                if node is None:
+                    continue
+                mapping[doc_id].append(node)
         return mapping
 
+    def document_edges(self, doc_id: str) -> List[GraphEdge]:
+        """Return edges whose ``doc_id`` property names ``doc_id``."""
+
+        if self.mode != "memory":
+            return [edge for key, edge in self._edge_cache.items() if key[3] == doc_id]
+        keys = sorted(self._doc_edges.get(doc_id, {}), key=self._edge_sequence.__getitem__)
+        return [self._edges[key] for key in keys]
+
+    def iter_export(self, *, after: str | None = None) -> Iterator[Dict[str, object]]:
+        """Iterate every node and then every edge as export records, one at a time.
+
+        Each record carries a ``cursor`` such as ``"edges:41"``; passing the last cursor a
+        client received as ``after`` resumes the export with the record that follows it.
+        In memory mode cursors are positions in the append-only insertion order. In Neo4j
+        mode they are internal ids, read in ``graph_export_page_size`` pages.
+        """
+
+        section, position = _parse_export_cursor(after)
+        if self.mode == "neo4j":
+            return self._iter_export_neo4j(section, position)
+        return self._iter_export_memory(section, position)
+
+    def iter_subgraph_export(
+        self, seed_ids: Iterable[str], *, max_hops: int = 1, after: str | None = None
+    ) -> Iterator[Dict[str, object]]:
+        """Stream :meth:`expand` as export records with positional, resumable cursors."""
+
+        section, position = _parse_export_cursor(after)
+        return self._iter_subgraph_export(self.expand(seed_ids, max_hops=max_hops), section, position)
+
+    def _iter_export_memory(self, section: str, position: int) -> Iterator[Dict[str, object]]:
+        if section == "nodes":
+            # Bound each section by its length up front so concurrent writers cannot keep
+            # an export running forever; they are picked up by the next export.
+            for index in range(position + 1, len(self._node_order)):
+                node = self._node_cache[self._node_order[index]]
+                yield _export_node(f"nodes:{index}", node)
+            position = -1
+        for index in range(position + 1, len(self._edge_order)):
+            edge = self._edge_cache[self._edge_order[index]]
+            yield _export_edge(f"edges:{index}", edge)
+
+    @staticmethod
+    def _iter_subgraph_export(
+        expansion: GraphSubgraph, section: str, position: int
+    ) -> Iterator[Dict[str, object]]:
+        if section == "nodes":
+            nodes = islice(expansion.nodes.values(), position + 1, None)
+            for index, node in enumerate(nodes, start=position + 1):
+                record = _export_node(f"nodes:{index}", node)
+                record["hops"] = expansion.hops.get(node.id)
+                yield record
+            position = -1
+        edges = islice(expansion.edges.values(), position + 1, None)
+        for index, edge in enumerate(edges, start=position + 1):
+            yield _export_edge(f"edges:{index}", edge)
+
+    def _iter_export_neo4j(self, section: str, position: int) -> Iterator[Dict[str, object]]:
+        page_size = self.settings.graph_export_page_size
+        queries = {
+            "nodes": (
+                "MATCH (n) WHERE id(n) > $after RETURN id(n) AS seq, n ORDER BY seq LIMIT $limit"
+            ),
+            "edges": (
+                "MATCH (a)-[r]->(b) WHERE id(r) > $after "
+                "RETURN id(r) AS seq, a.id AS source, b.id AS target, type(r) AS type, "
+                "properties(r) AS properties ORDER BY seq LIMIT $limit"
+            ),
+        }
+        sections = ["nodes", "edges"] if section == "nodes" else ["edges"]
+        for name in sections:
+            while True:
+                with self.driver.session() as session:
+                    page = session.execute_read(
+                        lambda tx: list(tx.run(queries[name], after=position, limit=page_size))
+                    )
+                for record in page:
+                    position = int(record["seq"])
+                    if name == "nodes":
+                        raw = record["n"]
+                        node = GraphNode(
+                            id=raw["id"],
+                            type=next(iter(raw.labels)) if raw.labels else "Unknown",
+                            properties=dict(raw),
+                        )
+                        yield _export_node(f"nodes:{position}", node)
+                    else:
+                        edge = GraphEdge(
+                            source=record["source"],
+                            target=record["target"],
+                            type=record["type"],
+                            properties=dict(record["properties"] or {}),
+                        )
+                        yield _export_edge(f"edges:{position}", edge)
+                if len(page) < page_size:
+                    break
+            position = -1
+
     def get_property_graph_store(self) -> Any:
+        self._hydrate_property_graph()
         return self._property_graph
 
     def ensure_knowledge_index(self, nodes: Sequence[Any] | None = None) -> Any:
@@ -832,14 +1356,158 @@ class GraphService:
         return self._knowledge_index
 
     def get_knowledge_index(self) -> Any:
+        self._hydrate_property_graph()
         return self.ensure_knowledge_index()
 
+    def snapshot_memory_graph(self) -> bool:
+        """Write the memory-mode graph to its binary snapshot and drop the journal it covers.
+
+        Writers are only held off while the records are captured and the journal is set
+        aside; encoding and writing the snapshot happen outside the write lock.
+        """
+
+        if self._snapshot_store is None:
+            return False
+        with self._snapshot_lock:
+            with self._write_lock, self._community_lock:
+                nodes = [(node.id, node.type, node.properties) for node in self._nodes.values()]
+                node_cache = self._node_cache
+                cached = [
+                    (node.id, node.type, node.properties) for node in map(node_cache.__getitem__, self._node_order)
+                ]
+                edges = [(edge.source, edge.type, edge.target, edge.properties) for edge in self._edges.values()]
+                self._snapshot_store.rotate_journal()
+            self._snapshot_store.write(nodes, cached, edges)
+        return True
+
+    def close(self) -> None:
+        thread = self._compaction_thread
+        if thread is not None:
+            thread.join()
+        if self._snapshot_store is not None:
+            self._snapshot_store.close()
+
+    def _load_memory_snapshot(self) -> None:
+        assert self._snapshot_store is not None
+        # Reloading allocates millions of acyclic containers; pausing the cyclic collector
+        # avoids repeated full-heap scans that would otherwise dominate the load time.
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        self._replaying_snapshot = True
+        # The networkx and property-graph mirrors are rebuilt on first use instead.
+        self._nx_hydrated = False
+        self._property_graph_hydrated = False
+        try:
+            try:
+                nodes, cached, edges = self._snapshot_store.load()
+            except (OSError, ValueError):
+                _logger.exception("Graph snapshot could not be read; starting from the journal only")
+                nodes, cached, edges = [], [], []
+            for node_id, node_type, properties in nodes:
+                self._store_memory_node(GraphNode(node_id, node_type, properties))
+            self._bulk_store_memory_edges(edges)
+            self._load_memory_caches(cached)
+            # Journal entries go through the same store and cache updates as the upserts
+            # that wrote them, so merged properties and insertion order come back intact.
+            for entry in self._snapshot_store.replay():
+                properties = dict(entry.get("properties") or {})
+                if entry.get("op") == "node":
+                    node = GraphNode(str(entry["id"]), str(entry["type"]), properties)
+                    self._store_memory_node(node)
+                    self._register_node(node.id, node.type, properties)
+                elif entry.get("op") == "edge":
+                    source, relation_type, target = str(entry["source"]), str(entry["type"]), str(entry["target"])
+                    edge = GraphEdge(source, target, relation_type, properties)
+                    self._store_memory_edge(self._edge_key(source, relation_type, target, properties), edge)
+                    self._register_node(source, "Unknown", {})
+                    self._register_node(target, "Unknown", {})
+                    self._record_edge(edge)
+        finally:
+            self._replaying_snapshot = False
+            if gc_was_enabled:
+                gc.enable()
+        if not self._node_cache and not self._edge_cache:
+            self._nx_hydrated = True
+            self._property_graph_hydrated = True
+
+    def _load_memory_caches(self, cached: Sequence[Tuple[str, str, Dict[str, object]]]) -> None:
+        """Rebuild the node and edge caches from a snapshot's cached nodes and stored edges."""
+
+        if not cached and not self._edges:
+            return
+        # Cache entries share node and edge objects with the memory store where they are
+        # equal, instead of holding per-structure copies as the incremental upsert path does.
+        stored = self._nodes
+        with self._community_lock:
+            node_cache = self._node_cache
+            for node_id, node_type, properties in cached:
+                node = stored.get(node_id)
+                if node is None or node.type != node_type or node.properties != properties:
+                    node = GraphNode(node_id, node_type, properties)
+                node_cache[node_id] = node
+            self._edge_cache.update(self._edges)
+            edge_degree = self._edge_degree
+            for source, _, target, _ in self._edges:
+                if source not in node_cache:
+                    node_cache[source] = GraphNode(source, "Unknown", {})
+                if target not in node_cache:
+                    node_cache[target] = GraphNode(target, "Unknown", {})
+                edge_degree[source] = edge_degree.get(source, 0) + 1
+                edge_degree[target] = edge_degree.get(target, 0) + 1
+            node_labels = self._node_labels
+            for node in node_cache.values():
+                for label in _node_labels_for(node.type):
+                    node_labels.setdefault(label, {})[node.id] = None
+            self._node_order = list(node_cache)
+            self._edge_order = list(self._edge_cache)
+            edge_incident = self._edge_incident
+            for position, key in enumerate(self._edge_order):
+                edge_incident.setdefault(key[0], {})[key] = position
+                edge_incident.setdefault(key[2], {})[key] = position
+            self._mark_community_dirty(*node_cache)
+
+    def _networkx_graph(self) -> Any:
+        """Return the networkx mirror, building it first if a snapshot reload deferred it."""
+
+        if self._nx_graph is None or self._nx_hydrated:
+            return self._nx_graph
+        with self._community_lock:
+            if not self._nx_hydrated:
+                self._nx_graph.add_nodes_from(
+                    (node.id, {"type": node.type, "properties": node.properties})
+                    for node in self._node_cache.values()
+                )
+                self._nx_graph.add_edges_from(
+                    (edge.source, edge.target, {"type": edge.type, "properties": edge.properties})
+                    for edge in self._edge_cache.values()
+                )
+                self._nx_hydrated = True
+        return self._nx_graph
+
+    def _hydrate_property_graph(self) -> None:
+        if self._property_graph_hydrated:
+            return
+        self._property_graph_hydrated = True
+        if self._property_graph is None:
+            return
+        try:
+            self._property_graph.upsert_nodes(
+                [self._create_property_node(node) for node in self._node_cache.values()]
+            )
+            self._property_graph.upsert_relations(
+                [self._create_property_relation(edge) for edge in self._edge_cache.values()]
+            )
+        except Exception:  # pragma: no cover - defensive fallback
+            pass
+
     def compute_community_summary(
         self, focus_nodes: Iterable[str] | None = None
     ) -> GraphCommunitySummary:
         focus_set = set(focus_nodes or [])
+        self._networkx_graph()
         if self._nx_graph is not None and self._nx_graph.number_of_nodes() > 0:
-            graph = self._nx_graph.copy()
+            with self._community_lock:
+                graph = self._nx_graph.copy()
             if focus_set:
                 relevant = {node for node in focus_set if node in graph}
                 if relevant:
@@ -924,13 +1592,313 @@ class GraphService:
         return self._community_cache
 
     def communities_for_nodes(self, node_ids: Iterable[str]) -> List[GraphCommunity]:
-        summary = self._community_cache or self.compute_community_summary()
-        focus = set(node_ids)
-        return [
-            community
-            for community in summary.communities
-            if focus & {node["id"] for node in community.nodes}
-        ]
+        """Return communities containing ``node_ids`` from the last completed assignment.
+
+        Only the first call computes synchronously; afterwards a stale assignment is served
+        as-is while a background refresh catches up (see :meth:`community_status`).
+        """
+
+        if self._community_version is None:
+            self.refresh_communities()
+        elif self._community_dirty:
+            self.schedule_community_refresh()
+        with self._community_lock:
+            seen: Set[str] = set()
+            matches: List[GraphCommunity] = []
+            for node_id in node_ids:
+                community_id = self._community_assignment.get(node_id)
+                if community_id is None or community_id in seen:
+                    continue
+                seen.add(community_id)
+                payload = self._community_payloads.get(community_id)
+                if payload is not None:
+                    matches.append(payload)
+        return matches
+
+    def community_status(self) -> Dict[str, object]:
+        """Describe how far the served community assignment lags behind the graph."""
+
+        with self._community_lock:
+            computed = self._community_version
+            return {
+                "algorithm": self._community_algorithm,
+                "generated_at": self._community_generated_at,
+                "graph_version": self._graph_version,
+                "community_version": computed,
+                "stale": computed is None or computed < self._graph_version,
+                "pending_nodes": len(self._community_dirty),
+                "refreshing": self._community_thread is not None and self._community_thread.is_alive(),
+                "communities": len(self._community_members),
+            }
+
+    def schedule_community_refresh(self) -> bool:
+        """Start a background refresh unless one is already running or nothing changed."""
+
+        with self._community_lock:
+            if not self._community_dirty and self._community_version is not None:
+                return False
+            if self._community_thread is not None and self._community_thread.is_alive():
+                return False
+            self._community_thread = Thread(
+                target=self._refresh_communities_in_background,
+                name="graph-community-refresh",
+                daemon=True,
+            )
+            self._community_thread.start()
+        return True
+
+    def refresh_communities(self) -> int:
+        """Recompute communities for components touched since the last refresh.
+
+        Returns the number of communities that were recomputed. Communities never span
+        connected components and the graph only grows, so untouched components keep their
+        previous assignment.
+        """
+
+        with self._community_refresh_lock:
+            self._networkx_graph()
+            return self._refresh_communities_locked()
+
+    def _refresh_communities_locked(self) -> int:
+        with self._community_lock:
+            dirty = self._community_dirty
+            self._community_dirty = set()
+            version = self._graph_version
+            components = self._touched_components(dirty)
+            scope = set().union(*components) if components else set()
+            subgraph = (
+                self._nx_graph.subgraph(scope).copy()
+                if self._nx_graph is not None
+                else None
+            )
+            edges = self._scope_edges(scope)
+        communities: List[Set[str]] = []
+        for component in components:
+            communities.extend(self._detect_communities(subgraph, component))
+        relations = self._group_community_edges(communities, edges)
+        with self._community_lock:
+            stale_ids = {
+                self._community_assignment[node_id]
+                for node_id in scope
+                if node_id in self._community_assignment
+            }
+            for community_id in stale_ids:
+                self._community_members.pop(community_id, None)
+                self._community_payloads.pop(community_id, None)
+            for members, member_edges in zip(communities, relations):
+                self._community_sequence += 1
+                community_id = f"community::{self._community_sequence}"
+                self._community_members[community_id] = members
+                self._community_payloads[community_id] = self._community_payload(
+                    community_id, members, member_edges
+                )
+                for node_id in members:
+                    self._community_assignment[node_id] = community_id
+            if communities or self._community_version is None:
+                self._community_generated_at = datetime.now(timezone.utc).isoformat()
+            self._community_version = version
+        return len(communities)
+
+    def _refresh_communities_in_background(self) -> None:
+        try:
+            self.refresh_communities()
+        except Exception:  # pragma: no cover - keep serving the previous assignment
+            _logger.exception("Graph community refresh failed")
+
+    def graph_rankings(self) -> _GraphRankings:
+        """Return the focus and leverage rankings for the last computed graph version.
+
+        Like :meth:`communities_for_nodes`, only the first call computes synchronously;
+        later calls serve the previous rankings while a background refresh catches up.
+        """
+
+        rankings = self._rankings
+        if rankings is None:
+            return self.refresh_rankings()
+        if rankings.version != self._graph_version:
+            self.schedule_rankings_refresh()
+        return rankings
+
+    def rankings_status(self) -> Dict[str, object]:
+        rankings = self._rankings
+        return {
+            "generated_at": rankings.generated_at if rankings is not None else None,
+            "graph_version": self._graph_version,
+            "rankings_version": rankings.version if rankings is not None else None,
+            "stale": rankings is None or rankings.version != self._graph_version,
+            "refreshing": self._rankings_thread is not None and self._rankings_thread.is_alive(),
+        }
+
+    def schedule_rankings_refresh(self) -> bool:
+        """Start a background ranking refresh unless one is running or nothing changed."""
+
+        with self._community_lock:
+            if self._rankings is not None and self._rankings.version == self._graph_version:
+                return False
+            if self._rankings_thread is not None and self._rankings_thread.is_alive():
+                return False
+            self._rankings_thread = Thread(
+                target=self._refresh_rankings_in_background,
+                name="graph-rankings-refresh",
+                daemon=True,
+            )
+            self._rankings_thread.start()
+        return True
+
+    def refresh_rankings(self) -> _GraphRankings:
+        """Recompute degree and betweenness rankings for the current graph version."""
+
+        with self._rankings_refresh_lock:
+            current = self._rankings
+            if current is not None and current.version == self._graph_version:
+                return current
+            self._networkx_graph()
+            version = self._graph_version
+            degree_map = self._degree_map()
+            topology = None
+            if self._nx_graph is not None:
+                # Betweenness is O(V*E); run it over a bare copy so writers are only
+                # blocked for the copy, not the computation.
+                with self._community_lock:
+                    topology = nx.DiGraph()
+                    topology.add_nodes_from(self._nx_graph.nodes())
+                    topology.add_edges_from(self._nx_graph.edges())
+            if topology is not None and topology.number_of_nodes() > 0:
+                focus = sorted(topology.degree(), key=lambda item: item[1], reverse=True)
+                try:
+                    centrality = nx.algorithms.centrality.betweenness_centrality(topology, normalized=True)
+                except Exception:  # pragma: no cover - fallback when analytics fails
+                    centrality = {node_id: 0.0 for node_id in topology.nodes()}
+            else:
+                focus = sorted(degree_map.items(), key=lambda item: item[1], reverse=True)
+                centrality = {node_id: 0.0 for node_id in degree_map}
+            leverage: List[Tuple[str, float]] = sorted(
+                centrality.items(), key=lambda item: item[1], reverse=True
+            )
+            if not leverage or all(score <= 0 for _, score in leverage):
+                leverage = sorted(degree_map.items(), key=lambda item: item[1], reverse=True)
+            rankings = _GraphRankings(
+                version=version,
+                generated_at=datetime.now(timezone.utc).isoformat(),
+                focus=focus,
+                leverage=[(node_id, float(score)) for node_id, score in leverage],
+            )
+            self._rankings = rankings
+            return rankings
+
+    def _refresh_rankings_in_background(self) -> None:
+        try:
+            self.refresh_rankings()
+        except Exception:  # pragma: no cover - keep serving the previous rankings
+            _logger.exception("Graph ranking refresh failed")
+
+    def _mark_community_dirty(self, *node_ids: str) -> None:
+        self._graph_version += 1
+        self._community_dirty.update(node_ids)
+
+    def _touched_components(self, dirty: Set[str]) -> List[Set[str]]:
+        """Return the weakly connected components containing ``dirty`` nodes.
+
+        Called with ``_community_lock`` held; cost is proportional to the touched components.
+        """
+
+        if self._nx_graph is not None:
+            adjacency = lambda node: list(self._nx_graph.successors(node)) + list(  # noqa: E731
+                self._nx_graph.predecessors(node)
+            )
+            present = {node for node in dirty if node in self._nx_graph}
+        else:
+            adjacency = lambda node: [  # noqa: E731
+                key[2] if key[0] == node else key[0] for key in self._edge_incident.get(node, ())
+            ]
+            present = {node for node in dirty if node in self._node_cache}
+        components: List[Set[str]] = []
+        visited: Set[str] = set()
+        for start in sorted(present):
+            if start in visited:
+                continue
+            component = {start}
+            frontier = [start]
+            while frontier:
+                node = frontier.pop()
+                for neighbour in adjacency(node):
+                    if neighbour not in component:
+                        component.add(neighbour)
+                        frontier.append(neighbour)
+            visited |= component
+            components.append(component)
+        return components
+
+    def _scope_edges(self, scope: Set[str]) -> List[GraphEdge]:
+        """Return cached edges incident to ``scope`` in insertion order.
+
+        Called with ``_community_lock`` held; ``scope`` is a union of whole components, so
+        both endpoints of every returned edge are in it.
+        """
+
+        positions: Dict[Tuple[str, str, str, str | None], int] = {}
+        for node_id in scope:
+            positions.update(self._edge_incident.get(node_id, {}))
+        return [self._edge_cache[key] for key in sorted(positions, key=positions.__getitem__)]
+
+    @staticmethod
+    def _detect_communities(graph: Any, component: Set[str]) -> List[Set[str]]:
+        if graph is None or nx is None or len(component) < 3:
+            return [set(component)]
+        undirected = graph.subgraph(component).to_undirected()
+        try:
+            raw = nx.algorithms.community.greedy_modularity_communities(undirected)
+        except Exception:  # pragma: no cover - fallback path
+            raw = nx.algorithms.community.label_propagation_communities(undirected)
+        return [set(members) for members in raw if members] or [set(component)]
+
+    def _group_community_edges(
+        self, communities: Sequence[Set[str]], edges: Sequence[GraphEdge]
+    ) -> List[List[GraphEdge]]:
+        owner: Dict[str, int] = {}
+        for index, members in enumerate(communities):
+            for node_id in members:
+                owner[node_id] = index
+        grouped: List[List[GraphEdge]] = [[] for _ in communities]
+        for edge in edges:
+            index = owner.get(edge.source)
+            if index is not None and owner.get(edge.target) == index:
+                grouped[index].append(edge)
+        return grouped
+
+    def _community_payload(
+        self, community_id: str, members: Set[str], edges: Sequence[GraphEdge]
+    ) -> GraphCommunity:
+        relations: List[Dict[str, object]] = []
+        documents: Set[str] = set()
+        for edge in edges:
+            doc_raw = edge.properties.get("doc_id")
+            if doc_raw is not None:
+                documents.add(str(doc_raw))
+            relations.append(
+                {
+                    "source": edge.source,
+                    "target": edge.target,
+                    "type": edge.type,
+                    "label": str(
+                        edge.properties.get("predicate") or edge.properties.get("label") or edge.type
+                    ),
+                    "doc": str(doc_raw) if doc_raw is not None else None,
+                }
+            )
+        size = len(members)
+        density = round(len(relations) / (size * (size - 1)), 3) if size > 1 else 0.0
+        return GraphCommunity(
+            id=community_id,
+            size=size,
+            score=density,
+            nodes=[
+                self._graph_node_payload(self._node_cache.get(node_id) or GraphNode(node_id, "Unknown", {}))
+                for node_id in sorted(members)
+            ],
+            relations=relations,
+            documents=sorted(documents),
+        )
 
     def describe_schema(self) -> str:
         node_types = sorted({node.type for node in self._node_cache.values()} or {"Unknown"})
@@ -1023,26 +1991,7 @@ class GraphService:
 
         leverage_points: List[GraphLeveragePoint] = []
         degree_map = self._degree_map()
-        centrality: Dict[str, float] = {}
-        if self._nx_graph is not None and self._nx_graph.number_of_nodes() > 0:
-            try:
-                centrality = nx.algorithms.centrality.betweenness_centrality(
-                    self._nx_graph, normalized=True
-                )
-            except Exception:  # pragma: no cover - fallback when analytics fails
-                centrality = {node_id: 0.0 for node_id in self._nx_graph.nodes()}
-        else:
-            centrality = {node_id: 0.0 for node_id in degree_map}
-
-        sorted_leverage = sorted(
-            centrality.items(), key=lambda item: item[1], reverse=True
-        )
-        if not sorted_leverage:
-            sorted_leverage = sorted(degree_map.items(), key=lambda item: item[1], reverse=True)
-        elif all(score <= 0 for _, score in sorted_leverage):
-            sorted_leverage = sorted(degree_map.items(), key=lambda item: item[1], reverse=True)
-
-        for node_id, score in sorted_leverage[:limit]:
+        for node_id, score in self.graph_rankings().leverage[:limit]:
             node = self._node_cache.get(node_id)
             if node is None:
                 continue
@@ -1098,6 +2047,7 @@ class GraphService:
         if not question_text:
             raise ValueError("Question must not be empty for text-to-Cypher generation")
         prompt = self.build_text_to_cypher_prompt(question_text, schema)
+        self._hydrate_property_graph()
         generator = getattr(self._property_graph, "text_to_cypher", None)
         warnings: List[str] = []
         cypher = ""
@@ -1227,6 +2177,22 @@ class GraphService:
             }
         return self._run_cypher_memory(query, parameters)
 
+    def explain_cypher(
+        self, query: str, parameters: Dict[str, object] | None = None
+    ) -> Dict[str, object]:
+        """Return the execution plan for ``query`` without running it."""
+
+        parameters = parameters or {}
+        statement = query.strip()
+        if not re.match(r"explain\b", statement, flags=re.IGNORECASE):
+            statement = f"EXPLAIN {statement}"
+        if self.mode == "neo4j":
+            with self.driver.session() as session:
+                plan = session.execute_read(lambda tx: tx.run(statement, **parameters).consume().plan)
+            return {"mode": "neo4j", "query": query, "plan": plan}
+        summary = self._run_cypher_memory(statement, parameters)["summary"]
+        return {"mode": "memory", "query": query, "plan": summary["plan"]}
+
     # region helpers
     def _build_community_summary(
         self,
@@ -1289,45 +2255,25 @@ class GraphService:
     def _run_cypher_memory(
         self, query: str, parameters: Dict[str, object]
     ) -> Dict[str, object]:
-        text = query.strip()
-        lowered = re.sub(r"\s+", " ", text.lower())
-        lowered = re.sub(r" limit \d+;?", "", lowered).strip()
-        lowered = lowered.rstrip(";")
-        records: List[Dict[str, object]] = []
-        node_match = re.match(
-            r"match\s*\(\s*([a-z])(?:\s*:\s*[A-Za-z][A-Za-z0-9_]*)?\s*(?:\{\s*id\s*:\s*'([^']+)'\s*\})?\s*\)\s*return",
-            lowered,
-        )
-        edge_match = re.match(
-            r"match\s*\(\s*([a-z])(?:\s*:\s*[A-Za-z][A-Za-z0-9_]*)?\s*\)-\s*\[([a-z])[^]]*\]\s*->\s*\(\s*([a-z])(?:\s*:\s*[A-Za-z][A-Za-z0-9_]*)?\s*\)\s*return",
-            lowered,
+        try:
+            plan = plan_cypher(query, self._memory_query_indexes(), parameters)
+        except ValueError as exc:
+            raise ValueError(f"Unsupported Cypher query for in-memory graph backend: {exc}") from exc
+        records = [] if plan.explain_only else plan.execute(self._graph_node_payload)
+        return {
+            "records": records,
+            "summary": {"mode": "memory", "count": len(records), "query": query, "plan": plan.describe()},
+        }
+
+    def _memory_query_indexes(self) -> MemoryGraphIndexes:
+        return MemoryGraphIndexes(
+            nodes=self._node_cache,
+            labels=self._node_labels,
+            edges=self._edges,
+            out_edges=self._out_edges,
+            in_edges=self._in_edges,
+            document_edges=self._doc_edges,
         )
-        if node_match and not edge_match:
-            node_id = node_match.group(2)
-            if node_id:
-                node = self._node_cache.get(node_id) or getattr(self, "_nodes", {}).get(node_id)
-                if node:
-                    records.append({"n": self._graph_node_payload(node)})
-            else:
-                for node in self._node_cache.values():
-                    records.append({"n": self._graph_node_payload(node)})
-        elif edge_match:
-            for edge in self._edge_cache.values():
-                source = self._node_cache.get(edge.source) or GraphNode(edge.source, "Unknown", {})
-                target = self._node_cache.get(edge.target) or GraphNode(edge.target, "Unknown", {})
-                records.append(
-                    {
-                        "source": self._graph_node_payload(source),
-                        "relation": {
-                            "type": edge.type,
-                            "properties": dict(edge.properties),
-                        },
-                        "target": self._graph_node_payload(target),
-                    }
-                )
-        else:
-            raise ValueError("Unsupported Cypher query for in-memory graph backend")
-        return {"records": records, "summary": {"mode": "memory", "count": len(records), "query": query}}
 
     def _graph_node_payload(self, node: GraphNode) -> Dict[str, object]:
         return {"id": node.id, "type": node.type, "properties": dict(node.properties)}
@@ -1347,18 +2293,11 @@ class GraphService:
         return ordered[:limit]
 
     def _default_focus_nodes(self, limit: int) -> List[Tuple[str, int]]:
-        if self._nx_graph is not None and self._nx_graph.number_of_nodes() > 0:
-            degree_sequence = list(self._nx_graph.degree())
-            sorted_nodes = sorted(degree_sequence, key=lambda item: item[1], reverse=True)
-            return sorted_nodes[:limit]
-        degree_map = self._degree_map()
-        return sorted(degree_map.items(), key=lambda item: item[1], reverse=True)[:limit]
+        return self.graph_rankings().focus[:limit]
 
     def _degree_map(self) -> Dict[str, int]:
-        counts: Dict[str, int] = {}
-        for edge in self._edge_cache.values():
-            counts[edge.source] = counts.get(edge.source, 0) + 1
-            counts[edge.target] = counts.get(edge.target, 0) + 1
+        with self._community_lock:
+            counts = dict(self._edge_degree)
         if not counts and hasattr(self, "_nodes"):
             for node_id in getattr(self, "_nodes").keys():
                 counts.setdefault(node_id, 0)
@@ -1450,23 +2389,47 @@ class GraphService:
         merged_props = {**(existing.properties if existing else {}), **properties}
         resolved_type = node_type if node_type != "Unknown" else (existing.type if existing else node_type)
         node = GraphNode(id=node_id, type=resolved_type, properties=merged_props)
-        self._node_cache[node_id] = node
+        with self._community_lock:
+            self._node_cache[node_id] = node
+            if existing is None:
+                self._mark_community_dirty(node_id)
+                self._node_order.append(node_id)
+            elif existing.type != resolved_type:
+                for label in set(_node_labels_for(existing.type)) - set(_node_labels_for(resolved_type)):
+                    self._node_labels.get(label, {}).pop(node_id, None)
+            for label in _node_labels_for(resolved_type):
+                self._node_labels.setdefault(label, {})[node_id] = None
+            if self._nx_graph is not None and self._nx_hydrated:
+                self._nx_graph.add_node(node_id, type=node.type, properties=dict(node.properties))
         self._strategy_cache = None
-        if self._property_graph is not None:
+        if self._property_graph is not None and self._property_graph_hydrated:
             try:
                 property_node = self._create_property_node(node)
                 self._property_graph.upsert_nodes([property_node])
                 self._sync_knowledge_index([property_node])
             except Exception:  # pragma: no cover - defensive fallback
                 pass
-        if self._nx_graph is not None:
-            self._nx_graph.add_node(node_id, type=node.type, properties=dict(node.properties))
 
     def _record_edge(self, edge: GraphEdge) -> None:
         key = self._edge_key(edge.source, edge.type, edge.target, edge.properties)
-        self._edge_cache[key] = edge
+        with self._community_lock:
+            if key not in self._edge_cache:
+                self._mark_community_dirty(edge.source, edge.target)
+                position = len(self._edge_order)
+                self._edge_incident.setdefault(edge.source, {})[key] = position
+                self._edge_incident.setdefault(edge.target, {})[key] = position
+                self._edge_order.append(key)
+                self._edge_degree[edge.source] = self._edge_degree.get(edge.source, 0) + 1
+                self._edge_degree[edge.target] = self._edge_degree.get(edge.target, 0) + 1
+            self._edge_cache[key] = edge
+            if self._nx_graph is not None and self._nx_hydrated:
+                self._nx_graph.add_edge(
+                    edge.source,
+                    edge.target,
+                    **{"type": edge.type, "properties": dict(edge.properties)},
+                )
         self._strategy_cache = None
-        if self._property_graph is not None:
+        if self._property_graph is not None and self._property_graph_hydrated:
             try:
                 source_node = self._node_cache.get(edge.source)
                 target_node = self._node_cache.get(edge.target)
@@ -1481,12 +2444,6 @@ class GraphService:
                 self._property_graph.upsert_relations([self._create_property_relation(edge)])
             except Exception:  # pragma: no cover - defensive fallback
                 pass
-        if self._nx_graph is not None:
-            self._nx_graph.add_edge(
-                edge.source,
-                edge.target,
-                **{"type": edge.type, "properties": dict(edge.properties)},
-            )
 
     def _create_property_graph_store(self) -> Any:
         if self.mode == "neo4j" and _LlamaNeo4jPropertyGraphStore is not None:
@@ -1567,6 +2524,76 @@ class GraphService:
 
     # endregion
 
+    def _store_memory_node(self, node: GraphNode) -> None:
+        self._nodes[node.id] = node
+        if node.type in _SEARCHABLE_ENTITY_TYPES:
+            self._entity_text_index.add(node.id, _entity_search_terms(node.properties))
+        else:
+            self._entity_text_index.remove(node.id)
+        if self._snapshot_store is not None and not self._replaying_snapshot:
+            self._snapshot_store.append_node(node.id, node.type, node.properties)
+            self._maybe_compact_snapshot()
+
+    def _store_memory_edge(self, key: Tuple[str, str, str, str | None], edge: GraphEdge) -> None:
+        if key not in self._edges:
+            self._edge_sequence[key] = len(self._edge_sequence)
+            self._out_edges.setdefault(key[0], {})[key] = None
+            self._in_edges.setdefault(key[2], {})[key] = None
+            if key[3] is not None:
+                self._doc_edges.setdefault(key[3], {})[key] = None
+        self._edges[key] = edge
+        if self._snapshot_store is not None and not self._replaying_snapshot:
+            self._snapshot_store.append_edge(edge.source, edge.type, edge.target, edge.properties)
+            self._maybe_compact_snapshot()
+
+    def _bulk_store_memory_edges(self, edges: Iterable[Tuple[str, str, str, Dict[str, object]]]) -> None:
+        """``_store_memory_edge`` for snapshot reloads, with lookups hoisted out of the loop."""
+
+        stored = self._edges
+        sequence = self._edge_sequence
+        out_edges = self._out_edges
+        in_edges = self._in_edges
+        doc_edges = self._doc_edges
+        for source, relation_type, target, properties in edges:
+            doc_id = properties.get("doc_id")
+            key = (source, relation_type, target, str(doc_id) if doc_id is not None else None)
+            if key not in stored:
+                sequence[key] = len(sequence)
+                out_edges.setdefault(source, {})[key] = None
+                in_edges.setdefault(target, {})[key] = None
+                if key[3] is not None:
+                    doc_edges.setdefault(key[3], {})[key] = None
+            stored[key] = GraphEdge(source, target, relation_type, properties)
+
+    def _maybe_compact_snapshot(self) -> None:
+        """Start a background compaction once the journal is due for one.
+
+        Called by writers holding ``_write_lock``, so at most one compaction is started and
+        it captures the graph only after the calling upsert has finished.
+        """
+
+        if self._snapshot_store is None or not self._snapshot_store.needs_compaction:
+            return
+        if self._compaction_thread is not None and self._compaction_thread.is_alive():
+            return
+        self._compaction_thread = Thread(
+            target=self._compact_snapshot_in_background,
+            name="graph-snapshot-compaction",
+            daemon=True,
+        )
+        self._compaction_thread.start()
+
+    def _compact_snapshot_in_background(self) -> None:
+        try:
+            self.snapshot_memory_graph()
+        except Exception:  # pragma: no cover - the journal keeps every write until the next attempt
+            _logger.exception("Graph snapshot compaction failed")
+
+    def _incident_edge_keys(self, node_id: str) -> List[Tuple[str, str, str, str | None]]:
+        keys = dict(self._out_edges.get(node_id, {}))
+        keys.update(self._in_edges.get(node_id, {}))
+        return sorted(keys, key=self._edge_sequence.__getitem__)
+
     def _edge_key(
         self, source_id: str, relation_type: str, target_id: str, properties: Dict[str, object]
     ) -> Tuple[str, str, str, str | None]:
@@ -1703,6 +2730,61 @@ class GraphService:
     # endregion
 
 
+
+class GraphBatchWriter:
+    """Buffer entity and relation upserts and flush them through ``GraphService.write_batch``.
+
+    A batch is flushed once it holds ``batch_size`` pending writes and when the writer is
+    closed, including when the block exits with an error, since earlier callers may
+    already have recorded their writes as done. Entities queued before a relation are
+    never written after it, so callers that upsert endpoints first keep Neo4j's ``MATCH``
+    on relation endpoints satisfied.
+    """
+
+    def __init__(self, service: GraphService, batch_size: int) -> None:
+        self.service = service
+        self.batch_size = max(1, int(batch_size))
+        self.batches_flushed = 0
+        self._entities: List[Tuple[str, str, Dict[str, object]]] = []
+        self._relations: List[Tuple[str, str, str, Dict[str, object]]] = []
+
+    def __enter__(self) -> "GraphBatchWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.flush()
+
+    @property
+    def pending(self) -> int:
+        return len(self._entities) + len(self._relations)
+
+    def upsert_entity(self, entity_id: str, entity_type: str, properties: Dict[str, object]) -> None:
+        self._entities.append((entity_id, entity_type, properties))
+        self._maybe_flush()
+
+    def merge_relation(
+        self,
+        source_id: str,
+        relation_type: str,
+        target_id: str,
+        properties: Dict[str, object],
+    ) -> None:
+        self._relations.append((source_id, relation_type, target_id, properties))
+        self._maybe_flush()
+
+    def flush(self) -> None:
+        if not self.pending:
+            return
+        entities, relations = self._entities, self._relations
+        self._entities, self._relations = [], []
+        self.service.write_batch(entities, relations)
+        self.batches_flushed += 1
+
+    def _maybe_flush(self) -> None:
+        if self.pending >= self.batch_size:
+            self.flush()
+
+
 _graph_service: GraphService | None = None
 
 
@@ -1715,5 +2797,7 @@ def get_graph_service() -> GraphService:
 
 def reset_graph_service() -> None:
     global _graph_service
+    if _graph_service is not None:
+        _graph_service.close()
     _graph_service = None
 
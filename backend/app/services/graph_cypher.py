@@ -0,0 +1,769 @@
+"""Planner and executor for the Cypher subset served by the in-memory graph backend.
+
+Supported statements have the shape::
+
+    [EXPLAIN] MATCH (a[:Label] {key: value})[-[r[:TYPE|OTHER] {key: value}]->(b ...)]
+    [WHERE a.key <op> value [AND ...]] RETURN [DISTINCT] *|a|a.key [AS alias], ...
+    [ORDER BY a.key|alias [ASC|DESC], ...] [LIMIT n]
+
+where ``<op>`` is one of ``= <> != < <= > >= IN CONTAINS STARTS WITH ENDS WITH IS [NOT] NULL``
+and values are literals, lists or ``$parameters``. The planner picks the cheapest access
+path among id seeks, label scans, document relationship seeks and adjacency expansion,
+applies every predicate as soon as its variables are bound and stops pulling rows once
+``LIMIT`` is satisfied. ``ORDER BY`` sorts every matching row before ``LIMIT`` applies;
+nulls sort last ascending and first descending, as in Neo4j.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Set, Tuple
+
+EdgeKey = Tuple[str, str, str, Optional[str]]
+Binding = Dict[str, Any]
+
+_TOKEN_RE = re.compile(
+    r"""
+    \s*(?:
+        (?P<string>'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*")
+      | (?P<number>\d+(?:\.\d+)?)
+      | (?P<param>\$[A-Za-z_][A-Za-z0-9_]*)
+      | (?P<name>[A-Za-z_][A-Za-z0-9_]*|`[^`]+`)
+      | (?P<symbol><-|->|<>|!=|<=|>=|[-()\[\]{}:,.=<>|*;])
+    )
+    """,
+    re.VERBOSE,
+)
+_COMPARISONS = {"=", "<>", "!=", "<", "<=", ">", ">="}
+
+
+class CypherNotSupported(ValueError):
+    """Raised for statements outside the subset the in-memory backend can plan."""
+
+
+@dataclass(slots=True)
+class MemoryGraphIndexes:
+    """Read-only views over the in-memory graph that the planner may use.
+
+    ``labels`` maps a label to the ids of the nodes carrying it; ``out_edges``/``in_edges``/
+    ``document_edges`` map a node or document id to the keys of its edges in ``edges``.
+    """
+
+    nodes: Mapping[str, Any]
+    labels: Mapping[str, Mapping[str, None]]
+    edges: Mapping[EdgeKey, Any]
+    out_edges: Mapping[str, Mapping[EdgeKey, None]]
+    in_edges: Mapping[str, Mapping[EdgeKey, None]]
+    document_edges: Mapping[str, Mapping[EdgeKey, None]]
+
+
+@dataclass(slots=True)
+class PlanStep:
+    operator: str
+    detail: str
+    estimated_rows: int
+    rows: int | None = None
+
+    def to_dict(self) -> Dict[str, object]:
+        payload: Dict[str, object] = {
+            "operator": self.operator,
+            "detail": self.detail,
+            "estimated_rows": self.estimated_rows,
+        }
+        if self.rows is not None:
+            payload["rows"] = self.rows
+        return payload
+
+
+@dataclass(slots=True)
+class _NodePattern:
+    var: str
+    labels: Tuple[str, ...]
+
+
+@dataclass(slots=True)
+class _RelPattern:
+    var: str
+    types: Tuple[str, ...]
+    direction: str  # "out", "in" or "both", relative to the left node
+
+
+@dataclass(slots=True)
+class _Predicate:
+    var: str
+    key: str
+    op: str
+    value: Any = None
+
+    def describe(self) -> str:
+        if self.op in {"IS NULL", "IS NOT NULL"}:
+            return f"{self.var}.{self.key} {self.op}"
+        return f"{self.var}.{self.key} {self.op} {self.value!r}"
+
+
+@dataclass(slots=True)
+class _Query:
+    explain: bool
+    nodes: List[_NodePattern]
+    relation: _RelPattern | None
+    predicates: List[_Predicate]
+    returns: List[Tuple[str, str | None, str]]  # (var, key, column)
+    limit: int | None
+    distinct: bool = False
+    order_by: List[Tuple[str, str | None, bool]] = field(default_factory=list)  # (var, key, descending)
+
+
+@dataclass(slots=True)
+class CypherPlan:
+    """An executable plan; ``steps`` lists operators from the leaf to the projection."""
+
+    query: _Query
+    steps: List[PlanStep] = field(default_factory=list)
+    _pipeline: Callable[[], Iterator[Binding]] | None = None
+
+    @property
+    def explain_only(self) -> bool:
+        return self.query.explain
+
+    def describe(self) -> List[Dict[str, object]]:
+        return [step.to_dict() for step in self.steps]
+
+    def execute(self, node_payload: Callable[[Any], Dict[str, object]]) -> List[Dict[str, object]]:
+        assert self._pipeline is not None
+        query = self.query
+        pipeline = self._pipeline()
+        rows: Iterable[Binding] = pipeline
+        records: List[Dict[str, object]] = []
+        seen: Set[str] = set()
+        sorted_rows: int | None = None
+        try:
+            if query.order_by:
+                ordered = _sort_bindings(pipeline, query.order_by)
+                sorted_rows = len(ordered)
+                rows = ordered
+            if query.limit != 0:
+                for binding in rows:
+                    record = self._project(binding, node_payload)
+                    if query.distinct:
+                        marker = json.dumps(record, sort_keys=True, default=str)
+                        if marker in seen:
+                            continue
+                        seen.add(marker)
+                    records.append(record)
+                    if query.limit is not None and len(records) >= query.limit:
+                        break
+        finally:
+            # Closing the pipeline early (LIMIT) lets each operator record its row count.
+            pipeline.close()
+        for step in self.steps:
+            if step.operator in {"Distinct", "Limit", "ProduceResults"}:
+                step.rows = len(records)
+            elif step.operator == "Sort":
+                step.rows = sorted_rows
+        return records
+
+    def _project(self, binding: Binding, node_payload: Callable[[Any], Dict[str, object]]) -> Dict[str, object]:
+        record: Dict[str, object] = {}
+        for var, key, column in self.query.returns:
+            value = binding[var]
+            if key is not None:
+                record[column] = _property(value, key)
+            elif _is_edge(value):
+                record[column] = {
+                    "type": value.type,
+                    "source": value.source,
+                    "target": value.target,
+                    "properties": dict(value.properties),
+                }
+            else:
+                record[column] = node_payload(value)
+        return record
+
+
+def plan_cypher(query: str, indexes: MemoryGraphIndexes, parameters: Mapping[str, object] | None = None) -> CypherPlan:
+    parsed = _Parser(query, parameters or {}).parse()
+    return _Planner(parsed, indexes).plan()
+
+
+class _Parser:
+    def __init__(self, text: str, parameters: Mapping[str, object]) -> None:
+        self.text = text
+        self.parameters = parameters
+        self.tokens = self._tokenize(text)
+        self.position = 0
+        self.predicates: List[_Predicate] = []
+        self.anonymous = 0
+
+    @staticmethod
+    def _tokenize(text: str) -> List[Tuple[str, str]]:
+        tokens: List[Tuple[str, str]] = []
+        position = 0
+        stripped = text.rstrip()
+        while position < len(stripped):
+            match = _TOKEN_RE.match(stripped, position)
+            if match is None or match.end() == position:
+                raise CypherNotSupported(f"Unexpected character in Cypher query at offset {position}")
+            kind = match.lastgroup or ""
+            tokens.append((kind, match.group(kind)))
+            position = match.end()
+        return tokens
+
+    def parse(self) -> _Query:
+        explain = self._keyword("EXPLAIN")
+        self._expect_keyword("MATCH")
+        left = self._node()
+        nodes = [left]
+        relation = None
+        if self._peek_symbol("-") or self._peek_symbol("<-"):
+            relation = self._relation()
+            nodes.append(self._node())
+        if self._keyword("WHERE"):
+            self._condition()
+            while self._keyword("AND"):
+                self._condition()
+        self._expect_keyword("RETURN")
+        bound = {pattern.var for pattern in nodes}
+        if relation is not None:
+            bound.add(relation.var)
+        distinct = self._keyword("DISTINCT")
+        returns = self._returns(nodes, relation)
+        order_by: List[Tuple[str, str | None, bool]] = []
+        if self._keyword("ORDER"):
+            self._expect_keyword("BY")
+            order_by = self._order_items(returns)
+        limit = None
+        if self._keyword("LIMIT"):
+            limit = self._value()
+            if isinstance(limit, bool) or not isinstance(limit, int) or limit < 0:
+                raise CypherNotSupported("LIMIT must be a non-negative integer")
+        self._symbol(";")
+        if self.position != len(self.tokens):
+            raise CypherNotSupported(f"Unsupported Cypher clause near '{self.tokens[self.position][1]}'")
+        for predicate in self.predicates:
+            if predicate.var not in bound:
+                raise CypherNotSupported(f"Variable '{predicate.var}' is not defined")
+        for var, _, _ in returns + order_by:
+            if var not in bound:
+                raise CypherNotSupported(f"Variable '{var}' is not defined")
+        return _Query(explain, nodes, relation, self.predicates, returns, limit, distinct, order_by)
+
+    def _node(self) -> _NodePattern:
+        self._expect_symbol("(")
+        var = self._variable("node")
+        labels: List[str] = []
+        while self._symbol(":"):
+            labels.append(self._name())
+        if self._peek_symbol("{"):
+            self._inline_properties(var)
+        self._expect_symbol(")")
+        return _NodePattern(var, tuple(labels))
+
+    def _relation(self) -> _RelPattern:
+        incoming = self._symbol("<-")
+        if not incoming:
+            self._expect_symbol("-")
+        self._expect_symbol("[")
+        var = self._variable("relation")
+        types: List[str] = []
+        if self._symbol(":"):
+            types.append(self._name())
+            while self._symbol("|"):
+                self._symbol(":")
+                types.append(self._name())
+        if self._peek_symbol("{"):
+            self._inline_properties(var)
+        self._expect_symbol("]")
+        if self._symbol("->"):
+            if incoming:
+                raise CypherNotSupported("Relationship patterns cannot point both ways")
+            direction = "out"
+        else:
+            self._expect_symbol("-")
+            direction = "in" if incoming else "both"
+        return _RelPattern(var, tuple(types), direction)
+
+    def _variable(self, kind: str) -> str:
+        kind_token, value = self._current()
+        if kind_token == "name":
+            self.position += 1
+            return value.strip("`")
+        self.anonymous += 1
+        # A space can never appear in a parsed identifier, so anonymous names cannot clash.
+        return f" {kind}{self.anonymous}"
+
+    def _inline_properties(self, var: str) -> None:
+        self._expect_symbol("{")
+        if not self._symbol("}"):
+            while True:
+                key = self._name()
+                self._expect_symbol(":")
+                self.predicates.append(_Predicate(var, key, "=", self._value()))
+                if self._symbol("}"):
+                    break
+                self._expect_symbol(",")
+
+    def _condition(self) -> None:
+        var = self._name()
+        self._expect_symbol(".")
+        key = self._name()
+        kind, token = self._current()
+        upper = token.upper()
+        if kind == "symbol" and token in _COMPARISONS:
+            self.position += 1
+            op = "<>" if token == "!=" else token
+        elif kind == "name" and upper in {"IN", "CONTAINS"}:
+            self.position += 1
+            op = upper
+        elif kind == "name" and upper in {"STARTS", "ENDS"}:
+            self.position += 1
+            self._expect_keyword("WITH")
+            op = f"{upper} WITH"
+        elif kind == "name" and upper == "IS":
+            self.position += 1
+            op = "IS NOT NULL" if self._keyword("NOT") else "IS NULL"
+            self._expect_keyword("NULL")
+            self.predicates.append(_Predicate(var, key, op))
+            return
+        else:
+            raise CypherNotSupported(f"Unsupported WHERE operator '{token}'")
+        value = self._value()
+        if op == "IN" and not isinstance(value, list):
+            raise CypherNotSupported("IN expects a list")
+        self.predicates.append(_Predicate(var, key, op, value))
+
+    def _returns(
+        self, nodes: Sequence[_NodePattern], relation: _RelPattern | None
+    ) -> List[Tuple[str, str | None, str]]:
+        if self._symbol("*"):
+            named = [pattern.var for pattern in nodes]
+            if relation is not None:
+                named.insert(1, relation.var)
+            return [(var, None, var) for var in named if not var.startswith(" ")]
+        items: List[Tuple[str, str | None, str]] = []
+        while True:
+            var = self._name()
+            key = None
+            column = var
+            if self._symbol("."):
+                key = self._name()
+                column = f"{var}.{key}"
+            if self._keyword("AS"):
+                column = self._name()
+            items.append((var, key, column))
+            if not self._symbol(","):
+                return items
+
+    def _order_items(self, returns: Sequence[Tuple[str, str | None, str]]) -> List[Tuple[str, str | None, bool]]:
+        aliases = {column: (var, key) for var, key, column in returns}
+        items: List[Tuple[str, str | None, bool]] = []
+        while True:
+            name = self._name()
+            key = None
+            if self._symbol("."):
+                key = self._name()
+            elif name in aliases:
+                name, key = aliases[name]
+            descending = False
+            if self._keyword("DESC") or self._keyword("DESCENDING"):
+                descending = True
+            elif not self._keyword("ASC"):
+                self._keyword("ASCENDING")
+            items.append((name, key, descending))
+            if not self._symbol(","):
+                return items
+
+    def _value(self) -> Any:
+        kind, token = self._current()
+        self.position += 1
+        if kind == "string":
+            return re.sub(r"\\(.)", r"\1", token[1:-1])
+        if kind == "number":
+            return float(token) if "." in token else int(token)
+        if kind == "param":
+            name = token[1:]
+            if name not in self.parameters:
+                raise CypherNotSupported(f"Missing Cypher parameter '${name}'")
+            return self.parameters[name]
+        if kind == "symbol" and token == "-":
+            value = self._value()
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                raise CypherNotSupported("Unary minus expects a number")
+            return -value
+        if kind == "symbol" and token == "[":
+            values: List[Any] = []
+            if not self._symbol("]"):
+                while True:
+                    values.append(self._value())
+                    if self._symbol("]"):
+                        break
+                    self._expect_symbol(",")
+            return values
+        if kind == "name" and token.upper() in {"TRUE", "FALSE", "NULL"}:
+            return {"TRUE": True, "FALSE": False, "NULL": None}[token.upper()]
+        raise CypherNotSupported(f"Unsupported Cypher value '{token}'")
+
+    def _current(self) -> Tuple[str, str]:
+        if self.position >= len(self.tokens):
+            return "", ""
+        return self.tokens[self.position]
+
+    def _name(self) -> str:
+        kind, token = self._current()
+        if kind != "name":
+            raise CypherNotSupported(f"Expected a name near '{token}'")
+        self.position += 1
+        return token.strip("`")
+
+    def _keyword(self, keyword: str) -> bool:
+        kind, token = self._current()
+        if kind == "name" and token.upper() == keyword:
+            self.position += 1
+            return True
+        return False
+
+    def _expect_keyword(self, keyword: str) -> None:
+        if not self._keyword(keyword):
+            raise CypherNotSupported(f"Expected {keyword} in Cypher query")
+
+    def _peek_symbol(self, symbol: str) -> bool:
+        kind, token = self._current()
+        return kind == "symbol" and token == symbol
+
+    def _symbol(self, symbol: str) -> bool:
+        if self._peek_symbol(symbol):
+            self.position += 1
+            return True
+        return False
+
+    def _expect_symbol(self, symbol: str) -> None:
+        if not self._symbol(symbol):
+            raise CypherNotSupported(f"Expected '{symbol}' near '{self._current()[1]}'")
+
+
+@dataclass(slots=True)
+class _Access:
+    step: PlanStep
+    rows: Callable[[], Iterator[Binding]]
+
+
+class _Planner:
+    def __init__(self, query: _Query, indexes: MemoryGraphIndexes) -> None:
+        self.query = query
+        self.indexes = indexes
+        self.by_var: Dict[str, List[_Predicate]] = {}
+        for predicate in query.predicates:
+            self.by_var.setdefault(predicate.var, []).append(predicate)
+
+    def plan(self) -> CypherPlan:
+        plan = CypherPlan(self.query)
+        if self.query.relation is None:
+            pattern = self.query.nodes[0]
+            access = self._node_access(pattern)
+            steps = [access.step]
+            pipeline = self._filter(steps, access.rows, [pattern.var])
+        else:
+            steps, pipeline = self._plan_relation()
+        if self.query.order_by:
+            keys = ", ".join(
+                f"{var.strip()}{'.' + key if key else ''}{' DESC' if descending else ''}"
+                for var, key, descending in self.query.order_by
+            )
+            steps.append(PlanStep("Sort", keys, steps[-1].estimated_rows))
+        columns = ", ".join(column for _, _, column in self.query.returns)
+        if self.query.distinct:
+            steps.append(PlanStep("Distinct", columns, steps[-1].estimated_rows))
+        if self.query.limit is not None:
+            steps.append(PlanStep("Limit", str(self.query.limit), min(steps[-1].estimated_rows, self.query.limit)))
+        steps.append(PlanStep("ProduceResults", columns, steps[-1].estimated_rows))
+        plan.steps = steps
+        plan._pipeline = pipeline
+        return plan
+
+    # region access paths
+    def _node_access(self, pattern: _NodePattern) -> _Access:
+        options: List[_Access] = []
+        ids = self._id_values(pattern.var)
+        if ids is not None:
+            options.append(self._id_seek(pattern.var, ids))
+        if pattern.labels:
+            options.append(self._label_scan(pattern.var, pattern.labels))
+        nodes = self.indexes.nodes
+        options.append(
+            _Access(
+                PlanStep("AllNodesScan", pattern.var, len(nodes)),
+                lambda: ({pattern.var: node} for node in list(nodes.values())),
+            )
+        )
+        return min(options, key=lambda option: option.step.estimated_rows)
+
+    def _id_values(self, var: str) -> List[str] | None:
+        for predicate in self.by_var.get(var, []):
+            if predicate.key != "id":
+                continue
+            if predicate.op == "=":
+                return [str(predicate.value)]
+            if predicate.op == "IN":
+                return list(dict.fromkeys(str(value) for value in predicate.value))
+        return None
+
+    def _id_seek(self, var: str, ids: List[str]) -> _Access:
+        nodes = self.indexes.nodes
+
+        def rows() -> Iterator[Binding]:
+            for node_id in ids:
+                node = nodes.get(node_id)
+                if node is not None:
+                    yield {var: node}
+
+        return _Access(PlanStep("NodeByIdSeek", f"{var}.id IN {ids!r}", len(ids)), rows)
+
+    def _label_scan(self, var: str, labels: Tuple[str, ...]) -> _Access:
+        label = min(labels, key=lambda name: len(self.indexes.labels.get(name, {})))
+        members = self.indexes.labels.get(label, {})
+        nodes = self.indexes.nodes
+
+        def rows() -> Iterator[Binding]:
+            for node_id in list(members):
+                node = nodes.get(node_id)
+                if node is not None:
+                    yield {var: node}
+
+        return _Access(PlanStep("NodeByLabelScan", f"{var}:{label}", len(members)), rows)
+
+    def _plan_relation(self) -> Tuple[List[PlanStep], Callable[[], Iterator[Binding]]]:
+        relation = self.query.relation
+        assert relation is not None
+        left, right = self.query.nodes
+        indexes = self.indexes
+        average_degree = max(1, round(len(indexes.edges) / max(1, len(indexes.nodes))))
+        candidates: List[Tuple[int, str, Any]] = []
+
+        document_values = [
+            predicate.value
+            for predicate in self.by_var.get(relation.var, [])
+            if predicate.key == "doc_id" and predicate.op == "=" and predicate.value is not None
+        ]
+        if document_values:
+            keys = indexes.document_edges.get(str(document_values[0]), {})
+            candidates.append((len(keys), "document", keys))
+        for anchor, other in ((left, right), (right, left)):
+            access = self._node_access(anchor)
+            candidates.append((access.step.estimated_rows * average_degree, "expand", (anchor, other, access)))
+        candidates.append((len(indexes.edges), "scan", None))
+        estimate, kind, detail = min(candidates, key=lambda item: item[0])
+        if kind != "expand" and relation.direction == "both":
+            estimate *= 2  # an undirected match binds each relationship in both orientations
+
+        steps: List[PlanStep] = []
+        if kind == "expand":
+            anchor, other, access = detail
+            steps.append(access.step)
+            anchored = self._filter(steps, access.rows, [anchor.var])
+            pointing = self._expand_direction(anchor is left, relation.direction)
+            steps.append(PlanStep("Expand(All)", self._expand_text(anchor, other, pointing), estimate))
+
+            def expanded() -> Iterator[Binding]:
+                for binding in anchored():
+                    node = binding[anchor.var]
+                    for edge, neighbour_id in self._incident(node.id, pointing):
+                        neighbour = indexes.nodes.get(neighbour_id)
+                        if neighbour is None:
+                            continue
+                        row = dict(binding)
+                        row[relation.var] = edge
+                        row[other.var] = neighbour
+                        yield row
+
+            pipeline = self._filter(steps, expanded, [relation.var, other.var])
+        else:
+            if kind == "document":
+                detail_text = f"{relation.var.strip()}.doc_id = {document_values[0]!r}"
+                steps.append(PlanStep("RelationshipByDocumentSeek", detail_text, estimate))
+                keys_source: Callable[[], Iterable[EdgeKey]] = lambda: list(detail)  # noqa: E731
+            else:
+                steps.append(PlanStep("AllRelationshipsScan", relation.var.strip() or "*", estimate))
+                keys_source = lambda: list(indexes.edges)  # noqa: E731
+
+            def related() -> Iterator[Binding]:
+                for key in keys_source():
+                    if relation.types and key[1] not in relation.types:
+                        continue
+                    edge = indexes.edges.get(key)
+                    if edge is None:
+                        continue
+                    for left_id, right_id in self._orientations(edge, relation.direction):
+                        left_node = indexes.nodes.get(left_id)
+                        right_node = indexes.nodes.get(right_id)
+                        if left_node is None or right_node is None:
+                            continue
+                        yield {left.var: left_node, relation.var: edge, right.var: right_node}
+
+            pipeline = self._filter(steps, related, [relation.var, left.var, right.var])
+        return steps, pipeline
+
+    @staticmethod
+    def _expand_direction(anchor_is_left: bool, direction: str) -> str:
+        if direction == "both" or anchor_is_left:
+            return direction
+        return "in" if direction == "out" else "out"
+
+    def _incident(self, node_id: str, direction: str) -> Iterator[Tuple[Any, str]]:
+        relation = self.query.relation
+        assert relation is not None
+        edges = self.indexes.edges
+        if direction in {"out", "both"}:
+            for key in list(self.indexes.out_edges.get(node_id, {})):
+                if relation.types and key[1] not in relation.types:
+                    continue
+                edge = edges.get(key)
+                if edge is not None:
+                    yield edge, edge.target
+        if direction in {"in", "both"}:
+            for key in list(self.indexes.in_edges.get(node_id, {})):
+                if relation.types and key[1] not in relation.types:
+                    continue
+                if direction == "both" and key[0] == key[2]:
+                    continue
+                edge = edges.get(key)
+                if edge is not None:
+                    yield edge, edge.source
+
+    @staticmethod
+    def _orientations(edge: Any, direction: str) -> List[Tuple[str, str]]:
+        if direction == "out":
+            return [(edge.source, edge.target)]
+        if direction == "in":
+            return [(edge.target, edge.source)]
+        if edge.source == edge.target:
+            return [(edge.source, edge.target)]
+        return [(edge.source, edge.target), (edge.target, edge.source)]
+
+    def _expand_text(self, anchor: _NodePattern, other: _NodePattern, pointing: str) -> str:
+        relation = self.query.relation
+        assert relation is not None
+        types = (":" + "|".join(relation.types)) if relation.types else ""
+        inner = f"[{relation.var.strip()}{types}]"
+        arrow = {"out": f"-{inner}->", "in": f"<-{inner}-", "both": f"-{inner}-"}[pointing]
+        return f"({anchor.var.strip()}){arrow}({other.var.strip()})"
+
+    # endregion
+
+    def _filter(
+        self, steps: List[PlanStep], source: Callable[[], Iterator[Binding]], variables: Sequence[str]
+    ) -> Callable[[], Iterator[Binding]]:
+        """Append a Filter for everything that becomes checkable once ``variables`` are bound."""
+
+        checks: List[Callable[[Binding], bool]] = []
+        details: List[str] = []
+        for var in variables:
+            pattern = next((node for node in self.query.nodes if node.var == var), None)
+            if pattern is not None and pattern.labels:
+                checks.append(
+                    lambda row, var=var, labels=pattern.labels: all(
+                        row[var].id in self.indexes.labels.get(label, {}) for label in labels
+                    )
+                )
+                details.append(f"{var.strip()}:{':'.join(pattern.labels)}")
+            relation = self.query.relation
+            if relation is not None and relation.var == var and relation.types:
+                checks.append(lambda row, var=var, types=relation.types: row[var].type in types)
+                details.append(f"type({var.strip() or 'r'}) IN {list(relation.types)!r}")
+            for predicate in self.by_var.get(var, []):
+                checks.append(lambda row, predicate=predicate: _evaluate(predicate, row[predicate.var]))
+                details.append(predicate.describe().strip())
+        counter = PlanStep("Filter", " AND ".join(details), steps[-1].estimated_rows) if checks else None
+        if counter is not None:
+            steps.append(counter)
+        leaf = steps[-1] if counter is None else steps[-2]
+
+        def rows() -> Iterator[Binding]:
+            produced = 0
+            kept = 0
+            try:
+                for row in source():
+                    produced += 1
+                    if all(check(row) for check in checks):
+                        kept += 1
+                        yield row
+            finally:
+                leaf.rows = (leaf.rows or 0) + produced
+                if counter is not None:
+                    counter.rows = (counter.rows or 0) + kept
+
+        return rows
+
+
+def _is_edge(value: Any) -> bool:
+    return hasattr(value, "source") and hasattr(value, "target")
+
+
+def _property(value: Any, key: str) -> Any:
+    if key == "id" and not _is_edge(value):
+        return value.id
+    return value.properties.get(key)
+
+
+def _sort_bindings(rows: Iterable[Binding], order_by: Sequence[Tuple[str, str | None, bool]]) -> List[Binding]:
+    ordered = list(rows)
+    # Stable sorts applied from the last key to the first give a multi-key ordering.
+    for var, key, descending in reversed(order_by):
+        ordered.sort(key=lambda row: _sort_key(row[var], key), reverse=descending)
+    return ordered
+
+
+def _sort_key(value: Any, key: str | None) -> Tuple[int, int, Any]:
+    if key is not None:
+        actual = _property(value, key)
+    elif _is_edge(value):
+        actual = f"{value.source}\x00{value.type}\x00{value.target}"
+    else:
+        actual = value.id
+    if actual is None:
+        return (1, 0, 0)
+    if isinstance(actual, str):
+        return (0, 0, actual)
+    if isinstance(actual, bool):
+        return (0, 1, actual)
+    if isinstance(actual, (int, float)):
+        return (0, 2, actual)
+    return (0, 3, str(actual))
+
+
+def _evaluate(predicate: _Predicate, value: Any) -> bool:
+    actual = _property(value, predicate.key)
+    op = predicate.op
+    if op == "IS NULL":
+        return actual is None
+    if op == "IS NOT NULL":
+        return actual is not None
+    expected = predicate.value
+    if actual is None or expected is None:
+        return False
+    if op == "=":
+        return actual == expected or (predicate.key == "id" and str(actual) == str(expected))
+    if op == "<>":
+        return actual != expected
+    if op == "IN":
+        return actual in expected
+    if op in {"CONTAINS", "STARTS WITH", "ENDS WITH"}:
+        if not isinstance(actual, str) or not isinstance(expected, str):
+            return False
+        if op == "CONTAINS":
+            return expected in actual
+        return actual.startswith(expected) if op == "STARTS WITH" else actual.endswith(expected)
+    try:
+        if op == "<":
+            return actual < expected
+        if op == "<=":
+            return actual <= expected
+        if op == ">":
+            return actual > expected
+        return actual >= expected
+    except TypeError:
+        return False
+
+
+__all__ = ["CypherNotSupported", "CypherPlan", "MemoryGraphIndexes", "PlanStep", "plan_cypher"]
@@ -10,7 +10,7 @@ from hashlib import sha256
 from pathlib import Path
 from threading import Lock
 from time import perf_counter
-from typing import Any, Dict, List, Sequence, Set, Tuple
+from typing import Any, Dict, Iterator, List, Sequence, Set, Tuple
 from uuid import uuid4
 
 from fastapi import HTTPException, status
@@ -25,13 +25,14 @@ from ..models.api import IngestionRequest, IngestionSource
 from ..security.authz import Principal
 from ..storage.document_store import DocumentStore
 from ..storage.job_store import JobStore
+from ..storage.keyword_index import KeywordIndex, get_keyword_index
 from ..storage.timeline_store import TimelineEvent, TimelineStore
 from ..utils.audit import AuditEvent, get_audit_trail
 from ..utils.credentials import CredentialRegistry
 from ..utils.text import find_dates, sentence_containing
 from ..utils.triples import EntitySpan, Triple, normalise_entity_id
 from .forensics import ForensicsReport, ForensicsService
-from .graph import GraphService, get_graph_service
+from .graph import GraphBatchWriter, GraphService, get_graph_service
 from .ingestion_sources import MaterializedSource, build_connector
 from .ingestion_worker import (
     IngestionJobAlreadyQueued,
@@ -42,9 +43,10 @@ from .ingestion_worker import (
 from .timeline import EnrichmentStats, TimelineService
 from .vector import VectorService, get_vector_service
 from backend.ingestion.metrics import record_job_transition, record_queue_event
+from backend.ingestion.fingerprints import FingerprintManifest
 from backend.ingestion.loader_registry import LoaderRegistry
 from backend.ingestion.ocr import OcrEngine
-from backend.ingestion.pipeline import run_ingestion_pipeline
+from backend.ingestion.pipeline import stream_ingestion_pipeline
 from backend.ingestion.settings import build_runtime_config
 
 _TEXT_EXTENSIONS = {".txt", ".md", ".json", ".log", ".rtf", ".html", ".htm"}
@@ -137,6 +139,7 @@ class IngestionService:
         forensics_service: ForensicsService | None = None,
         executor: ThreadPoolExecutor | None = None,
         worker: IngestionWorker | None = None,
+        keyword_index: KeywordIndex | None = None,
     ) -> None:
         self.logger = LOGGER
         self.settings = get_settings()
@@ -145,6 +148,9 @@ class IngestionService:
         self.timeline_store = timeline_store or TimelineStore(self.settings.timeline_path)
         self.job_store = job_store or JobStore(self.settings.job_store_dir)
         self.document_store = document_store or DocumentStore(self.settings.document_store_dir)
+        self.keyword_index = (
+            keyword_index if keyword_index is not None else get_keyword_index(self.settings.keyword_index_dir)
+        )
         self.forensics_service = forensics_service or ForensicsService()
         self.credential_registry = CredentialRegistry(self.settings.credentials_registry_path)
         self.executor = executor or _DEFAULT_EXECUTOR
@@ -517,8 +523,11 @@ class IngestionService:
         if all_events:
             self.timeline_store.append(all_events)
         enrichment_stats = self._refresh_timeline_enrichments()
-        community_summary = self.graph_service.compute_community_summary(graph_nodes)
-        job_record["status_details"].setdefault("graph", {})["communities"] = community_summary.to_dict()
+        # Community detection and centrality rankings run off the job's critical path;
+        # readers serve the last completed results until the refreshes land.
+        self.graph_service.schedule_community_refresh()
+        self.graph_service.schedule_rankings_refresh()
+        job_record["status_details"].setdefault("graph", {})["communities"] = self.graph_service.community_status()
         timeline_details = job_record["status_details"].setdefault("timeline", {"events": 0})
         timeline_details["highlights"] = enrichment_stats.highlights
         timeline_details["relations"] = enrichment_stats.relations
@@ -667,127 +676,141 @@ class IngestionService:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Source path {root} not found")
         origin = materialized.origin or str(root)
         source_type = materialized.source.type.lower()
-        pipeline_result = run_ingestion_pipeline(
+        documents: List[IngestedDocument] = []
+        events: List[TimelineEvent] = []
+        skipped: List[Dict[str, str]] = []
+        manifest = self._fingerprint_manifest(materialized)
+        # Documents arrive embedded and in source order; committing each before pulling the
+        # next keeps only the pipeline window resident instead of the whole source.
+        pipeline_documents = stream_ingestion_pipeline(
             job_id,
             root,
             materialized.source,
             origin,
             registry=self.loader_registry,
             runtime_config=self.runtime_config,
+            files=self._changed_files(root, manifest, skipped) if manifest is not None else None,
         )
-
-        documents: List[IngestedDocument] = []
-        events: List[TimelineEvent] = []
-        skipped: List[Dict[str, str]] = []
         graph_mutation = GraphMutation()
         reports: List[ForensicsReport] = []
+        # Leaving the block flushes even when a later document fails, so graph writes for
+        # documents whose checksum is already stored are never dropped.
+        with self.graph_service.batch_writer(
+            self.runtime_config.tuning.graph_batch_size
+        ) as graph_writer:
+            for doc_result in pipeline_documents:
+                path = doc_result.loaded.path
+                checksum = doc_result.loaded.checksum
+                doc_id = sha256_id(path)
+                if self._document_checksum_matches(doc_id, checksum):
+                    skipped.append(
+                        {
+                            "path": str(path),
+                            "reason": "unchanged_checksum",
+                        }
+                    )
+                    self.logger.info(
+                        "Skipping document with unchanged checksum",
+                        extra={"doc_id": doc_id, "path": str(path)},
+                    )
+                    if manifest is not None:
+                        manifest.commit(path)
+                    continue
 
-        for doc_result in pipeline_result.documents:
-            path = doc_result.loaded.path
-            checksum = doc_result.loaded.checksum
-            doc_id = sha256_id(path)
-            if self._document_checksum_matches(doc_id, checksum):
-                skipped.append(
+                doc_type = self._infer_doc_type(path)
+                metadata = dict(doc_result.loaded.metadata)
+                metadata.update(
                     {
-                        "path": str(path),
-                        "reason": "unchanged_checksum",
+                        "checksum_sha256": checksum,
+                        "chunk_count": len(doc_result.nodes),
+                        "embedding_model": self.runtime_config.embedding.model,
+                        "embedding_provider": self.runtime_config.embedding.provider.value,
+                        "ocr_engine": doc_result.loaded.ocr.engine if doc_result.loaded.ocr else None,
+                        "ocr_confidence": doc_result.loaded.ocr.confidence if doc_result.loaded.ocr else None,
                     }
                 )
-                self.logger.info(
-                    "Skipping document with unchanged checksum",
-                    extra={"doc_id": doc_id, "path": str(path)},
+
+                document = self._register_document(
+                    path,
+                    doc_type=doc_type,
+                    origin=origin,
+                    source_type=source_type,
+                    extra_metadata=metadata,
+                    checksum=checksum,
                 )
-                continue
+                graph_mutation.record_node(document.id)
 
-            doc_type = self._infer_doc_type(path)
-            metadata = dict(doc_result.loaded.metadata)
-            metadata.update(
-                {
-                    "checksum_sha256": checksum,
+                entity_pairs = self._entity_pairs(doc_result.entities)
+                metadata_updates: Dict[str, object] = {
+                    "entity_ids": [entity_id for entity_id, _ in entity_pairs],
+                    "entity_labels": [label for _, label in entity_pairs],
                     "chunk_count": len(doc_result.nodes),
-                    "embedding_model": self.runtime_config.embedding.model,
-                    "embedding_provider": self.runtime_config.embedding.provider.value,
-                    "ocr_engine": doc_result.loaded.ocr.engine if doc_result.loaded.ocr else None,
-                    "ocr_confidence": doc_result.loaded.ocr.confidence if doc_result.loaded.ocr else None,
+                    "checksum_sha256": checksum,
                 }
-            )
 
-            document = self._register_document(
-                path,
-                doc_type=doc_type,
-                origin=origin,
-                source_type=source_type,
-                extra_metadata=metadata,
-            )
-            graph_mutation.record_node(document.id)
-
-            entity_pairs = self._entity_pairs(doc_result.entities)
-            metadata_updates: Dict[str, object] = {
-                "entity_ids": [entity_id for entity_id, _ in entity_pairs],
-                "entity_labels": [label for _, label in entity_pairs],
-                "chunk_count": len(doc_result.nodes),
-                "checksum_sha256": checksum,
-            }
-
-            points: List[qmodels.PointStruct] = []
-            node_snapshots: List[Dict[str, Any]] = []
-            for node in doc_result.nodes:
-                payload = {
-                    **node.metadata,
-                    "doc_id": document.id,
-                    "chunk_index": node.chunk_index,
-                    "text": node.text,
-                    "origin": origin,
-                    "source_type": source_type,
-                    "doc_type": doc_type,
-                }
-                embedding_norm = float(np.linalg.norm(node.embedding)) if node.embedding else 0.0
-                payload["embedding_norm"] = embedding_norm
-                points.append(
-                    qmodels.PointStruct(
-                        id=str(uuid4()),
-                        vector=list(node.embedding),
-                        payload=payload,
-                    )
-                )
-                node_snapshots.append(
-                    {
-                        "node_id": node.node_id,
+                points: List[qmodels.PointStruct] = []
+                node_snapshots: List[Dict[str, Any]] = []
+                for node in doc_result.nodes:
+                    payload = {
+                        **node.metadata,
+                        "doc_id": document.id,
                         "chunk_index": node.chunk_index,
                         "text": node.text,
-                        "metadata": node.metadata,
-                        "embedding": list(node.embedding),
+                        "origin": origin,
+                        "source_type": source_type,
+                        "doc_type": doc_type,
                     }
-                )
+                    embedding_norm = float(np.linalg.norm(node.embedding)) if node.embedding else 0.0
+                    payload["embedding_norm"] = embedding_norm
+                    points.append(
+                        qmodels.PointStruct(
+                            id=str(uuid4()),
+                            vector=list(node.embedding),
+                            payload=payload,
+                        )
+                    )
+                    node_snapshots.append(
+                        {
+                            "node_id": node.node_id,
+                            "chunk_index": node.chunk_index,
+                            "text": node.text,
+                            "metadata": node.metadata,
+                            "embedding": list(node.embedding),
+                        }
+                    )
 
-            if points:
-                self.vector_service.upsert(points)
+                if points:
+                    self.vector_service.upsert(points)
 
-            for span in doc_result.entities:
-                self._commit_entity(document.id, span, graph_mutation)
+                for span in doc_result.entities:
+                    self._commit_entity(graph_writer, document.id, span, graph_mutation)
 
-            self._commit_triples(document.id, doc_result.triples, graph_mutation)
-            timeline_events = self._build_timeline_events(document.id, doc_result.loaded.text)
-            events.extend(timeline_events)
-            metadata_updates["timeline_events"] = len(timeline_events)
+                self._commit_triples(graph_writer, document.id, doc_result.triples, graph_mutation)
+                timeline_events = self._build_timeline_events(document.id, doc_result.loaded.text)
+                events.extend(timeline_events)
+                metadata_updates["timeline_events"] = len(timeline_events)
 
-            if doc_result.loaded.ocr and doc_result.loaded.ocr.tokens:
-                metadata_updates["ocr_token_count"] = len(doc_result.loaded.ocr.tokens)
+                if doc_result.loaded.ocr and doc_result.loaded.ocr.tokens:
+                    metadata_updates["ocr_token_count"] = len(doc_result.loaded.ocr.tokens)
 
-            self._update_document_metadata(document.id, metadata_updates)
+                self._update_document_metadata(document.id, metadata_updates)
 
-            report = self._build_forensics_report(
-                doc_type,
-                document.id,
-                path,
-                nodes=node_snapshots,
-                ingestion_metadata=metadata,
-            )
-            if report is not None:
-                reports.append(report)
+                report = self._build_forensics_report(
+                    doc_type,
+                    document.id,
+                    path,
+                    nodes=node_snapshots,
+                    ingestion_metadata=metadata,
+                )
+                if report is not None:
+                    reports.append(report)
 
-            documents.append(document)
+                documents.append(document)
+                if manifest is not None:
+                    manifest.commit(path)
 
+        if manifest is not None:
+            manifest.save()
         documents.sort(
             key=lambda item: (
                 item.metadata.get("ocr_confidence") is not None,
@@ -797,14 +820,16 @@ class IngestionService:
         )
         return documents, events, skipped, graph_mutation, reports
 
-    def _commit_entity(self, doc_id: str, span: EntitySpan, mutation: GraphMutation) -> None:
+    def _commit_entity(
+        self, writer: GraphBatchWriter, doc_id: str, span: EntitySpan, mutation: GraphMutation
+    ) -> None:
         entity_id = normalise_entity_id(span.label)
         properties: Dict[str, object] = {
             "label": span.label,
             "type": span.entity_type,
         }
-        self.graph_service.upsert_entity(entity_id, span.entity_type, properties)
-        self.graph_service.merge_relation(
+        writer.upsert_entity(entity_id, span.entity_type, properties)
+        writer.merge_relation(
             doc_id,
             "MENTIONS",
             entity_id,
@@ -818,12 +843,12 @@ class IngestionService:
         mutation.record_edge(doc_id, "MENTIONS", entity_id, doc_id)
 
     def _commit_triples(
-        self, doc_id: str, triples: List[Triple], mutation: GraphMutation
+        self, writer: GraphBatchWriter, doc_id: str, triples: List[Triple], mutation: GraphMutation
     ) -> None:
         for triple in triples:
             subject_id = normalise_entity_id(triple.subject.label)
             object_id = normalise_entity_id(triple.obj.label)
-            self.graph_service.upsert_entity(
+            writer.upsert_entity(
                 subject_id,
                 triple.subject.entity_type,
                 {
@@ -831,7 +856,7 @@ class IngestionService:
                     "type": triple.subject.entity_type,
                 },
             )
-            self.graph_service.upsert_entity(
+            writer.upsert_entity(
                 object_id,
                 triple.obj.entity_type,
                 {
@@ -839,7 +864,7 @@ class IngestionService:
                     "type": triple.obj.entity_type,
                 },
             )
-            self.graph_service.merge_relation(
+            writer.merge_relation(
                 subject_id,
                 triple.predicate,
                 object_id,
@@ -863,13 +888,14 @@ class IngestionService:
         origin: str,
         source_type: str,
         extra_metadata: Dict[str, object] | None = None,
+        checksum: str | None = None,
     ) -> IngestedDocument:
         doc_id = sha256_id(path)
         title = path.stem.replace("_", " ").title()
         uri = str(path.resolve())
         mime_type, _ = mimetypes.guess_type(path.name)
         size_bytes = path.stat().st_size
-        checksum = sha256_file(path)
+        checksum = checksum or sha256_file(path)
         metadata: Dict[str, object] = {
             "name": path.name,
             "mime_type": mime_type,
@@ -884,14 +910,13 @@ class IngestionService:
         if extra_metadata:
             metadata.update(extra_metadata)
         self.graph_service.upsert_document(doc_id, title, metadata)
-        self.document_store.write_document(
-            doc_id,
-            {
-                "id": doc_id,
-                "title": title,
-                **metadata,
-            },
-        )
+        record = {
+            "id": doc_id,
+            "title": title,
+            **metadata,
+        }
+        self.document_store.write_document(doc_id, record)
+        self.keyword_index.index_document(doc_id, record)
         return IngestedDocument(id=doc_id, uri=uri, type=doc_type, title=title, metadata=metadata)
 
     def _update_document_metadata(self, doc_id: str, updates: Dict[str, object]) -> None:
@@ -901,10 +926,35 @@ class IngestionService:
             record = {"id": doc_id}
         merged = {**record, **updates}
         self.document_store.write_document(doc_id, merged)
+        self.keyword_index.index_document(doc_id, merged)
         title = str(merged.get("title", doc_id))
         metadata = {key: value for key, value in merged.items() if key not in {"id", "title"}}
         self.graph_service.upsert_document(doc_id, title, metadata)
 
+    def _fingerprint_manifest(self, materialized: MaterializedSource) -> FingerprintManifest | None:
+        if self.loader_registry.is_remote(materialized.source):
+            return None
+        root = materialized.root.resolve()
+        # Connectors that copy into a per-job workspace yield fresh paths on every run, so
+        # only sources ingested in place benefit from remembered fingerprints.
+        if root.is_relative_to(self.settings.ingestion_workspace_dir.resolve()):
+            return None
+        manifest_path = self.runtime_config.llama_cache_dir / "fingerprints" / f"{sha256_id(root)}.json"
+        return FingerprintManifest(manifest_path, root)
+
+    def _changed_files(
+        self, root: Path, manifest: FingerprintManifest, skipped: List[Dict[str, str]]
+    ) -> Iterator[Tuple[Path, str]]:
+        for path in self.loader_registry.iter_workspace_paths(root):
+            fingerprint, unchanged = manifest.check(path)
+            # The manifest lives apart from the document store, so a reset or repointed
+            # store must not leave manifest hits un-ingested.
+            if unchanged and self._document_checksum_matches(sha256_id(path), fingerprint.sha256):
+                skipped.append({"path": str(path), "reason": "unchanged_fingerprint"})
+                self.logger.debug("Skipping unchanged file before load", extra={"path": str(path)})
+                continue
+            yield path, fingerprint.sha256
+
     def _document_checksum_matches(self, doc_id: str, checksum: str) -> bool:
         try:
             record = self.document_store.read_document(doc_id)
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+import hashlib
 import json
+import logging
 import re
+import shutil
 import time
 from dataclasses import dataclass
 from functools import lru_cache
 from pathlib import Path
-from threading import Lock
+from threading import Thread
 from time import perf_counter
 from typing import Callable, Dict, Iterable, List, Sequence
 
@@ -26,6 +29,7 @@ from backend.ingestion.settings import build_runtime_config
 
 _tracer = trace.get_tracer(__name__)
 _meter = metrics.get_meter(__name__)
+_logger = logging.getLogger(__name__)
 
 _knowledge_search_counter = _meter.create_counter(
     "knowledge_search_total",
@@ -54,10 +58,12 @@ _knowledge_progress_counter = _meter.create_counter(
 )
 
 try:  # pragma: no cover - optional dependency guard
-    from llama_index.core import Document, VectorStoreIndex
+    from llama_index.core import Document, StorageContext, VectorStoreIndex, load_index_from_storage
 except ModuleNotFoundError:  # pragma: no cover - fallback when llama-index missing
     Document = None  # type: ignore
+    StorageContext = None  # type: ignore
     VectorStoreIndex = None  # type: ignore
+    load_index_from_storage = None  # type: ignore
 
 
 @dataclass(frozen=True)
@@ -105,13 +111,17 @@ class KnowledgeService:
     ) -> None:
         self.settings = get_settings()
         self.profile_store = profile_store or KnowledgeProfileStore(self.settings.knowledge_progress_path)
+        self._content_digest = hashlib.sha256()
         self._lessons = self._load_lessons()
         self._filters = self._compute_filters(self._lessons.values())
         self._runtime = build_runtime_config(self.settings)
         configure_global_settings(self._runtime)
         self._embedding_model = create_embedding_model(self._runtime.embedding)
-        self._index_lock = Lock()
-        self._index = self._build_index(self._lessons)
+        self._section_refs, self._section_postings = self._build_token_index(self._lessons)
+        self._index_root = Path(self.settings.knowledge_index_dir)
+        self._index_hash = self._catalog_hash()
+        self._rebuild_thread: Thread | None = None
+        self._index = self._open_index()
         self._graph_service: GraphService | None = graph_service
         if graph_service_factory is None and graph_service is None:
             graph_service_factory = get_graph_service
@@ -143,7 +153,9 @@ class KnowledgeService:
         catalog_path = Path(self.settings.knowledge_catalog_path)
         if not catalog_path.exists():
             raise FileNotFoundError(f"Knowledge catalog {catalog_path} missing")
-        catalog_payload = json.loads(catalog_path.read_text())
+        catalog_bytes = catalog_path.read_bytes()
+        self._content_digest.update(catalog_bytes)
+        catalog_payload = json.loads(catalog_bytes)
         lessons_payload = catalog_payload.get("lessons", [])
         if not isinstance(lessons_payload, Sequence):
             raise ValueError("Knowledge catalog malformed: `lessons` must be a list")
@@ -183,7 +195,9 @@ class KnowledgeService:
                 content_path = (catalog_dir / content_path).resolve()
             if not content_path.exists():
                 raise FileNotFoundError(f"Lesson content not found at {content_path}")
-            sections = self._parse_markdown_sections(content_path.read_text(encoding="utf-8"))
+            content_bytes = content_path.read_bytes()
+            self._content_digest.update(lesson_id.encode("utf-8") + b"\0" + content_bytes)
+            sections = self._parse_markdown_sections(content_bytes.decode("utf-8"))
             lessons[lesson_id] = KnowledgeLesson(
                 lesson_id=lesson_id,
                 title=title or lesson_id.replace("-", " ").title(),
@@ -214,6 +228,110 @@ class KnowledgeService:
             sections.append(KnowledgeLessonSection(section_id, title, body))
         return sections
 
+    def _catalog_hash(self) -> str:
+        """Hash of the catalog, every lesson's markdown and the embedding model in use."""
+
+        digest = self._content_digest.copy()
+        embedding = self._runtime.embedding
+        digest.update(f"{embedding.provider.value}:{embedding.model}:{embedding.dimensions}".encode("utf-8"))
+        return digest.hexdigest()
+
+    def _open_index(self):
+        """Load the persisted index for the current content, building it when absent.
+
+        If only an index for older content is on disk it keeps serving searches while the
+        replacement is built and persisted on a background thread.
+        """
+
+        if Document is None or VectorStoreIndex is None:
+            return None
+        current = self._load_persisted_index(self._index_hash)
+        if current is not None:
+            return current
+        pointer = self._index_root / "current.json"
+        previous_hash = None
+        if pointer.exists():
+            try:
+                previous_hash = json.loads(pointer.read_text()).get("hash")
+            except (OSError, ValueError):
+                previous_hash = None
+        stale = self._load_persisted_index(previous_hash) if previous_hash else None
+        if stale is None:
+            index = self._build_index(self._lessons)
+            self._persist_index(index, self._index_hash)
+            return index
+        self._rebuild_thread = Thread(
+            target=self._rebuild_in_background,
+            name="knowledge-index-rebuild",
+            daemon=True,
+        )
+        self._rebuild_thread.start()
+        return stale
+
+    def _rebuild_in_background(self) -> None:
+        try:
+            index = self._build_index(self._lessons)
+            self._persist_index(index, self._index_hash)
+        except Exception:  # pragma: no cover - keep serving the stale index
+            _logger.exception("Knowledge index rebuild failed")
+            return
+        # Searches read ``self._index`` once per query, so rebinding it swaps snapshots atomically.
+        self._index = index
+
+    def _load_persisted_index(self, content_hash: str | None):
+        if not content_hash or StorageContext is None or load_index_from_storage is None:
+            return None
+        persist_dir = self._index_root / content_hash
+        if not (persist_dir / "docstore.json").exists():
+            return None
+        try:
+            storage_context = StorageContext.from_defaults(persist_dir=str(persist_dir))
+            return load_index_from_storage(storage_context, embed_model=self._embedding_model)
+        except Exception:  # pragma: no cover - corrupt persistence falls back to a rebuild
+            _logger.warning("Discarding unreadable knowledge index", extra={"path": str(persist_dir)})
+            return None
+
+    def _persist_index(self, index, content_hash: str) -> None:
+        if index is None:
+            return
+        self._index_root.mkdir(parents=True, exist_ok=True)
+        target = self._index_root / content_hash
+        staging = self._index_root / f".{content_hash}.{time.monotonic_ns()}.tmp"
+        try:
+            index.storage_context.persist(persist_dir=str(staging))
+            if target.exists():
+                shutil.rmtree(target)
+            staging.rename(target)
+            (self._index_root / "current.json").write_text(json.dumps({"hash": content_hash}))
+        except OSError:  # pragma: no cover - persistence is an optimisation only
+            _logger.warning("Unable to persist knowledge index", extra={"path": str(target)})
+            return
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+        for stale in self._index_root.iterdir():
+            if stale.is_dir() and stale.name != content_hash and not stale.name.startswith("."):
+                shutil.rmtree(stale, ignore_errors=True)
+
+    @staticmethod
+    def _tokenize(text: str) -> List[str]:
+        return [token for token in re.split(r"\W+", text.lower()) if token]
+
+    def _build_token_index(
+        self, lessons: Dict[str, KnowledgeLesson]
+    ) -> tuple[List[tuple[KnowledgeLesson, KnowledgeLessonSection]], Dict[str, Dict[int, int]]]:
+        """Postings of ``token -> {section position: occurrences}`` for the fallback search."""
+
+        refs: List[tuple[KnowledgeLesson, KnowledgeLessonSection]] = []
+        postings: Dict[str, Dict[int, int]] = {}
+        for lesson in lessons.values():
+            for section in lesson.sections:
+                position = len(refs)
+                refs.append((lesson, section))
+                for token in self._tokenize(section.markdown):
+                    bucket = postings.setdefault(token, {})
+                    bucket[position] = bucket.get(position, 0) + 1
+        return refs, postings
+
     def _build_index(self, lessons: Dict[str, KnowledgeLesson]):
         if Document is None or VectorStoreIndex is None:
             return None
@@ -478,10 +596,10 @@ class KnowledgeService:
                 if values
             }
             hits: List[KnowledgeSearchHit] = []
-            if self._index is not None:
-                with self._index_lock:
-                    retriever = self._index.as_retriever(similarity_top_k=max(5, limit * 2))
-                    retrieved = retriever.retrieve(query)
+            index = self._index
+            if index is not None:
+                retriever = index.as_retriever(similarity_top_k=max(5, limit * 2))
+                retrieved = retriever.retrieve(query)
                 for node in retrieved:
                     metadata = getattr(node, "metadata", {}) or {}
                     lesson_id = metadata.get("lesson_id")
@@ -513,38 +631,37 @@ class KnowledgeService:
                     if len(hits) >= limit:
                         break
             else:
-                query_tokens = [token for token in re.split(r"\W+", query.lower()) if token]
-                for lesson in self._lessons.values():
-                    for section in lesson.sections:
-                        metadata = {
-                            "tags": [tag.lower() for tag in lesson.tags],
-                            "difficulty": lesson.difficulty.lower(),
-                            "media_types": [item.get("type", "link").lower() for item in lesson.media],
-                        }
-                        if not self._match_filters(metadata, applied_filters):
-                            continue
-                        text = section.markdown.lower()
-                        overlap = sum(text.count(token) for token in query_tokens) or 0
-                        if overlap == 0:
-                            continue
-                        hits.append(
-                            KnowledgeSearchHit(
-                                lesson_id=lesson.lesson_id,
-                                lesson_title=lesson.title,
-                                section_id=section.id,
-                                section_title=section.title,
-                                snippet=self._snippet(section.markdown, query),
-                                score=float(overlap),
-                                tags=lesson.tags,
-                                difficulty=lesson.difficulty,
-                                media=lesson.media,
-                            )
+                overlap: Dict[int, int] = {}
+                for token in self._tokenize(query):
+                    for position, count in self._section_postings.get(token, {}).items():
+                        overlap[position] = overlap.get(position, 0) + count
+                for position in sorted(overlap):
+                    lesson, section = self._section_refs[position]
+                    metadata = {
+                        "tags": [tag.lower() for tag in lesson.tags],
+                        "difficulty": lesson.difficulty.lower(),
+                        "media_types": [item.get("type", "link").lower() for item in lesson.media],
+                    }
+                    if not self._match_filters(metadata, applied_filters):
+                        continue
+                    hits.append(
+                        KnowledgeSearchHit(
+                            lesson_id=lesson.lesson_id,
+                            lesson_title=lesson.title,
+                            section_id=section.id,
+                            section_title=section.title,
+                            snippet=self._snippet(section.markdown, query),
+                            score=float(overlap[position]),
+                            tags=lesson.tags,
+                            difficulty=lesson.difficulty,
+                            media=lesson.media,
                         )
+                    )
 
             elapsed = (perf_counter() - start) * 1000.0
             hits.sort(key=lambda hit: hit.score, reverse=True)
             trimmed = hits[:limit]
-            attributes = {"has_index": self._index is not None, "filters": bool(filters)}
+            attributes = {"has_index": index is not None, "filters": bool(filters)}
             _knowledge_search_duration.record(elapsed, attributes=attributes)
             _knowledge_search_counter.add(1, attributes=attributes)
             span.set_attribute("knowledge.elapsed_ms", elapsed)
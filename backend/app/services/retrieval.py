@@ -4,11 +4,13 @@ import json
 import logging
 import math
 import re
+import threading
+from contextlib import nullcontext
 from dataclasses import dataclass, field
 from enum import Enum
 from itertools import zip_longest
 from time import perf_counter
-from typing import Any, Callable, Dict, Iterable, Iterator, List, Set, Tuple
+from typing import Any, Callable, ContextManager, Dict, Iterable, Iterator, List, Set, Tuple
 from urllib.parse import urljoin
 
 try:  # pragma: no cover - optional dependency for vector retrieval
@@ -55,6 +57,7 @@ from ..security.privilege_policy import (
     get_privilege_policy_engine,
 )
 from ..storage.document_store import DocumentStore
+from ..storage.keyword_index import get_keyword_index
 from ..storage.timeline_store import TimelineStore
 from ..utils.triples import extract_entities, normalise_entity_id
 from .forensics import ForensicsService, get_forensics_service
@@ -124,6 +127,31 @@ class RetrievalMode(str, Enum):
     RECALL = "recall"
 
 
+class _PooledClient:
+    """Lazily opened ``httpx.Client`` shared across searches to reuse connections."""
+
+    def __init__(self, timeout: float) -> None:
+        self.timeout = timeout
+        self._client: httpx.Client | None = None
+        self._lock = threading.Lock()
+
+    def open(self) -> httpx.Client:
+        with self._lock:
+            if self._client is None or self._client.is_closed:
+                self._client = httpx.Client(timeout=self.timeout)
+            return self._client
+
+    def session(self) -> ContextManager[httpx.Client]:
+        # ``nullcontext`` keeps adapters' ``with`` blocks from closing the shared pool.
+        return nullcontext(self.open())
+
+    def close(self) -> None:
+        with self._lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
+
+
 class CourtListenerCaseLawAdapter:
     """Lightweight CourtListener client that emits scored opinion payloads."""
 
@@ -141,7 +169,14 @@ class CourtListenerCaseLawAdapter:
         self.endpoint = endpoint.rstrip("/") + "/"
         self.token = token
         self.timeout = timeout
-        self._client_factory = client_factory or (lambda: httpx.Client(timeout=self.timeout))
+        self._pool = _PooledClient(timeout)
+        self._client_factory = client_factory or self._pool.session
+
+    def open(self) -> None:
+        self._pool.open()
+
+    def close(self) -> None:
+        self._pool.close()
 
     def search(self, query: str, *, limit: int) -> List[qmodels.ScoredPoint]:
         if not query.strip() or limit <= 0:
@@ -253,7 +288,14 @@ class CaseLawApiAdapter:
         self.api_key = api_key
         self.timeout = timeout
         self.max_results = max_results
-        self._client_factory = client_factory or (lambda: httpx.Client(timeout=self.timeout))
+        self._pool = _PooledClient(timeout)
+        self._client_factory = client_factory or self._pool.session
+
+    def open(self) -> None:
+        self._pool.open()
+
+    def close(self) -> None:
+        self._pool.close()
 
     def search(self, query: str, *, limit: int) -> List[qmodels.ScoredPoint]:
         if not query.strip() or limit <= 0 or self.max_results == 0:
@@ -497,9 +539,15 @@ class RetrievalService:
         cross_encoder_model = getattr(self.settings, "retrieval_cross_encoder_model", None)
         self.query_engine = HybridQueryEngine(
             VectorRetrieverAdapter(self.vector_service, self.embedding_model),
-            GraphRetrieverAdapter(self.graph_service),
-            KeywordRetrieverAdapter(self.document_store),
+            GraphRetrieverAdapter(self.graph_service, max_hops=self.settings.retrieval_graph_max_hops),
+            KeywordRetrieverAdapter(self.document_store, get_keyword_index(self.settings.keyword_index_dir)),
             cross_encoder_model=cross_encoder_model,
+            retriever_timeouts={
+                "vector": self.settings.retrieval_vector_timeout_seconds,
+                "graph": self.settings.retrieval_graph_timeout_seconds,
+                "keyword": self.settings.retrieval_keyword_timeout_seconds,
+            },
+            max_concurrent_queries=self.settings.retrieval_concurrent_queries,
         )
         self.courtlistener_adapter = CourtListenerCaseLawAdapter(
             self.settings.courtlistener_endpoint,
@@ -511,6 +559,43 @@ class RetrievalService:
             max_results=self.settings.caselaw_max_results,
         )
 
+    def warm_up(self) -> Dict[str, float]:
+        """Load models and open pools so the first real query pays no start-up cost.
+
+        Returns the time spent per stage in milliseconds.
+        """
+
+        timings: Dict[str, float] = {}
+        started = perf_counter()
+        self.query_engine.vector.retrieve("warm-up", top_k=1)
+        timings["embedding_ms"] = (perf_counter() - started) * 1000.0
+
+        started = perf_counter()
+        self.query_engine.warm_up()
+        timings["cross_encoder_ms"] = (perf_counter() - started) * 1000.0
+
+        started = perf_counter()
+        self.query_engine.retrieve(
+            "warm-up",
+            top_k=1,
+            vector_window=1,
+            graph_window=1,
+            keyword_window=1,
+            use_cross_encoder=False,
+        )
+        timings["hybrid_ms"] = (perf_counter() - started) * 1000.0
+
+        started = perf_counter()
+        self.courtlistener_adapter.open()
+        self.caselaw_adapter.open()
+        timings["http_pools_ms"] = (perf_counter() - started) * 1000.0
+        _logger.info("Retrieval service warmed", extra={"timings_ms": timings})
+        return timings
+
+    def close(self) -> None:
+        self.courtlistener_adapter.close()
+        self.caselaw_adapter.close()
+
     def query(
         self,
         question: str,
@@ -602,6 +687,12 @@ class RetrievalService:
                 hybrid_span.set_attribute("retrieval.keyword_candidates", len(bundle.keyword_points))
                 hybrid_span.set_attribute("retrieval.fused_candidates", len(bundle.fused_points))
                 hybrid_span.set_attribute("retrieval.reranker", bundle.reranker)
+                timed_out = getattr(bundle, "timed_out_retrievers", [])
+                hybrid_span.set_attribute("retrieval.timed_out_retrievers", list(timed_out))
+                for retriever_name, latency_ms in getattr(bundle, "retriever_latency_ms", {}).items():
+                    hybrid_span.set_attribute(f"retrieval.{retriever_name}.latency_ms", latency_ms)
+                for retriever_name in timed_out:
+                    hybrid_span.add_event("retrieval.retriever_timeout", {"retriever": retriever_name})
 
             with _tracer.start_as_current_span("retrieval.external_case_law") as external_span:
                 external_points = self._retrieve_external_case_law(
@@ -1418,6 +1509,7 @@ class RetrievalService:
             community.to_dict()
             for community in self.graph_service.communities_for_nodes(node_map.keys())
         ]
+        graph_trace["community_status"] = self.graph_service.community_status()
         graph_trace.setdefault("events", [])
         privilege_trace, privilege_decisions = self._build_privilege_trace(results)
         trace = Trace(
@@ -1824,6 +1916,37 @@ class RetrievalService:
         return _iterator()
 
 
+_RETRIEVAL_SERVICE: RetrievalService | None = None
+_RETRIEVAL_SERVICE_LOCK = threading.Lock()
+
+
 def get_retrieval_service() -> RetrievalService:
-    return RetrievalService()
+    """Return the process-wide retrieval service, building it on first use.
+
+    FastAPI resolves sync dependencies on a thread pool, so construction is guarded to
+    avoid concurrent first requests each loading models.
+    """
+
+    global _RETRIEVAL_SERVICE  # noqa: PLW0603
+    if _RETRIEVAL_SERVICE is None:
+        with _RETRIEVAL_SERVICE_LOCK:
+            if _RETRIEVAL_SERVICE is None:
+                _RETRIEVAL_SERVICE = RetrievalService()
+    return _RETRIEVAL_SERVICE
+
+
+def warm_retrieval_service() -> None:
+    service = get_retrieval_service()
+    try:
+        service.warm_up()
+    except Exception:  # pragma: no cover - warm-up must never block start-up
+        _logger.exception("Retrieval service warm-up failed")
+
+
+def reset_retrieval_service() -> None:
+    global _RETRIEVAL_SERVICE  # noqa: PLW0603
+    with _RETRIEVAL_SERVICE_LOCK:
+        if _RETRIEVAL_SERVICE is not None:
+            _RETRIEVAL_SERVICE.close()
+        _RETRIEVAL_SERVICE = None
 
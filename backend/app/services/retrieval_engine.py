@@ -2,12 +2,17 @@ from __future__ import annotations
 
 import math
 import re
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from dataclasses import dataclass, field
-from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
 
 from qdrant_client.http import models as qmodels
 
 from ..storage.document_store import DocumentStore
+from ..storage.keyword_index import KeywordIndex
 from ..utils.triples import extract_entities, normalise_entity_id
 from .graph import GraphEdge, GraphNode, GraphService
 from .vector import VectorService
@@ -38,6 +43,37 @@ class HybridRetrievalBundle:
     reranker: str
     fusion_scores: Dict[str, float]
     external_points: List[qmodels.ScoredPoint] = field(default_factory=list)
+    timed_out_retrievers: List[str] = field(default_factory=list)
+    retriever_latency_ms: Dict[str, float] = field(default_factory=dict)
+
+
+_RETRIEVER_POOL: ThreadPoolExecutor | None = None
+_RETRIEVER_POOL_WORKERS = 0
+_RETRIEVER_POOL_LOCK = threading.Lock()
+_RETRIEVERS_PER_QUERY = 3
+
+
+def _retriever_pool(max_workers: int) -> ThreadPoolExecutor:
+    """Process-wide pool shared by every engine so per-query fan-out does not spawn threads.
+
+    When an engine asks for more workers than the pool has, a larger pool replaces it.
+    The old pool is never shut down, since another thread may still be submitting to it;
+    its workers exit once it has drained and nothing references it.
+    """
+
+    global _RETRIEVER_POOL, _RETRIEVER_POOL_WORKERS
+    pool = _RETRIEVER_POOL
+    if pool is None or _RETRIEVER_POOL_WORKERS < max_workers:
+        with _RETRIEVER_POOL_LOCK:
+            pool = _RETRIEVER_POOL
+            if pool is None or _RETRIEVER_POOL_WORKERS < max_workers:
+                pool = ThreadPoolExecutor(
+                    max_workers=max_workers,
+                    thread_name_prefix="hybrid-retriever",
+                )
+                _RETRIEVER_POOL = pool
+                _RETRIEVER_POOL_WORKERS = max_workers
+    return pool
 
 
 class VectorRetrieverAdapter:
@@ -58,45 +94,61 @@ class VectorRetrieverAdapter:
 
 
 class GraphRetrieverAdapter:
-    """Emit graph relation statements as scored points."""
+    """Emit graph relation statements as scored points.
+
+    Matched entities seed a single multi-hop expansion; each relation is scored from the
+    hop distance and path weight of its farther endpoint, so nearer and stronger
+    relations rank first.
+    """
+
+    BASE_SCORE = 0.6
 
-    def __init__(self, graph_service: GraphService) -> None:
+    def __init__(self, graph_service: GraphService, *, max_hops: int = 1) -> None:
         self.graph_service = graph_service
+        self.max_hops = max(1, int(max_hops))
 
     def retrieve(self, query: str, *, top_k: int) -> Tuple[List[qmodels.ScoredPoint], List[Tuple[str, str | None]]]:
         entities = self.graph_service.search_entities(query, limit=top_k)
         if not entities:
             entities = self._entities_from_question(query, limit=top_k)
+        expansion = self.graph_service.expand(
+            [entity.id for entity in entities[:top_k]],
+            max_hops=self.max_hops,
+            edge_limit=top_k * 2,
+        )
+        node_map: Dict[str, GraphNode] = dict(expansion.nodes)
         relation_statements: List[Tuple[str, str | None]] = []
         points: List[qmodels.ScoredPoint] = []
-        for entity in entities[:top_k]:
-            subgraph = self.graph_service.subgraph([entity.id])
-            node_map: Dict[str, GraphNode] = dict(subgraph.nodes)
-            for edge in subgraph.edges.values():
-                statement = _format_relation_statement(edge, node_map)
-                if not statement:
-                    continue
-                doc_id_raw = edge.properties.get("doc_id")
-                doc_id = str(doc_id_raw) if doc_id_raw is not None else None
-                relation_statements.append((statement, doc_id))
-                point_id = f"graph::{edge.source}::{edge.type}::{edge.target}::{doc_id or 'unknown'}"
-                payload = {
-                    "doc_id": doc_id,
-                    "text": statement,
-                    "relation_type": edge.type,
-                    "source_type": edge.properties.get("source_type", "graph"),
-                    "entity_ids": [edge.source, edge.target],
-                    "entity_labels": _entity_labels(edge, node_map),
-                    "retriever": "graph",
-                }
-                points.append(
-                    qmodels.ScoredPoint(
-                        id=point_id,
-                        score=0.6,
-                        payload=payload,
-                        version=1,
-                    )
+        for edge in expansion.edges.values():
+            statement = _format_relation_statement(edge, node_map)
+            if not statement:
+                continue
+            doc_id_raw = edge.properties.get("doc_id")
+            doc_id = str(doc_id_raw) if doc_id_raw is not None else None
+            relation_statements.append((statement, doc_id))
+            point_id = f"graph::{edge.source}::{edge.type}::{edge.target}::{doc_id or 'unknown'}"
+            far = max((edge.source, edge.target), key=lambda node_id: expansion.hops.get(node_id, 0))
+            hops = max(1, expansion.hops.get(far, 1))
+            payload = {
+                "doc_id": doc_id,
+                "text": statement,
+                "relation_type": edge.type,
+                "source_type": edge.properties.get("source_type", "graph"),
+                "entity_ids": [edge.source, edge.target],
+                "entity_labels": _entity_labels(edge, node_map),
+                "retriever": "graph",
+                "hops": hops,
+                "path_weight": expansion.weights.get(far, 1.0),
+            }
+            points.append(
+                qmodels.ScoredPoint(
+                    id=point_id,
+                    score=self.BASE_SCORE * expansion.weights.get(far, 1.0) / hops,
+                    payload=payload,
+                    version=1,
                 )
+            )
+        points.sort(key=lambda point: point.score, reverse=True)
         return points[:top_k], relation_statements[: top_k * 2]
 
     def _entities_from_question(self, query: str, limit: int) -> List[GraphNode]:
@@ -118,39 +170,18 @@ class GraphRetrieverAdapter:
 
 
 class KeywordRetrieverAdapter:
-    """Keyword/BM25-style scoring using document metadata stored locally."""
-
-    _TOKEN_RE = re.compile(r"[A-Za-z0-9']+")
+    """BM25 keyword scoring over document metadata via a persistent inverted index."""
 
-    def __init__(self, document_store: DocumentStore) -> None:
+    def __init__(self, document_store: DocumentStore, keyword_index: KeywordIndex) -> None:
         self.document_store = document_store
+        self.keyword_index = keyword_index
+        self._bootstrapped = False
 
     def retrieve(self, query: str, *, top_k: int) -> List[qmodels.ScoredPoint]:
-        tokens = {token.lower() for token in self._TOKEN_RE.findall(query)}
-        if not tokens:
-            return []
-        scored: List[Tuple[float, Dict[str, object]]] = []
-        for document in self.document_store.list_documents():
-            doc_tokens = self._document_tokens(document)
-            overlap = tokens & doc_tokens
-            if not overlap:
-                continue
-            title = str(document.get("title", document.get("name", "")))
-            snippet = document.get("summary") or title
-            payload = {
-                "doc_id": document.get("id"),
-                "text": str(snippet),
-                "title": title,
-                "source_type": document.get("source_type"),
-                "retriever": "keyword",
-                "entity_labels": document.get("entity_labels", []),
-                "entity_ids": document.get("entity_ids", []),
-            }
-            score = self._score(tokens, doc_tokens, len(snippet or ""))
-            scored.append((score, payload))
-        scored.sort(key=lambda item: item[0], reverse=True)
+        self._ensure_bootstrapped()
         points: List[qmodels.ScoredPoint] = []
-        for index, (score, payload) in enumerate(scored[:top_k]):
+        for index, (score, payload) in enumerate(self.keyword_index.search(query, top_k=top_k)):
+            payload["retriever"] = "keyword"
             point_id = f"keyword::{payload.get('doc_id', 'unknown')}::{index}"
             points.append(
                 qmodels.ScoredPoint(
@@ -162,23 +193,18 @@ class KeywordRetrieverAdapter:
             )
         return points
 
-    def _document_tokens(self, document: Dict[str, object]) -> set[str]:
-        corpus_parts: List[str] = []
-        for key in ("title", "summary", "description"):
-            value = document.get(key)
-            if isinstance(value, str):
-                corpus_parts.append(value)
-        for label in document.get("entity_labels", []) or []:
-            corpus_parts.append(str(label))
-        content = " ".join(corpus_parts)
-        return {token.lower() for token in self._TOKEN_RE.findall(content)}
-
-    def _score(self, query_tokens: set[str], doc_tokens: set[str], snippet_length: int) -> float:
-        overlap = len(query_tokens & doc_tokens)
-        if overlap == 0:
-            return 0.0
-        length_penalty = 1.0 if snippet_length <= 0 else min(1.0, 80.0 / float(snippet_length))
-        return overlap * (0.8 + length_penalty * 0.2)
+    def _ensure_bootstrapped(self) -> None:
+        # Deployments that predate the index have records but no postings. Postings added by
+        # ingestion do not cover those records, so rebuild until a full rebuild is recorded.
+        if self._bootstrapped:
+            return
+        self._bootstrapped = True
+        if self.keyword_index.bootstrapped:
+            return
+        list_documents = getattr(self.document_store, "list_documents", None)
+        if list_documents is None:
+            return
+        self.keyword_index.rebuild(list_documents())
 
 
 class HybridQueryEngine:
@@ -192,14 +218,21 @@ class HybridQueryEngine:
         *,
         rrf_constant: float = 60.0,
         cross_encoder_model: str | None = None,
+        retriever_timeouts: Mapping[str, float | None] | None = None,
+        max_concurrent_queries: int = 16,
     ) -> None:
         self.vector = vector
         self.graph = graph
         self.keyword = keyword
         self.rrf_constant = rrf_constant
+        # Per-retriever deadlines in seconds, measured from when the retriever starts running.
+        # ``None`` (or a missing entry) waits for the retriever to finish.
+        self.retriever_timeouts: Dict[str, float | None] = dict(retriever_timeouts or {})
+        self.pool_workers = max(1, int(max_concurrent_queries)) * _RETRIEVERS_PER_QUERY
         self._cross_encoder_model = cross_encoder_model
         self._cross_encoder = None
         self._cross_encoder_error: Exception | None = None
+        self._cross_encoder_lock = threading.Lock()
 
     def retrieve(
         self,
@@ -211,9 +244,16 @@ class HybridQueryEngine:
         keyword_window: int,
         use_cross_encoder: bool,
     ) -> HybridRetrievalBundle:
-        vector_points = self.vector.retrieve(query, top_k=vector_window)
-        graph_points, relation_statements = self.graph.retrieve(query, top_k=graph_window)
-        keyword_points = self.keyword.retrieve(query, top_k=keyword_window)
+        outcomes, timed_out, latencies = self._fan_out(
+            {
+                "vector": lambda: self.vector.retrieve(query, top_k=vector_window),
+                "graph": lambda: self.graph.retrieve(query, top_k=graph_window),
+                "keyword": lambda: self.keyword.retrieve(query, top_k=keyword_window),
+            }
+        )
+        vector_points: List[qmodels.ScoredPoint] = outcomes.get("vector", [])
+        graph_points, relation_statements = outcomes.get("graph", ([], []))
+        keyword_points: List[qmodels.ScoredPoint] = outcomes.get("keyword", [])
         candidates = {
             "vector": vector_points,
             "graph": graph_points,
@@ -235,8 +275,58 @@ class HybridQueryEngine:
             reranker=reranker_label,
             fusion_scores=contributions,
             external_points=[],
+            timed_out_retrievers=timed_out,
+            retriever_latency_ms=latencies,
         )
 
+    def _fan_out(
+        self,
+        calls: Dict[str, Callable[[], Any]],
+    ) -> Tuple[Dict[str, Any], List[str], Dict[str, float]]:
+        """Run retrievers concurrently and collect results that meet their deadline.
+
+        A deadline starts when its retriever begins running, so time queued behind other
+        queries is not charged to it; a retriever still queued after one deadline's worth of
+        waiting is cancelled. A retriever that misses its deadline is left to finish in the
+        background and contributes nothing; exceptions raised by a retriever propagate as
+        before.
+        """
+
+        latencies: Dict[str, float] = {}
+        began_at: Dict[str, float] = {}
+        running: Dict[str, threading.Event] = {name: threading.Event() for name in calls}
+
+        def _timed(name: str, call: Callable[[], Any]) -> Callable[[], Any]:
+            def _run() -> Any:
+                began = perf_counter()
+                began_at[name] = began
+                running[name].set()
+                try:
+                    return call()
+                finally:
+                    latencies[name] = (perf_counter() - began) * 1000.0
+
+            return _run
+
+        pool = _retriever_pool(self.pool_workers)
+        futures: Dict[str, Future] = {name: pool.submit(_timed(name, call)) for name, call in calls.items()}
+        outcomes: Dict[str, Any] = {}
+        timed_out: List[str] = []
+        for name, future in futures.items():
+            deadline = self.retriever_timeouts.get(name)
+            try:
+                if deadline is None:
+                    outcomes[name] = future.result()
+                    continue
+                if not running[name].wait(timeout=deadline):
+                    raise FutureTimeoutError
+                remaining = max(0.0, began_at[name] + deadline - perf_counter())
+                outcomes[name] = future.result(timeout=remaining)
+            except FutureTimeoutError:
+                future.cancel()
+                timed_out.append(name)
+        return outcomes, timed_out, {name: latencies[name] for name in outcomes if name in latencies}
+
     def _fuse(
         self,
         candidates: Dict[str, List[qmodels.ScoredPoint]],
@@ -270,6 +360,16 @@ class HybridQueryEngine:
             fused_scores[key] = scores[key]
         return fused, fused_scores
 
+    def warm_up(self) -> None:
+        """Load the optional cross-encoder ahead of the first reranked query."""
+
+        reranker = self._ensure_cross_encoder()
+        if reranker is not None:
+            try:
+                reranker.predict([["warm-up", "warm-up"]])
+            except Exception:  # pragma: no cover - prediction failure is handled per query
+                pass
+
     def _ensure_cross_encoder(self):  # pragma: no cover - exercised when dependency available
         if self._cross_encoder_model is None:
             return None
@@ -277,16 +377,19 @@ class HybridQueryEngine:
             return self._cross_encoder
         if self._cross_encoder_error is not None:
             return None
-        try:
-            from sentence_transformers import CrossEncoder  # type: ignore
-        except ModuleNotFoundError as exc:  # pragma: no cover - optional dependency
-            self._cross_encoder_error = exc
-            return None
-        try:
-            self._cross_encoder = CrossEncoder(self._cross_encoder_model)
-        except Exception as exc:  # pragma: no cover - dependency initialisation failure
-            self._cross_encoder_error = exc
-            return None
+        with self._cross_encoder_lock:
+            if self._cross_encoder is not None or self._cross_encoder_error is not None:
+                return self._cross_encoder
+            try:
+                from sentence_transformers import CrossEncoder  # type: ignore
+            except ModuleNotFoundError as exc:  # pragma: no cover - optional dependency
+                self._cross_encoder_error = exc
+                return None
+            try:
+                self._cross_encoder = CrossEncoder(self._cross_encoder_model)
+            except Exception as exc:  # pragma: no cover - dependency initialisation failure
+                self._cross_encoder_error = exc
+                return None
         return self._cross_encoder
 
     def _rerank_with_cross_encoder(
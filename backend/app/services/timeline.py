@@ -10,7 +10,7 @@ from typing import Dict, Iterable, List, Optional, Tuple
 from opentelemetry import metrics
 
 from ..config import get_settings
-from ..storage.timeline_store import TimelineStore, TimelineEvent
+from ..storage.timeline_store import TimelineEvent, TimelineQuery, TimelineStore
 from ..utils.triples import normalise_entity_id
 from .errors import WorkflowAbort, WorkflowComponent, WorkflowError, WorkflowSeverity
 from .graph import GraphNode, GraphService, get_graph_service
@@ -63,8 +63,17 @@ class TimelineService:
     def refresh_enrichments(self) -> EnrichmentStats:
         events = self.store.read_all()
         enriched, stats = self._enrich_events(events)
-        if stats.mutated:
-            self.store.write_all(enriched)
+        self.store.write_all(enriched, enriched=True)
+        return stats
+
+    def _enrich_pending(self) -> EnrichmentStats:
+        """Enrich only events appended since the last pass and mark them as enriched."""
+
+        pending = self.store.pending_enrichment()
+        if not pending:
+            return EnrichmentStats(mutated=False, documents=0, highlights=0, relations=0)
+        enriched, stats = self._enrich_events(pending)
+        self.store.append(enriched, enriched=True)
         return stats
 
     def list_events(
@@ -97,29 +106,21 @@ class TimelineService:
                 status_code=400,
             )
 
-        events = self.store.read_all()
-        enriched_events, stats = self._enrich_events(events)
-        events = enriched_events
-        if stats.mutated:
-            self.store.write_all(events)
-
-        events = self._filter_by_time(events, from_ts, to_ts)
+        stats = self._enrich_pending()
+        criteria = TimelineQuery(
+            from_ts=from_ts,
+            to_ts=to_ts,
+            risk_band=self._normalise_risk_band(risk_band) if risk_band else None,
+            motion_due_before=motion_due_before,
+            motion_due_after=motion_due_after,
+            after=self._decode_cursor(cursor) if cursor else None,
+        )
         if entity:
-            events = self._filter_by_entity(events, entity)
-        if risk_band:
-            events = self._filter_by_risk_band(events, risk_band)
-        if motion_due_before or motion_due_after:
-            events = self._filter_by_motion_deadline(
-                events,
-                due_before=motion_due_before,
-                due_after=motion_due_after,
-            )
-        if cursor:
-            cursor_ts, cursor_id = self._decode_cursor(cursor)
-            events = [event for event in events if self._after_cursor(event, cursor_ts, cursor_id)]
+            criteria = self._entity_criteria(criteria, entity)
 
-        limited = events[:bounded_limit]
-        has_more = len(events) > bounded_limit
+        page = self.store.query(criteria, limit=bounded_limit + 1) if criteria is not None else []
+        limited = page[:bounded_limit]
+        has_more = len(page) > bounded_limit
         next_cursor = self._encode_cursor(limited[-1]) if has_more and limited else None
 
         attributes = {
@@ -145,21 +146,6 @@ class TimelineService:
             raise ValueError("limit must be between 1 and 100")
         return limit
 
-    @staticmethod
-    def _filter_by_time(
-        events: Iterable[TimelineEvent],
-        from_ts: Optional[datetime],
-        to_ts: Optional[datetime],
-    ) -> List[TimelineEvent]:
-        result: List[TimelineEvent] = []
-        for event in events:
-            if from_ts and event.ts < from_ts:
-                continue
-            if to_ts and event.ts > to_ts:
-                continue
-            result.append(event)
-        return result
-
     @staticmethod
     def _ensure_naive_timestamp(value: Optional[datetime], label: str) -> Optional[datetime]:
         if value is None:
@@ -179,29 +165,27 @@ class TimelineService:
             status_code=400,
         )
 
-    def _filter_by_entity(self, events: Iterable[TimelineEvent], entity: str) -> List[TimelineEvent]:
-        doc_ids = self._collect_citations(events)
+    def _entity_criteria(self, criteria: TimelineQuery, entity: str) -> TimelineQuery | None:
+        """Narrow ``criteria`` to events about ``entity``; ``None`` means nothing can match.
+
+        Highlights stored on events are tried first. Only when no event in the time range
+        carries a matching highlight are the cited documents resolved through the graph.
+        """
+
+        time_scope = TimelineQuery(from_ts=criteria.from_ts, to_ts=criteria.to_ts)
+        doc_ids = self.store.citations(time_scope)
         if not doc_ids:
-            return []
+            return None
 
         target_id = normalise_entity_id(entity)
         target_label = entity.lower()
-        filtered: List[TimelineEvent] = []
-
-        for event in events:
-            if any(
-                highlight.get("id") == target_id
-                or target_label in str(highlight.get("label", "")).lower()
-                for highlight in event.entity_highlights
-            ):
-                filtered.append(event)
-
-        if filtered:
-            return filtered
+        highlight_scope = replace(time_scope, entity_id=target_id, entity_label=target_label)
+        if self.store.query(highlight_scope, limit=1):
+            return replace(criteria, entity_id=target_id, entity_label=target_label)
 
         mapping = self.graph_service.document_entities(doc_ids)
         if not mapping:
-            return []
+            return None
 
         allowed_docs: set[str] = set()
         for doc_id, nodes in mapping.items():
@@ -212,9 +196,8 @@ class TimelineService:
                     break
 
         if not allowed_docs:
-            return []
-
-        return [event for event in events if any(citation in allowed_docs for citation in event.citations)]
+            return None
+        return replace(criteria, citations=sorted(allowed_docs))
 
     @staticmethod
     def _collect_citations(events: Iterable[TimelineEvent]) -> List[str]:
@@ -252,14 +235,6 @@ class TimelineService:
             ) from exc
         return timestamp, event_id
 
-    @staticmethod
-    def _after_cursor(event: TimelineEvent, cursor_ts: datetime, cursor_id: str) -> bool:
-        if event.ts > cursor_ts:
-            return True
-        if event.ts < cursor_ts:
-            return False
-        return event.id > cursor_id
-
     def _enrich_events(self, events: List[TimelineEvent]) -> Tuple[List[TimelineEvent], EnrichmentStats]:
         if not events:
             return events, EnrichmentStats(mutated=False, documents=0, highlights=0, relations=0)
@@ -405,9 +380,8 @@ class TimelineService:
             return True
         return left != right
 
-    def _filter_by_risk_band(
-        self, events: Iterable[TimelineEvent], risk_band: str
-    ) -> List[TimelineEvent]:
+    @staticmethod
+    def _normalise_risk_band(risk_band: str) -> str:
         normalized = risk_band.lower()
         if normalized not in {"low", "medium", "high"}:
             raise WorkflowAbort(
@@ -421,25 +395,7 @@ class TimelineService:
                 ),
                 status_code=400,
             )
-        return [event for event in events if (event.risk_band or "").lower() == normalized]
-
-    @staticmethod
-    def _filter_by_motion_deadline(
-        events: Iterable[TimelineEvent],
-        *,
-        due_before: Optional[datetime],
-        due_after: Optional[datetime],
-    ) -> List[TimelineEvent]:
-        filtered: List[TimelineEvent] = []
-        for event in events:
-            if not event.motion_deadline:
-                continue
-            if due_before and event.motion_deadline >= due_before:
-                continue
-            if due_after and event.motion_deadline <= due_after:
-                continue
-            filtered.append(event)
-        return filtered
+        return normalized
 
     def _forecast_risk(
         self,
@@ -1,57 +1,211 @@
 from __future__ import annotations
 
-import math
+import importlib
+import json
+import os
+from pathlib import Path
 from typing import Dict, Iterable, List, Sequence
 
-import importlib
+import numpy as np
 from qdrant_client import QdrantClient
 from qdrant_client.http import models as qmodels
 
 from ..config import get_settings
+from ..utils.storage import atomic_write_json, read_json
 
 
 class InMemoryVectorIndex:
-    """Deterministic cosine-similarity vector index for offline/testing modes."""
+    """Deterministic cosine-similarity vector index for offline/testing modes.
+
+    Vectors live in a single contiguous ``float32`` matrix with precomputed norms so a
+    query is one matrix-vector product followed by partial top-k selection. When a
+    ``storage_dir`` is supplied the matrix is backed by a memory-mapped file and point
+    ids/payloads are journalled alongside it, so restarts reopen the index instead of
+    re-ingesting.
+    """
 
-    def __init__(self, dimensions: int) -> None:
+    _MATRIX_FILE = "vectors.f32"
+    _POINTS_FILE = "points.jsonl"
+    _META_FILE = "meta.json"
+    _INITIAL_CAPACITY = 1024
+
+    def __init__(self, dimensions: int, storage_dir: Path | None = None) -> None:
         self.dimensions = dimensions
-        self._store: Dict[str, tuple[List[float], Dict[str, object]]] = {}
+        self.storage_dir = Path(storage_dir) if storage_dir is not None else None
+        self._ids: List[str] = []
+        self._payloads: List[Dict[str, object]] = []
+        self._positions: Dict[str, int] = {}
+        self._norms = np.zeros(0, dtype=np.float32)
+        self._matrix: np.ndarray = np.zeros((0, dimensions), dtype=np.float32)
+        if self.storage_dir is not None:
+            self.storage_dir.mkdir(parents=True, exist_ok=True)
+            self._load()
+
+    def __len__(self) -> int:
+        return len(self._ids)
 
     def upsert(self, points: Iterable[qmodels.PointStruct]) -> None:
+        journal: List[Dict[str, object]] = []
         for point in points:
-            vector = list(point.vector)
-            if len(vector) != self.dimensions:
+            vector = np.asarray(list(point.vector), dtype=np.float32)
+            if vector.shape != (self.dimensions,):
                 raise ValueError("Vector dimensionality mismatch for in-memory index")
             payload = dict(point.payload or {})
-            self._store[str(point.id)] = (vector, payload)
+            point_id = str(point.id)
+            row = self._positions.get(point_id)
+            if row is None:
+                row = len(self._ids)
+                self._ensure_capacity(row + 1)
+                self._ids.append(point_id)
+                self._payloads.append(payload)
+                self._positions[point_id] = row
+            else:
+                self._payloads[row] = payload
+            self._matrix[row] = vector
+            self._norms[row] = _row_norms(vector[np.newaxis, :])[0]
+            journal.append({"id": point_id, "row": row, "payload": payload})
+        if journal and self.storage_dir is not None:
+            self._persist(journal)
 
     def search(self, vector: Sequence[float], top_k: int) -> List[qmodels.ScoredPoint]:
-        query = list(vector)
-        if len(query) != self.dimensions:
+        query = np.asarray(list(vector), dtype=np.float32)
+        if query.shape != (self.dimensions,):
             raise ValueError("Query dimensionality mismatch for in-memory index")
-        results: List[qmodels.ScoredPoint] = []
-        for point_id, (stored_vector, payload) in self._store.items():
-            score = self._cosine_similarity(query, stored_vector)
-            results.append(
-                qmodels.ScoredPoint(
-                    id=point_id,
-                    score=score,
-                    payload=payload,
-                    version=0,
-                    vector=stored_vector,
-                )
+        count = len(self._ids)
+        if count == 0 or top_k <= 0:
+            return []
+        query_norm = float(_row_norms(query[np.newaxis, :])[0])
+        if query_norm == 0.0:
+            scores = np.zeros(count, dtype=np.float32)
+        else:
+            norms = self._norms[:count]
+            dots = self._matrix[:count] @ query
+            denominator = norms * np.float32(query_norm)
+            scores = np.divide(
+                dots,
+                denominator,
+                out=np.zeros(count, dtype=np.float32),
+                where=denominator != 0.0,
+            )
+        rows = self._top_rows(scores, top_k)
+        return [
+            qmodels.ScoredPoint(
+                id=self._ids[row],
+                score=float(scores[row]),
+                payload=self._payloads[row],
+                version=0,
+                vector=self._matrix[row].tolist(),
             )
-        results.sort(key=lambda item: item.score, reverse=True)
-        return results[:top_k]
+            for row in rows
+        ]
 
     @staticmethod
-    def _cosine_similarity(left: Sequence[float], right: Sequence[float]) -> float:
-        dot = sum(a * b for a, b in zip(left, right))
-        left_norm = math.sqrt(sum(a * a for a in left))
-        right_norm = math.sqrt(sum(b * b for b in right))
-        if left_norm == 0.0 or right_norm == 0.0:
-            return 0.0
-        return dot / (left_norm * right_norm)
+    def _top_rows(scores: np.ndarray, top_k: int) -> List[int]:
+        """Select the ``top_k`` best rows, ordered by score then insertion order.
+
+        ``argpartition`` narrows the candidates to the k-th best score; every row tied
+        with that boundary score is kept so the final ordering matches a full stable
+        sort of the collection.
+        """
+
+        count = scores.shape[0]
+        if top_k < count:
+            boundary = scores[np.argpartition(-scores, top_k - 1)[top_k - 1]]
+            candidates = np.flatnonzero(scores >= boundary)
+        else:
+            candidates = np.arange(count)
+        order = np.lexsort((candidates, -scores[candidates]))
+        return [int(row) for row in candidates[order][:top_k]]
+
+    def _ensure_capacity(self, required: int) -> None:
+        capacity = self._matrix.shape[0]
+        if required <= capacity:
+            return
+        new_capacity = max(self._INITIAL_CAPACITY, capacity * 2, required)
+        used = len(self._ids)
+        if self.storage_dir is None:
+            matrix = np.zeros((new_capacity, self.dimensions), dtype=np.float32)
+            matrix[:used] = self._matrix[:used]
+        else:
+            matrix = self._resize_mapped_matrix(new_capacity, used)
+        norms = np.zeros(new_capacity, dtype=np.float32)
+        norms[:used] = self._norms[:used]
+        self._matrix = matrix
+        self._norms = norms
+
+    def _resize_mapped_matrix(self, capacity: int, used: int) -> np.ndarray:
+        assert self.storage_dir is not None
+        target = self.storage_dir / self._MATRIX_FILE
+        temp = self.storage_dir / f".{self._MATRIX_FILE}.tmp"
+        matrix = np.memmap(temp, dtype=np.float32, mode="w+", shape=(capacity, self.dimensions))
+        if used:
+            matrix[:used] = self._matrix[:used]
+        matrix.flush()
+        del matrix
+        os.replace(temp, target)
+        self._write_meta(capacity)
+        return np.memmap(target, dtype=np.float32, mode="r+", shape=(capacity, self.dimensions))
+
+    def _persist(self, journal: List[Dict[str, object]]) -> None:
+        assert self.storage_dir is not None
+        if isinstance(self._matrix, np.memmap):
+            self._matrix.flush()
+        with (self.storage_dir / self._POINTS_FILE).open("a", encoding="utf-8") as handle:
+            for record in journal:
+                handle.write(json.dumps(record, default=str))
+                handle.write("\n")
+
+    def _write_meta(self, capacity: int) -> None:
+        assert self.storage_dir is not None
+        meta = {"dimensions": self.dimensions, "capacity": capacity, "dtype": "float32"}
+        atomic_write_json(self.storage_dir / self._META_FILE, meta)
+
+    def _load(self) -> None:
+        assert self.storage_dir is not None
+        meta_path = self.storage_dir / self._META_FILE
+        matrix_path = self.storage_dir / self._MATRIX_FILE
+        points_path = self.storage_dir / self._POINTS_FILE
+        if not meta_path.exists() or not matrix_path.exists():
+            return
+        meta = read_json(meta_path)
+        capacity = int(meta.get("capacity", 0))
+        if int(meta.get("dimensions", -1)) != self.dimensions or capacity <= 0:
+            # Embedding dimensions changed: the stored vectors are unusable.
+            for path in (meta_path, matrix_path, points_path):
+                path.unlink(missing_ok=True)
+            return
+        self._matrix = np.memmap(matrix_path, dtype=np.float32, mode="r+", shape=(capacity, self.dimensions))
+        self._norms = np.zeros(capacity, dtype=np.float32)
+        if not points_path.exists():
+            return
+        with points_path.open("r", encoding="utf-8") as handle:
+            for line in handle:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                point_id = str(record["id"])
+                row = int(record["row"])
+                payload = dict(record.get("payload") or {})
+                if row >= capacity:
+                    continue
+                if row == len(self._ids):
+                    self._ids.append(point_id)
+                    self._payloads.append(payload)
+                    self._positions[point_id] = row
+                elif row < len(self._ids):
+                    self._payloads[row] = payload
+        used = len(self._ids)
+        if used:
+            self._norms[:used] = _row_norms(self._matrix[:used])
+
+
+def _row_norms(matrix: np.ndarray) -> np.ndarray:
+    # Same reduction for single rows and whole matrices so reloaded norms match exactly.
+    return np.sqrt(np.einsum("ij,ij->i", matrix, matrix))
 
 
 class VectorService:
@@ -64,7 +218,8 @@ class VectorService:
         self._chroma_client = None
         if backend == "memory":
             self.mode = "memory"
-            self._memory_index = InMemoryVectorIndex(self.settings.qdrant_vector_size)
+            storage_dir = self.settings.vector_dir / "memory" if self.settings.vector_memory_persist else None
+            self._memory_index = InMemoryVectorIndex(self.settings.qdrant_vector_size, storage_dir=storage_dir)
         elif backend == "chroma":
             self.mode = "chroma"
             try:
@@ -1,16 +1,21 @@
 """Persistent storage primitives for ingestion and retrieval flows."""
 
 from .document_store import DocumentStore
+from .graph_snapshot import GraphSnapshotStore
 from .job_store import JobStore
+from .keyword_index import KeywordIndex
 from .knowledge_store import KnowledgeProfile, KnowledgeProfileStore, LessonProgressRecord
-from .timeline_store import TimelineEvent, TimelineStore
+from .timeline_store import TimelineEvent, TimelineQuery, TimelineStore
 
 __all__ = [
     "DocumentStore",
+    "GraphSnapshotStore",
     "JobStore",
+    "KeywordIndex",
     "KnowledgeProfile",
     "KnowledgeProfileStore",
     "LessonProgressRecord",
     "TimelineEvent",
+    "TimelineQuery",
     "TimelineStore",
 ]
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import hmac
 import json
 from dataclasses import dataclass
 from datetime import datetime, timezone
@@ -8,6 +9,10 @@ from pathlib import Path
 from threading import Lock
 from typing import Dict, Iterator, List, Tuple
 
+from ..utils.storage import atomic_write_json, read_json
+
+GENESIS_HASH = "0" * 64
+
 
 @dataclass(frozen=True)
 class ChainEntry:
@@ -32,20 +37,41 @@ class ChainEntry:
 
 
 class ForensicsChainLedger:
-    """Tamper-evident append-only ledger for forensic artefacts."""
+    """Tamper-evident append-only ledger for forensic artefacts.
+
+    A tail record (``<ledger>.tail.json``) holds the index, digest and byte span of the
+    last entry so appends never rescan the ledger. When a signing key is configured an
+    HMAC-signed checkpoint is written every ``checkpoint_interval`` entries and
+    :meth:`verify` resumes from the newest checkpoint that still matches the ledger.
+    Checkpoints whose signature does not verify, for example after the signing key was
+    rotated, are ignored rather than reported, so verification falls back to genesis.
+    """
 
-    def __init__(self, path: Path) -> None:
+    def __init__(
+        self,
+        path: Path,
+        *,
+        signing_key: str | bytes | None = None,
+        checkpoint_interval: int = 1024,
+    ) -> None:
         self.path = Path(path).expanduser().resolve()
         self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.tail_path = self.path.with_name(f"{self.path.name}.tail.json")
+        self.checkpoint_path = self.path.with_name(f"{self.path.name}.checkpoints.jsonl")
+        if isinstance(signing_key, str):
+            signing_key = signing_key.encode("utf-8")
+        self._signing_key = signing_key or None
+        self.checkpoint_interval = max(1, int(checkpoint_interval))
         self._lock = Lock()
+        self._tail: Dict[str, object] | None = None
 
     # region public API
     def append(self, actor: str, action: str, payload: Dict[str, object]) -> ChainEntry:
         payload = self._jsonable(payload)
         with self._lock:
-            entries = list(self.iter_entries())
-            index = entries[-1].index + 1 if entries else 0
-            prev_hash = entries[-1].digest if entries else "0" * 64
+            tail = self._current_tail()
+            index = int(tail["index"]) + 1
+            prev_hash = str(tail["digest"])
             timestamp = datetime.now(timezone.utc).isoformat()
             canonical = self._canonical_payload(index, timestamp, actor, action, payload, prev_hash)
             digest = self._compute_digest(canonical)
@@ -58,37 +84,31 @@ class ForensicsChainLedger:
                 prev_hash=prev_hash,
                 digest=digest,
             )
-            self._append_entry(entry)
+            start, end = self._append_entry(entry)
+            self._store_tail({"index": index, "digest": digest, "start": start, "end": end})
+            if self._signing_key is not None and (index + 1) % self.checkpoint_interval == 0:
+                self._write_checkpoint(index, digest, start, end)
             return entry
 
     def iter_entries(self) -> Iterator[ChainEntry]:
-        if not self.path.exists():
-            return iter(())
-        with self.path.open("r", encoding="utf-8") as handle:
-            for line in handle:
-                if not line.strip():
-                    continue
-                try:
-                    payload = json.loads(line)
-                except json.JSONDecodeError:
-                    continue
-                try:
-                    yield ChainEntry(
-                        index=int(payload["index"]),
-                        timestamp=str(payload["timestamp"]),
-                        actor=str(payload["actor"]),
-                        action=str(payload["action"]),
-                        payload=dict(payload.get("payload", {})),
-                        prev_hash=str(payload["prev_hash"]),
-                        digest=str(payload["digest"]),
-                    )
-                except (KeyError, TypeError, ValueError):
-                    continue
-
-    def verify(self) -> Tuple[bool, List[str]]:
+        for entry, _, _ in self._scan(0):
+            yield entry
+
+    def verify(self, *, full: bool = False) -> Tuple[bool, List[str]]:
+        """Check digests and hash links, starting from the latest valid checkpoint.
+
+        Pass ``full=True`` to re-verify every entry from genesis.
+        """
+
         issues: List[str] = []
-        prev_hash = "0" * 64
-        for entry in self.iter_entries():
+        prev_hash, offset, expected_index = GENESIS_HASH, 0, 0
+        if not full:
+            checkpoint = self._latest_valid_checkpoint(issues)
+            if checkpoint is not None:
+                prev_hash = str(checkpoint["digest"])
+                offset = int(checkpoint["offset"])
+                expected_index = int(checkpoint["index"]) + 1
+        for entry, _, _ in self._scan(offset):
             canonical = self._canonical_payload(
                 entry.index,
                 entry.timestamp,
@@ -98,6 +118,8 @@ class ForensicsChainLedger:
                 entry.prev_hash,
             )
             expected_digest = self._compute_digest(canonical)
+            if entry.index != expected_index:
+                issues.append(f"entry {entry.index} is out of sequence (expected index {expected_index})")
             if entry.prev_hash != prev_hash:
                 issues.append(
                     f"entry {entry.index} has unexpected prev_hash {entry.prev_hash} (expected {prev_hash})"
@@ -107,22 +129,149 @@ class ForensicsChainLedger:
                     f"entry {entry.index} digest mismatch (expected {expected_digest}, found {entry.digest})"
                 )
             prev_hash = entry.digest
+            expected_index = entry.index + 1
         return len(issues) == 0, issues
 
     def latest(self) -> ChainEntry | None:
-        entries = list(self.iter_entries())
-        return entries[-1] if entries else None
+        with self._lock:
+            tail = self._current_tail()
+        if int(tail["index"]) < 0:
+            return None
+        return self._read_entry(int(tail["start"]), int(tail["end"]))
 
     # endregion
 
     # region internal helpers
-    def _append_entry(self, entry: ChainEntry) -> None:
-        line = json.dumps(entry.to_dict(), separators=(",", ":"), sort_keys=True)
-        with self.path.open("a", encoding="utf-8") as handle:
+    def _append_entry(self, entry: ChainEntry) -> Tuple[int, int]:
+        line = json.dumps(entry.to_dict(), separators=(",", ":"), sort_keys=True).encode("utf-8") + b"\n"
+        with self.path.open("ab") as handle:
+            start = handle.tell()
             handle.write(line)
+            handle.flush()
+            return start, start + len(line)
+
+    def _current_tail(self) -> Dict[str, object]:
+        """Return the cached tail, reconciling it with the ledger when the file moved on."""
+
+        size = self.path.stat().st_size if self.path.exists() else 0
+        tail = self._tail
+        if tail is None and self.tail_path.exists():
+            try:
+                tail = read_json(self.tail_path)
+            except (OSError, ValueError):
+                tail = None
+        if tail is not None and int(tail.get("end", -1)) == size:
+            self._tail = tail
+            return tail
+        # Stale or missing tail: resume scanning from the last known end when the ledger only
+        # grew, otherwise rebuild from genesis.
+        if tail is not None and 0 <= int(tail.get("end", -1)) < size:
+            recovered = dict(tail)
+            offset = int(tail["end"])
+        else:
+            recovered = {"index": -1, "digest": GENESIS_HASH, "start": 0, "end": 0}
+            offset = 0
+        for entry, start, end in self._scan(offset):
+            recovered = {"index": entry.index, "digest": entry.digest, "start": start, "end": end}
+        recovered["end"] = size
+        self._store_tail(recovered)
+        return recovered
+
+    def _store_tail(self, tail: Dict[str, object]) -> None:
+        self._tail = tail
+        atomic_write_json(self.tail_path, tail)
+
+    def _scan(self, offset: int) -> Iterator[Tuple[ChainEntry, int, int]]:
+        if not self.path.exists():
+            return
+        with self.path.open("rb") as handle:
+            handle.seek(offset)
+            position = offset
+            for raw in handle:
+                start, position = position, position + len(raw)
+                entry = self._parse_line(raw)
+                if entry is not None:
+                    yield entry, start, position
+
+    def _read_entry(self, start: int, end: int) -> ChainEntry | None:
+        with self.path.open("rb") as handle:
+            handle.seek(start)
+            return self._parse_line(handle.read(end - start))
+
+    @staticmethod
+    def _parse_line(raw: bytes) -> ChainEntry | None:
+        if not raw.strip():
+            return None
+        try:
+            payload = json.loads(raw)
+            return ChainEntry(
+                index=int(payload["index"]),
+                timestamp=str(payload["timestamp"]),
+                actor=str(payload["actor"]),
+                action=str(payload["action"]),
+                payload=dict(payload.get("payload", {})),
+                prev_hash=str(payload["prev_hash"]),
+                digest=str(payload["digest"]),
+            )
+        except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+            return None
+
+    def _write_checkpoint(self, index: int, digest: str, start: int, offset: int) -> None:
+        record: Dict[str, object] = {"index": index, "digest": digest, "start": start, "offset": offset}
+        record["signature"] = self._sign(record)
+        with self.checkpoint_path.open("a", encoding="utf-8") as handle:
+            handle.write(json.dumps(record, separators=(",", ":"), sort_keys=True))
             handle.write("\n")
             handle.flush()
 
+    def _sign(self, record: Dict[str, object]) -> str:
+        assert self._signing_key is not None
+        message = json.dumps(
+            {key: record[key] for key in ("index", "digest", "start", "offset")},
+            separators=(",", ":"),
+            sort_keys=True,
+        ).encode("utf-8")
+        return hmac.new(self._signing_key, message, sha256).hexdigest()
+
+    def _latest_valid_checkpoint(self, issues: List[str]) -> Dict[str, object] | None:
+        """Return the newest checkpoint whose signature and anchored entry still check out.
+
+        A checkpoint that cannot be verified proves nothing either way and is skipped; only a
+        signed checkpoint that disagrees with the ledger is reported as an issue.
+        """
+
+        if self._signing_key is None or not self.checkpoint_path.exists():
+            return None
+        records: List[Dict[str, object]] = []
+        for line in self.checkpoint_path.read_text(encoding="utf-8").splitlines():
+            try:
+                records.append(dict(json.loads(line)))
+            except (json.JSONDecodeError, TypeError, ValueError):
+                continue
+        for record in reversed(records):
+            try:
+                signature_ok = hmac.compare_digest(str(record.get("signature", "")), self._sign(record))
+            except KeyError:
+                signature_ok = False
+            if not signature_ok:
+                continue
+            if self._checkpoint_anchors(record):
+                return record
+            issues.append(f"checkpoint {record['index']} does not match the ledger; falling back")
+        return None
+
+    def _checkpoint_anchors(self, record: Dict[str, object]) -> bool:
+        start, offset = int(record["start"]), int(record["offset"])
+        if not self.path.exists() or not 0 <= start < offset <= self.path.stat().st_size:
+            return False
+        entry = self._read_entry(start, offset)
+        if entry is None or entry.index != int(record["index"]) or entry.digest != record["digest"]:
+            return False
+        canonical = self._canonical_payload(
+            entry.index, entry.timestamp, entry.actor, entry.action, entry.payload, entry.prev_hash
+        )
+        return self._compute_digest(canonical) == entry.digest
+
     @staticmethod
     def _canonical_payload(
         index: int,
@@ -164,4 +313,4 @@ class ForensicsChainLedger:
     # endregion
 
 
-__all__ = ["ChainEntry", "ForensicsChainLedger"]
+__all__ = ["ChainEntry", "ForensicsChainLedger", "GENESIS_HASH"]
@@ -0,0 +1,271 @@
+from __future__ import annotations
+
+import json
+import os
+import struct
+import sys
+from array import array
+from pathlib import Path
+from threading import Lock
+from typing import Dict, Iterable, Iterator, List, Mapping, Sequence, Tuple
+
+NodeRecord = Tuple[str, str, Dict[str, object]]
+EdgeRecord = Tuple[str, str, str, Dict[str, object]]
+
+_MAGIC = b"CCGRAPH1"
+_HEADER = struct.Struct("<8sIIIII")
+
+
+class GraphSnapshotStore:
+    """Binary snapshot plus JSONL journal for the in-memory graph.
+
+    The snapshot interns every node id, node type and relation type into one string
+    table, so nodes and edges are stored as parallel ``uint32`` columns of integer ids.
+    Property dicts are de-duplicated and kept as a single JSON array. Two node sections are
+    kept: the records of the memory store and the merged node cache in insertion order.
+    Mutations since the snapshot are appended to the journal. Callers fold the journal
+    back into a new snapshot once it reaches ``compact_every`` entries: ``rotate_journal``
+    sets the current journal aside at the moment the graph is captured, and ``write``
+    deletes it once the snapshot covering it is in place.
+    """
+
+    SNAPSHOT_FILE = "graph.snapshot"
+    JOURNAL_FILE = "journal.jsonl"
+    COMPACTING_FILE = "journal.compacting.jsonl"
+
+    def __init__(self, root: Path, *, compact_every: int = 100_000) -> None:
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.compact_every = max(1, int(compact_every))
+        self.journal_entries = 0
+        self._lock = Lock()
+        self._journal = None
+
+    @property
+    def snapshot_path(self) -> Path:
+        return self.root / self.SNAPSHOT_FILE
+
+    @property
+    def journal_path(self) -> Path:
+        return self.root / self.JOURNAL_FILE
+
+    @property
+    def compacting_path(self) -> Path:
+        return self.root / self.COMPACTING_FILE
+
+    @property
+    def needs_compaction(self) -> bool:
+        return self.journal_entries >= self.compact_every
+
+    def load(self) -> Tuple[List[NodeRecord], List[NodeRecord], List[EdgeRecord]]:
+        """Return the snapshot's stored nodes, cached nodes and edges in insertion order."""
+
+        if not self.snapshot_path.exists():
+            return [], [], []
+        data = memoryview(self.snapshot_path.read_bytes())
+        magic, string_count, props_count, node_count, cached_count, edge_count = _HEADER.unpack_from(data, 0)
+        if magic != _MAGIC:
+            raise ValueError(f"{self.snapshot_path} is not a graph snapshot")
+        offset = _HEADER.size
+        string_offsets, offset = _read_column(data, offset, string_count + 1, "Q")
+        blob_end = offset + string_offsets[-1]
+        blob = bytes(data[offset:blob_end])
+        strings = [
+            sys.intern(blob[string_offsets[index] : string_offsets[index + 1]].decode("utf-8"))
+            for index in range(string_count)
+        ]
+        offset = blob_end
+        (props_length,) = struct.unpack_from("<Q", data, offset)
+        offset += 8
+        # One ``json.loads`` over the whole table lets the decoder share repeated keys.
+        properties: List[Dict[str, object]] = json.loads(bytes(data[offset : offset + props_length]))
+        if len(properties) != props_count:
+            raise ValueError(f"{self.snapshot_path} has a truncated property table")
+        offset += props_length
+        node_columns = []
+        for _ in range(3):
+            column, offset = _read_column(data, offset, node_count, "I")
+            node_columns.append(column)
+        cached_columns = []
+        for _ in range(3):
+            column, offset = _read_column(data, offset, cached_count, "I")
+            cached_columns.append(column)
+        edge_columns = []
+        for _ in range(4):
+            column, offset = _read_column(data, offset, edge_count, "I")
+            edge_columns.append(column)
+        claimed = bytearray(props_count)
+
+        def owned(index: int) -> Dict[str, object]:
+            # Identical property dicts were stored once; hand out copies after first use so
+            # records never alias each other's mutable properties.
+            if claimed[index]:
+                return dict(properties[index])
+            claimed[index] = 1
+            return properties[index]
+
+        def node_records(columns: List[Sequence[int]]) -> List[NodeRecord]:
+            node_ids, node_types, node_props = columns
+            return [
+                (strings[node_id], strings[node_type], owned(props))
+                for node_id, node_type, props in zip(node_ids, node_types, node_props)
+            ]
+
+        nodes = node_records(node_columns)
+        cached = node_records(cached_columns)
+        sources, types, targets, edge_props = edge_columns
+        edges = [
+            (strings[source], strings[relation_type], strings[target], owned(props))
+            for source, relation_type, target, props in zip(sources, types, targets, edge_props)
+        ]
+        return nodes, cached, edges
+
+    def replay(self) -> Iterator[Mapping[str, object]]:
+        """Yield journal entries written after the current snapshot.
+
+        A journal set aside by a compaction that never finished is replayed first.
+        """
+
+        self.journal_entries = 0
+        for path in (self.compacting_path, self.journal_path):
+            if not path.exists():
+                continue
+            with path.open("r", encoding="utf-8") as handle:
+                for line in handle:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    self.journal_entries += 1
+                    yield entry
+
+    def rotate_journal(self) -> None:
+        """Set the journal aside for compaction; later appends start a new journal.
+
+        Call this while writers are held off, together with capturing the records passed
+        to ``write``, so every entry in the set-aside journal is covered by the snapshot.
+        """
+
+        with self._lock:
+            self._close_journal()
+            if self.journal_path.exists():
+                if self.compacting_path.exists():
+                    # A previous compaction failed before writing its snapshot; keep both.
+                    with self.compacting_path.open("ab") as target:
+                        target.write(self.journal_path.read_bytes())
+                    self.journal_path.unlink()
+                else:
+                    os.replace(self.journal_path, self.compacting_path)
+            self.journal_entries = 0
+
+    def append_node(self, node_id: str, node_type: str, properties: Mapping[str, object]) -> None:
+        self._append({"op": "node", "id": node_id, "type": node_type, "properties": properties})
+
+    def append_edge(self, source: str, relation_type: str, target: str, properties: Mapping[str, object]) -> None:
+        self._append(
+            {"op": "edge", "source": source, "type": relation_type, "target": target, "properties": properties}
+        )
+
+    def write(
+        self, nodes: Iterable[NodeRecord], cached: Iterable[NodeRecord], edges: Iterable[EdgeRecord]
+    ) -> None:
+        """Atomically replace the snapshot and delete the journal set aside for it."""
+
+        strings: Dict[str, int] = {}
+        properties: Dict[str, int] = {}
+
+        def intern(value: str) -> int:
+            index = strings.get(value)
+            if index is None:
+                index = strings[value] = len(strings)
+            return index
+
+        def intern_properties(value: Mapping[str, object]) -> int:
+            text = json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+            index = properties.get(text)
+            if index is None:
+                index = properties[text] = len(properties)
+            return index
+
+        def node_columns_of(records: Iterable[NodeRecord]) -> Tuple[array, array, array]:
+            columns = (array("I"), array("I"), array("I"))
+            for node_id, node_type, props in records:
+                columns[0].append(intern(node_id))
+                columns[1].append(intern(node_type))
+                columns[2].append(intern_properties(props))
+            return columns
+
+        node_columns = node_columns_of(nodes)
+        cached_columns = node_columns_of(cached)
+        edge_columns = (array("I"), array("I"), array("I"), array("I"))
+        for source, relation_type, target, props in edges:
+            edge_columns[0].append(intern(source))
+            edge_columns[1].append(intern(relation_type))
+            edge_columns[2].append(intern(target))
+            edge_columns[3].append(intern_properties(props))
+
+        encoded = [value.encode("utf-8") for value in strings]
+        string_offsets = array("Q", [0])
+        for value in encoded:
+            string_offsets.append(string_offsets[-1] + len(value))
+        props_blob = ("[" + ",".join(properties) + "]").encode("utf-8")
+
+        temp = self.root / f".{self.SNAPSHOT_FILE}.tmp"
+        with temp.open("wb") as handle:
+            handle.write(
+                _HEADER.pack(
+                    _MAGIC,
+                    len(encoded),
+                    len(properties),
+                    len(node_columns[0]),
+                    len(cached_columns[0]),
+                    len(edge_columns[0]),
+                )
+            )
+            _write_column(handle, string_offsets)
+            handle.write(b"".join(encoded))
+            handle.write(struct.pack("<Q", len(props_blob)))
+            handle.write(props_blob)
+            for column in (*node_columns, *cached_columns, *edge_columns):
+                _write_column(handle, column)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(temp, self.snapshot_path)
+        self.compacting_path.unlink(missing_ok=True)
+
+    def close(self) -> None:
+        with self._lock:
+            self._close_journal()
+
+    def _append(self, entry: Mapping[str, object]) -> None:
+        line = json.dumps(entry, separators=(",", ":"), default=str) + "\n"
+        with self._lock:
+            if self._journal is None:
+                self._journal = self.journal_path.open("a", encoding="utf-8")
+            self._journal.write(line)
+            self._journal.flush()
+            self.journal_entries += 1
+
+    def _close_journal(self) -> None:
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+
+
+def _write_column(handle, column: array) -> None:
+    if sys.byteorder != "little":  # pragma: no cover - snapshots are little-endian on disk
+        column = array(column.typecode, column)
+        column.byteswap()
+    handle.write(column.tobytes())
+
+
+def _read_column(data: memoryview, offset: int, count: int, typecode: str) -> Tuple[Sequence[int], int]:
+    column = array(typecode)
+    end = offset + count * column.itemsize
+    column.frombytes(data[offset:end])
+    if sys.byteorder != "little":  # pragma: no cover - snapshots are little-endian on disk
+        column.byteswap()
+    return column, end
+
+
+__all__ = ["EdgeRecord", "GraphSnapshotStore", "NodeRecord"]
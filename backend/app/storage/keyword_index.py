@@ -0,0 +1,259 @@
+from __future__ import annotations
+
+import heapq
+import json
+import math
+import re
+from collections import Counter
+from pathlib import Path
+from threading import Lock
+from typing import Dict, Iterable, List, Mapping, Tuple
+
+from ..utils.storage import atomic_write_json, read_json
+
+_TOKEN_RE = re.compile(r"[A-Za-z0-9']+")
+_INDEXED_FIELDS = ("title", "summary", "description")
+
+
+def tokenize(text: str) -> List[str]:
+    return [token.lower() for token in _TOKEN_RE.findall(text)]
+
+
+class KeywordIndex:
+    """Persistent BM25 inverted index over document metadata records.
+
+    Postings map each term to ``{doc_id: term_frequency}`` so a query only touches the
+    posting lists of its own terms. Mutations are appended to a JSONL journal and
+    folded into a snapshot once the journal grows past ``compact_every`` entries. A marker
+    file records that :meth:`rebuild` has indexed the full document store at least once.
+    """
+
+    SNAPSHOT_FILE = "snapshot.json"
+    JOURNAL_FILE = "journal.jsonl"
+    MARKER_FILE = "bootstrapped.json"
+
+    def __init__(
+        self,
+        root: Path,
+        *,
+        k1: float = 1.2,
+        b: float = 0.75,
+        compact_every: int = 512,
+    ) -> None:
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.k1 = k1
+        self.b = b
+        self.compact_every = max(1, compact_every)
+        self._lock = Lock()
+        self._postings: Dict[str, Dict[str, int]] = {}
+        self._lengths: Dict[str, int] = {}
+        self._payloads: Dict[str, Dict[str, object]] = {}
+        self._doc_terms: Dict[str, List[str]] = {}
+        self._total_length = 0
+        self._journal_entries = 0
+        self._load()
+
+    @property
+    def snapshot_path(self) -> Path:
+        return self.root / self.SNAPSHOT_FILE
+
+    @property
+    def journal_path(self) -> Path:
+        return self.root / self.JOURNAL_FILE
+
+    @property
+    def marker_path(self) -> Path:
+        return self.root / self.MARKER_FILE
+
+    @property
+    def bootstrapped(self) -> bool:
+        """Whether a full :meth:`rebuild` has completed for this index directory."""
+
+        return self.marker_path.exists()
+
+    def __len__(self) -> int:
+        return len(self._lengths)
+
+    def __contains__(self, doc_id: object) -> bool:
+        return doc_id in self._lengths
+
+    def index_document(self, doc_id: str, record: Mapping[str, object]) -> None:
+        """Insert or replace the postings for ``doc_id`` built from a document record."""
+
+        doc_id = str(doc_id)
+        terms = Counter(tokenize(_document_text(record)))
+        payload = _document_payload(doc_id, record)
+        with self._lock:
+            self._apply_upsert(doc_id, dict(terms), payload)
+            self._append_journal({"op": "upsert", "id": doc_id, "terms": dict(terms), "payload": payload})
+
+    def remove_document(self, doc_id: str) -> None:
+        doc_id = str(doc_id)
+        with self._lock:
+            if doc_id not in self._lengths:
+                return
+            self._apply_remove(doc_id)
+            self._append_journal({"op": "remove", "id": doc_id})
+
+    def rebuild(self, records: Iterable[Mapping[str, object]]) -> None:
+        """Replace the whole index from ``records`` and write a fresh snapshot."""
+
+        with self._lock:
+            self._reset()
+            for record in records:
+                doc_id = record.get("id")
+                if doc_id is None:
+                    continue
+                terms = Counter(tokenize(_document_text(record)))
+                self._apply_upsert(str(doc_id), dict(terms), _document_payload(str(doc_id), record))
+            self._compact()
+            atomic_write_json(self.marker_path, {"version": 1, "documents": len(self._lengths)})
+
+    def search(self, query: str, *, top_k: int) -> List[Tuple[float, Dict[str, object]]]:
+        """Return ``(bm25_score, payload)`` pairs for the best ``top_k`` documents."""
+
+        query_terms = set(tokenize(query))
+        if not query_terms or top_k <= 0:
+            return []
+        with self._lock:
+            document_count = len(self._lengths)
+            if document_count == 0:
+                return []
+            average_length = self._total_length / document_count or 1.0
+            scores: Dict[str, float] = {}
+            for term in query_terms:
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+                frequency = len(postings)
+                idf = math.log(1.0 + (document_count - frequency + 0.5) / (frequency + 0.5))
+                for doc_id, tf in postings.items():
+                    norm = self.k1 * (1.0 - self.b + self.b * self._lengths[doc_id] / average_length)
+                    scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (self.k1 + 1.0) / (tf + norm)
+            best = heapq.nlargest(top_k, scores.items(), key=lambda item: (item[1], item[0]))
+            return [(score, dict(self._payloads[doc_id])) for doc_id, score in best]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._reset()
+            self.snapshot_path.unlink(missing_ok=True)
+            self.journal_path.unlink(missing_ok=True)
+            self.marker_path.unlink(missing_ok=True)
+
+    def _reset(self) -> None:
+        self._postings = {}
+        self._lengths = {}
+        self._payloads = {}
+        self._doc_terms = {}
+        self._total_length = 0
+
+    def _apply_upsert(self, doc_id: str, terms: Dict[str, int], payload: Dict[str, object]) -> None:
+        if doc_id in self._lengths:
+            self._apply_remove(doc_id)
+        for term, tf in terms.items():
+            self._postings.setdefault(term, {})[doc_id] = int(tf)
+        length = sum(terms.values())
+        self._lengths[doc_id] = length
+        self._total_length += length
+        self._payloads[doc_id] = dict(payload)
+        self._doc_terms[doc_id] = list(terms)
+
+    def _apply_remove(self, doc_id: str) -> None:
+        self._payloads.pop(doc_id, None)
+        for term in self._doc_terms.pop(doc_id, []):
+            postings = self._postings.get(term)
+            if postings is None:
+                continue
+            postings.pop(doc_id, None)
+            if not postings:
+                del self._postings[term]
+        self._total_length -= self._lengths.pop(doc_id, 0)
+
+    def _append_journal(self, entry: Dict[str, object]) -> None:
+        with self.journal_path.open("a", encoding="utf-8") as handle:
+            handle.write(json.dumps(entry, sort_keys=True, default=str) + "\n")
+        self._journal_entries += 1
+        if self._journal_entries >= self.compact_every:
+            self._compact()
+
+    def _compact(self) -> None:
+        documents = {
+            doc_id: {
+                "terms": {term: self._postings[term][doc_id] for term in self._doc_terms[doc_id]},
+                "payload": payload,
+            }
+            for doc_id, payload in self._payloads.items()
+        }
+        atomic_write_json(self.snapshot_path, {"version": 1, "documents": documents})
+        self.journal_path.unlink(missing_ok=True)
+        self._journal_entries = 0
+
+    def _load(self) -> None:
+        if self.snapshot_path.exists():
+            try:
+                snapshot = read_json(self.snapshot_path)
+            except (OSError, ValueError):
+                snapshot = {}
+            for doc_id, entry in dict(snapshot.get("documents", {})).items():
+                self._apply_upsert(str(doc_id), dict(entry.get("terms", {})), dict(entry.get("payload", {})))
+        if not self.journal_path.exists():
+            return
+        for line in self.journal_path.read_text(encoding="utf-8").splitlines():
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            doc_id = str(entry.get("id", ""))
+            if entry.get("op") == "upsert":
+                self._apply_upsert(doc_id, dict(entry.get("terms", {})), dict(entry.get("payload", {})))
+            elif entry.get("op") == "remove" and doc_id in self._lengths:
+                self._apply_remove(doc_id)
+            self._journal_entries += 1
+
+
+def _document_text(record: Mapping[str, object]) -> str:
+    parts: List[str] = []
+    for key in _INDEXED_FIELDS:
+        value = record.get(key)
+        if isinstance(value, str):
+            parts.append(value)
+    for label in record.get("entity_labels", []) or []:
+        parts.append(str(label))
+    return " ".join(parts)
+
+
+def _document_payload(doc_id: str, record: Mapping[str, object]) -> Dict[str, object]:
+    title = str(record.get("title", record.get("name", "")))
+    return {
+        "doc_id": doc_id,
+        "title": title,
+        "text": str(record.get("summary") or title),
+        "source_type": record.get("source_type"),
+        "entity_labels": list(record.get("entity_labels", []) or []),
+        "entity_ids": list(record.get("entity_ids", []) or []),
+    }
+
+
+_indexes: Dict[Path, KeywordIndex] = {}
+_indexes_lock = Lock()
+
+
+def get_keyword_index(root: Path) -> KeywordIndex:
+    """Return the process-wide index for ``root`` so writers and readers share postings."""
+
+    key = Path(root).resolve()
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = KeywordIndex(key)
+            _indexes[key] = index
+        return index
+
+
+def reset_keyword_indexes() -> None:
+    with _indexes_lock:
+        _indexes.clear()
+
+
+__all__ = ["KeywordIndex", "get_keyword_index", "reset_keyword_indexes", "tokenize"]
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 import json
+import sqlite3
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
+from hashlib import sha256
 from pathlib import Path
-from typing import Dict, Iterable, List
+from threading import Lock
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
 
 @dataclass(order=True)
@@ -67,38 +70,315 @@ class TimelineEvent:
         )
 
 
+def timeline_sort_key(value: datetime) -> str:
+    """Render a timestamp as a lexically sortable UTC key; naive values are taken as UTC."""
+
+    if value.tzinfo is not None and value.tzinfo.utcoffset(value) is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value.replace(tzinfo=None).strftime("%Y-%m-%dT%H:%M:%S.%f")
+
+
+@dataclass(frozen=True)
+class TimelineQuery:
+    """Filters pushed down to the timeline index; all bounds are optional."""
+
+    from_ts: Optional[datetime] = None
+    to_ts: Optional[datetime] = None
+    risk_band: Optional[str] = None
+    motion_due_before: Optional[datetime] = None
+    motion_due_after: Optional[datetime] = None
+    entity_id: Optional[str] = None
+    entity_label: Optional[str] = None
+    citations: Optional[Sequence[str]] = None
+    after: Optional[Tuple[datetime, str]] = None
+
+
+_index_locks: Dict[Path, Lock] = {}
+_index_locks_guard = Lock()
+
+
+def _index_lock(path: Path) -> Lock:
+    with _index_locks_guard:
+        return _index_locks.setdefault(path, Lock())
+
+
 class TimelineStore:
-    """JSONL-backed storage for timeline events."""
+    """JSONL-backed storage for timeline events with a SQLite index for queries.
+
+    The JSONL file is the append log; when an id appears more than once the last record
+    wins. A sidecar SQLite database (``<name>.sqlite``) mirrors the log with indexes on
+    timestamp, risk band, motion deadline, entity and citation so :meth:`query` can page
+    through filtered events without reading the whole history. The index follows the log
+    incrementally and is rebuilt whenever the log is rewritten by another writer.
+    """
+
+    _FINGERPRINT_BYTES = 4096
 
     def __init__(self, path: Path) -> None:
         self.path = Path(path)
         self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.index_path = self.path.with_suffix(".sqlite")
+        self._lock = _index_lock(self.index_path.resolve())
+        self._connection: sqlite3.Connection | None = None
 
-    def append(self, events: Iterable[TimelineEvent]) -> None:
+    def append(self, events: Iterable[TimelineEvent], *, enriched: bool = False) -> None:
+        events = list(events)
         if not events:
             return
-        with self.path.open("a", encoding="utf-8") as handle:
-            for event in events:
-                handle.write(json.dumps(event.to_record(), sort_keys=True) + "\n")
+        with self._lock:
+            connection = self._sync()
+            with self.path.open("a", encoding="utf-8") as handle:
+                for event in events:
+                    handle.write(self._serialise(event, enriched) + "\n")
+            self._index_events(connection, [(event, enriched) for event in events])
+            self._record_sync_state(connection)
+            connection.commit()
 
-    def write_all(self, events: Iterable[TimelineEvent]) -> None:
+    def write_all(self, events: Iterable[TimelineEvent], *, enriched: bool = False) -> None:
         ordered = sorted(events)
-        with self.path.open("w", encoding="utf-8") as handle:
-            for event in ordered:
-                handle.write(json.dumps(event.to_record(), sort_keys=True) + "\n")
+        with self._lock:
+            connection = self._connect()
+            with self.path.open("w", encoding="utf-8") as handle:
+                for event in ordered:
+                    handle.write(self._serialise(event, enriched) + "\n")
+            self._clear_index(connection)
+            self._index_events(connection, [(event, enriched) for event in ordered])
+            self._record_sync_state(connection)
+            connection.commit()
 
     def read_all(self) -> List[TimelineEvent]:
         if not self.path.exists():
             return []
-        records: List[TimelineEvent] = []
+        records: Dict[str, TimelineEvent] = {}
         for line in self.path.read_text().splitlines():
-            try:
-                record = json.loads(line)
-            except json.JSONDecodeError:
-                continue
-            try:
-                records.append(TimelineEvent.from_record(record))
-            except (KeyError, ValueError):
-                continue
-        return sorted(records)
+            parsed = self._parse_line(line)
+            if parsed is not None:
+                event, _ = parsed
+                records.pop(event.id, None)
+                records[event.id] = event
+        return sorted(records.values())
+
+    def query(self, criteria: TimelineQuery, *, limit: int) -> List[TimelineEvent]:
+        """Return up to ``limit`` events matching ``criteria`` ordered by ``(ts, id)``."""
+
+        clauses, params = self._where(criteria)
+        sql = "SELECT e.record FROM events e"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY e.ts_key, e.id LIMIT ?"
+        with self._lock:
+            rows = self._sync().execute(sql, (*params, int(limit))).fetchall()
+        return [TimelineEvent.from_record(json.loads(row[0])) for row in rows]
+
+    def citations(self, criteria: TimelineQuery) -> List[str]:
+        """Distinct document ids cited by events matching ``criteria``, in timeline order."""
+
+        clauses, params = self._where(criteria)
+        sql = "SELECT c.doc_id, MIN(e.ts_key || e.id) AS first_seen FROM event_citations c JOIN events e ON e.id = c.event_id"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " GROUP BY c.doc_id ORDER BY first_seen"
+        with self._lock:
+            rows = self._sync().execute(sql, params).fetchall()
+        return [str(row[0]) for row in rows]
+
+    def pending_enrichment(self) -> List[TimelineEvent]:
+        """Events appended since the last enrichment pass, in timeline order."""
+
+        with self._lock:
+            rows = self._sync().execute(
+                "SELECT record FROM events WHERE enriched = 0 ORDER BY ts_key, id"
+            ).fetchall()
+        return [TimelineEvent.from_record(json.loads(row[0])) for row in rows]
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    # region internal helpers
+    @staticmethod
+    def _serialise(event: TimelineEvent, enriched: bool) -> str:
+        record = event.to_record()
+        if enriched:
+            record["enriched"] = True
+        return json.dumps(record, sort_keys=True)
+
+    @staticmethod
+    def _parse_line(line: str) -> Tuple[TimelineEvent, bool] | None:
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            return None
+        try:
+            return TimelineEvent.from_record(record), bool(record.get("enriched"))
+        except (KeyError, ValueError, TypeError, AttributeError):
+            return None
+
+    @staticmethod
+    def _where(criteria: TimelineQuery) -> Tuple[List[str], List[object]]:
+        clauses: List[str] = []
+        params: List[object] = []
+        if criteria.from_ts is not None:
+            clauses.append("e.ts_key >= ?")
+            params.append(timeline_sort_key(criteria.from_ts))
+        if criteria.to_ts is not None:
+            clauses.append("e.ts_key <= ?")
+            params.append(timeline_sort_key(criteria.to_ts))
+        if criteria.risk_band is not None:
+            clauses.append("e.risk_band = ?")
+            params.append(criteria.risk_band.lower())
+        if criteria.motion_due_before is not None:
+            clauses.append("e.motion_key < ?")
+            params.append(timeline_sort_key(criteria.motion_due_before))
+        if criteria.motion_due_after is not None:
+            clauses.append("e.motion_key > ?")
+            params.append(timeline_sort_key(criteria.motion_due_after))
+        if criteria.motion_due_before is not None or criteria.motion_due_after is not None:
+            clauses.append("e.motion_key IS NOT NULL")
+        if criteria.entity_id is not None or criteria.entity_label is not None:
+            clauses.append(
+                "EXISTS (SELECT 1 FROM event_entities x WHERE x.event_id = e.id "
+                "AND (x.entity_id = ? OR instr(x.label, ?) > 0))"
+            )
+            params.extend([criteria.entity_id or "", (criteria.entity_label or "\0").lower()])
+        if criteria.citations is not None:
+            placeholders = ",".join("?" for _ in criteria.citations) or "NULL"
+            clauses.append(
+                f"EXISTS (SELECT 1 FROM event_citations c2 WHERE c2.event_id = e.id AND c2.doc_id IN ({placeholders}))"
+            )
+            params.extend(criteria.citations)
+        if criteria.after is not None:
+            cursor_key = timeline_sort_key(criteria.after[0])
+            clauses.append("(e.ts_key > ? OR (e.ts_key = ? AND e.id > ?))")
+            params.extend([cursor_key, cursor_key, criteria.after[1]])
+        return clauses, params
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is not None:
+            return self._connection
+        connection = sqlite3.connect(str(self.index_path), check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS events (
+                id TEXT PRIMARY KEY,
+                ts_key TEXT NOT NULL,
+                risk_band TEXT,
+                motion_key TEXT,
+                enriched INTEGER NOT NULL DEFAULT 0,
+                record TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS events_ts ON events (ts_key, id);
+            CREATE INDEX IF NOT EXISTS events_risk ON events (risk_band, ts_key, id);
+            CREATE INDEX IF NOT EXISTS events_motion ON events (motion_key);
+            CREATE INDEX IF NOT EXISTS events_pending ON events (enriched);
+            CREATE TABLE IF NOT EXISTS event_entities (
+                event_id TEXT NOT NULL,
+                entity_id TEXT NOT NULL,
+                label TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS event_entities_event ON event_entities (event_id);
+            CREATE INDEX IF NOT EXISTS event_entities_entity ON event_entities (entity_id, event_id);
+            CREATE TABLE IF NOT EXISTS event_citations (
+                event_id TEXT NOT NULL,
+                doc_id TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS event_citations_event ON event_citations (event_id);
+            CREATE INDEX IF NOT EXISTS event_citations_doc ON event_citations (doc_id, event_id);
+            CREATE TABLE IF NOT EXISTS sync_state (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            );
+            """
+        )
+        self._connection = connection
+        return connection
+
+    def _sync(self) -> sqlite3.Connection:
+        """Bring the index up to date with the JSONL log and return the connection."""
+
+        connection = self._connect()
+        state = dict(connection.execute("SELECT key, value FROM sync_state").fetchall())
+        size, mtime = self._log_state()
+        indexed_size = int(state.get("size", -1))
+        if indexed_size == size and state.get("mtime") == mtime:
+            return connection
+        # Pure appends keep the already indexed prefix intact; anything else is a rewrite.
+        if 0 <= indexed_size < size and state.get("fingerprint") == self._fingerprint(indexed_size):
+            offset = indexed_size
+        else:
+            self._clear_index(connection)
+            offset = 0
+        if size > offset:
+            with self.path.open("rb") as handle:
+                handle.seek(offset)
+                tail = handle.read().decode("utf-8", errors="replace")
+            parsed = [self._parse_line(line) for line in tail.splitlines()]
+            self._index_events(connection, [item for item in parsed if item is not None])
+        self._record_sync_state(connection)
+        connection.commit()
+        return connection
+
+    def _log_state(self) -> Tuple[int, str]:
+        if not self.path.exists():
+            return 0, ""
+        stat = self.path.stat()
+        return stat.st_size, str(stat.st_mtime_ns)
+
+    def _fingerprint(self, size: int) -> str:
+        if not self.path.exists():
+            return ""
+        with self.path.open("rb") as handle:
+            return sha256(handle.read(min(size, self._FINGERPRINT_BYTES))).hexdigest()
+
+    def _record_sync_state(self, connection: sqlite3.Connection) -> None:
+        size, mtime = self._log_state()
+        connection.executemany(
+            "INSERT OR REPLACE INTO sync_state (key, value) VALUES (?, ?)",
+            [("size", str(size)), ("mtime", mtime), ("fingerprint", self._fingerprint(size))],
+        )
+
+    @staticmethod
+    def _clear_index(connection: sqlite3.Connection) -> None:
+        connection.execute("DELETE FROM events")
+        connection.execute("DELETE FROM event_entities")
+        connection.execute("DELETE FROM event_citations")
+
+    @staticmethod
+    def _index_events(connection: sqlite3.Connection, events: Sequence[Tuple[TimelineEvent, bool]]) -> None:
+        if not events:
+            return
+        ids = [(event.id,) for event, _ in events]
+        connection.executemany("DELETE FROM event_entities WHERE event_id = ?", ids)
+        connection.executemany("DELETE FROM event_citations WHERE event_id = ?", ids)
+        connection.executemany(
+            "INSERT OR REPLACE INTO events (id, ts_key, risk_band, motion_key, enriched, record) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    event.id,
+                    timeline_sort_key(event.ts),
+                    (event.risk_band or "").lower() or None,
+                    timeline_sort_key(event.motion_deadline) if event.motion_deadline else None,
+                    int(enriched),
+                    json.dumps(event.to_record(), sort_keys=True),
+                )
+                for event, enriched in events
+            ],
+        )
+        connection.executemany(
+            "INSERT INTO event_entities (event_id, entity_id, label) VALUES (?, ?, ?)",
+            [
+                (event.id, str(highlight.get("id", "")), str(highlight.get("label", "")).lower())
+                for event, _ in events
+                for highlight in event.entity_highlights
+            ],
+        )
+        connection.executemany(
+            "INSERT INTO event_citations (event_id, doc_id) VALUES (?, ?)",
+            [(event.id, str(doc_id)) for event, _ in events for doc_id in dict.fromkeys(event.citations)],
+        )
 
+    # endregion
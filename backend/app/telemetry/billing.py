@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 import json
+import os
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
-from threading import Lock
+from threading import Event, Lock, Thread
+from time import monotonic
 from typing import Dict, List
 
 import logging
@@ -17,6 +19,7 @@ from opentelemetry import metrics
 from ..config import Settings, get_settings
 from ..security.authz import Principal
 from ..services.costs import get_cost_tracking_service
+from ..utils.storage import atomic_write_json
 
 _meter = metrics.get_meter(__name__)
 _usage_counter = _meter.create_counter(
@@ -328,40 +331,143 @@ class TenantUsageSnapshot:
 
 
 class BillingTelemetry:
-    """Central registry for billing usage and customer health metrics."""
+    """Central registry for billing usage and customer health metrics.
+
+    In write-behind mode (``billing_write_behind``) each event is numbered and queued as a
+    journal line; a background flusher appends queued lines every
+    ``billing_journal_flush_seconds`` (the durability window, ``0`` writes synchronously)
+    and folds the journal into the JSON snapshot periodically and on :meth:`close`.
+    Startup replays journal entries newer than the snapshot's ``last_seq``.
+    """
 
     def __init__(self, settings: Settings | None = None) -> None:
         self.settings = settings or get_settings()
         self._lock = Lock()
+        self._io_lock = Lock()
         self._usage: Dict[str, TenantUsage] = {}
         self._path: Path = self.settings.billing_usage_path
+        self._journal_path = self._path.with_name(f"{self._path.name}.journal.jsonl")
+        self._write_behind = self.settings.billing_write_behind
+        self._flush_interval = max(0.0, float(self.settings.billing_journal_flush_seconds))
+        self._seq = 0
+        self._pending: List[str] = []
+        self._journal_events = 0
+        self._last_compaction = monotonic()
+        self._stop = Event()
+        self._flusher: Thread | None = None
         self._load()
 
     def _load(self) -> None:
-        if not self._path.exists():
-            return
-        try:
-            payload = json.loads(self._path.read_text(encoding="utf-8"))
-        except Exception:
+        snapshot_seq = 0
+        if self._path.exists():
+            try:
+                payload = json.loads(self._path.read_text(encoding="utf-8"))
+            except Exception:
+                payload = {}
+            with self._lock:
+                for tenant_payload in payload.get("tenants", []):
+                    usage = TenantUsage.from_json(tenant_payload)
+                    self._usage[usage.tenant_id] = usage
+            snapshot_seq = int(payload.get("last_seq", 0) or 0)
+        self._seq = snapshot_seq
+        if not self._journal_path.exists():
             return
         with self._lock:
-            for tenant_payload in payload.get("tenants", []):
-                usage = TenantUsage.from_json(tenant_payload)
-                self._usage[usage.tenant_id] = usage
+            for line in self._journal_path.read_text(encoding="utf-8").splitlines():
+                try:
+                    entry = json.loads(line)
+                    seq = int(entry["seq"])
+                    event_type = BillingEventType(entry["event_type"])
+                except (ValueError, KeyError, TypeError):
+                    continue
+                self._journal_events += 1
+                if seq <= snapshot_seq:
+                    continue
+                usage = self._tenant_usage(entry["tenant_id"], entry["plan_id"], entry["support_tier"])
+                usage.last_event_at = datetime.fromisoformat(entry["at"])
+                self._apply(usage, event_type, float(entry["units"]), bool(entry["success"]), dict(entry["attributes"]))
+                self._seq = max(self._seq, seq)
 
     def _persist(self) -> None:
         snapshot = {
             "generated_at": datetime.now(timezone.utc).isoformat(),
+            "last_seq": self._seq,
             "tenants": [usage.to_json() for usage in self._usage.values()],
         }
         self._path.parent.mkdir(parents=True, exist_ok=True)
-        self._path.write_text(json.dumps(snapshot, indent=2, sort_keys=True), encoding="utf-8")
+        atomic_write_json(self._path, snapshot)
+
+    def flush(self) -> None:
+        """Append queued journal lines and compact the snapshot when it is due."""
+
+        with self._io_lock:
+            with self._lock:
+                lines, self._pending = self._pending, []
+            if lines:
+                self._journal_path.parent.mkdir(parents=True, exist_ok=True)
+                with self._journal_path.open("a", encoding="utf-8") as handle:
+                    handle.write("".join(lines))
+                    handle.flush()
+                    os.fsync(handle.fileno())
+                self._journal_events += len(lines)
+            if self._journal_events >= self.settings.billing_journal_compact_events or (
+                self._journal_events
+                and monotonic() - self._last_compaction >= self.settings.billing_snapshot_interval_seconds
+            ):
+                self._compact_locked()
+
+    def compact(self) -> None:
+        with self._io_lock:
+            self._compact_locked()
+
+    def _compact_locked(self) -> None:
+        # Entries at or below the snapshot's last_seq are skipped on replay, so lines
+        # journaled after this point never double count.
+        with self._lock:
+            self._pending = []
+            self._persist()
+        self._journal_path.unlink(missing_ok=True)
+        self._journal_events = 0
+        self._last_compaction = monotonic()
+
+    def close(self) -> None:
+        """Stop the background flusher and fold everything recorded into the snapshot."""
+
+        self._stop_flusher()
+        if self._write_behind:
+            self.compact()
+
+    def _stop_flusher(self) -> None:
+        self._stop.set()
+        flusher = self._flusher
+        if flusher is not None:
+            flusher.join(timeout=5.0)
+        self._flusher = None
+
+    def _ensure_flusher(self) -> None:
+        if self._flusher is not None or self._stop.is_set():
+            return
+        self._flusher = Thread(target=self._flush_loop, name="billing-journal-flusher", daemon=True)
+        self._flusher.start()
+
+    def _flush_loop(self) -> None:
+        while not self._stop.wait(self._flush_interval):
+            try:
+                self.flush()
+            except Exception:  # pragma: no cover - keep flushing after transient IO errors
+                _logger.exception("Failed to flush billing journal")
 
     def reset(self) -> None:
-        with self._lock:
-            self._usage.clear()
-        if self._path.exists():
-            self._path.unlink()
+        self._stop_flusher()
+        with self._io_lock:
+            with self._lock:
+                self._usage.clear()
+                self._pending = []
+                self._seq = 0
+            self._journal_events = 0
+            self._journal_path.unlink(missing_ok=True)
+            if self._path.exists():
+                self._path.unlink()
 
     def resolve_plan(self, tenant_id: str | None) -> BillingPlan:
         plan_id = self.settings.billing_default_plan
@@ -399,20 +505,11 @@ class BillingTelemetry:
         extra = dict(attributes or {})
 
         with self._lock:
-            usage = self._usage.get(tenant_id)
-            if usage is None:
-                usage = TenantUsage(tenant_id=tenant_id, plan_id=plan.plan_id, support_tier=support_tier)
-                self._usage[tenant_id] = usage
-            if usage.plan_id != plan.plan_id:
-                usage.plan_id = plan.plan_id
-            usage.support_tier = support_tier
+            usage = self._tenant_usage(tenant_id, plan.plan_id, support_tier)
             usage.last_event_at = now
-            usage.record_success(success, units)
-
+            self._apply(usage, event_type, units, success, extra)
             if event_type is BillingEventType.INGESTION:
-                usage.ingestion_jobs += units
                 gigabytes = float(extra.get("gigabytes", 0.0))
-                usage.ingestion_gb += gigabytes
                 if gigabytes > 0:
                     _storage_histogram.record(
                         gigabytes,
@@ -422,21 +519,6 @@ class BillingTelemetry:
                             "event_type": event_type.value,
                         },
                     )
-            elif event_type is BillingEventType.QUERY:
-                usage.query_count += units
-                latency_ms = float(extra.get("latency_ms", 0.0))
-                usage.query_latency_ms_total += latency_ms
-            elif event_type is BillingEventType.TIMELINE:
-                usage.timeline_requests += units
-            elif event_type is BillingEventType.AGENT:
-                usage.agent_runs += units
-            elif event_type is BillingEventType.SIGNUP:
-                seats = int(extra.get("seats", 0))
-                if seats:
-                    usage.seats_requested = max(usage.seats_requested, seats)
-                if extra.get("completed"):
-                    usage.onboarding_completed = True
-                usage.metadata.update({k: v for k, v in extra.items() if k not in {"seats", "completed"}})
 
             ratio = usage.usage_ratio(plan)
             health = usage.health_score(plan, self.settings)
@@ -453,7 +535,64 @@ class BillingTelemetry:
             _health_score_histogram.record(health, attributes=metric_attributes)
             _projected_cost_histogram.record(projected_cost, attributes=metric_attributes)
 
-            self._persist()
+            self._seq += 1
+            if not self._write_behind:
+                self._persist()
+                return
+            entry = {
+                "seq": self._seq,
+                "tenant_id": tenant_id,
+                "plan_id": plan.plan_id,
+                "support_tier": support_tier,
+                "event_type": event_type.value,
+                "units": units,
+                "success": success,
+                "attributes": extra,
+                "at": now.isoformat(),
+            }
+            self._pending.append(json.dumps(entry, sort_keys=True, default=str) + "\n")
+
+        if self._flush_interval <= 0:
+            self.flush()
+        else:
+            self._ensure_flusher()
+
+    def _tenant_usage(self, tenant_id: str, plan_id: str, support_tier: str) -> TenantUsage:
+        usage = self._usage.get(tenant_id)
+        if usage is None:
+            usage = TenantUsage(tenant_id=tenant_id, plan_id=plan_id, support_tier=support_tier)
+            self._usage[tenant_id] = usage
+        if usage.plan_id != plan_id:
+            usage.plan_id = plan_id
+        usage.support_tier = support_tier
+        return usage
+
+    @staticmethod
+    def _apply(
+        usage: TenantUsage,
+        event_type: BillingEventType,
+        units: float,
+        success: bool,
+        extra: Dict[str, object],
+    ) -> None:
+        usage.record_success(success, units)
+        if event_type is BillingEventType.INGESTION:
+            usage.ingestion_jobs += units
+            usage.ingestion_gb += float(extra.get("gigabytes", 0.0))
+        elif event_type is BillingEventType.QUERY:
+            usage.query_count += units
+            usage.query_latency_ms_total += float(extra.get("latency_ms", 0.0))
+        elif event_type is BillingEventType.TIMELINE:
+            usage.timeline_requests += units
+        elif event_type is BillingEventType.AGENT:
+            usage.agent_runs += units
+        elif event_type is BillingEventType.SIGNUP:
+            seats = int(extra.get("seats", 0))
+            if seats:
+                usage.seats_requested = max(usage.seats_requested, seats)
+            if extra.get("completed"):
+                usage.onboarding_completed = True
+            usage.metadata.update({k: v for k, v in extra.items() if k not in {"seats", "completed"}})
 
     def snapshot(self) -> List[TenantUsageSnapshot]:
         with self._lock:
@@ -474,6 +613,16 @@ def get_billing_registry() -> BillingTelemetry:
     return _billing_registry
 
 
+def shutdown_billing_registry() -> None:
+    """Flush and compact the registry's journal; used by the application shutdown hook."""
+
+    global _billing_registry
+    with _registry_lock:
+        if _billing_registry is not None:
+            _billing_registry.close()
+        _billing_registry = None
+
+
 def reset_billing_registry() -> None:
     global _billing_registry
     with _registry_lock:
@@ -9,7 +9,7 @@ from .fallback import (
 from .loader_registry import LoaderRegistry, LoadedDocument
 from .metrics import record_document_yield, record_node_yield, record_pipeline_metrics
 from .ocr import OcrEngine, OcrResult
-from .pipeline import PipelineResult, run_ingestion_pipeline
+from .pipeline import PipelineResult, run_ingestion_pipeline, stream_ingestion_pipeline
 from .settings import (
     EmbeddingConfig,
     EmbeddingProvider,
@@ -35,6 +35,7 @@ __all__ = [
     "OcrResult",
     "PipelineResult",
     "run_ingestion_pipeline",
+    "stream_ingestion_pipeline",
     "EmbeddingConfig",
     "EmbeddingProvider",
     "IngestionCostMode",
@@ -0,0 +1,123 @@
+"""Persistent, content-addressed cache for chunk embeddings."""
+
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+from array import array
+from pathlib import Path
+from threading import Lock
+from typing import Dict, List, Mapping, Sequence
+
+from .metrics import record_embedding_cache
+
+
+def text_digest(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    """SQLite-backed embedding cache keyed by ``(model id, dimensions, sha256(text))``.
+
+    Entries carry a monotonically increasing ``last_used`` stamp; once the cache holds more
+    than ``max_entries`` rows the least recently used ones are evicted.
+    """
+
+    def __init__(self, path: Path, *, model_id: str, dimensions: int | None, max_entries: int) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.model_id = model_id
+        self.dimensions = int(dimensions or 0)
+        self.max_entries = max(1, int(max_entries))
+        self.hits = 0
+        self.misses = 0
+        self._lock = Lock()
+        self._connection = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS embeddings (
+                model TEXT NOT NULL,
+                dimensions INTEGER NOT NULL,
+                digest TEXT NOT NULL,
+                vector BLOB NOT NULL,
+                last_used INTEGER NOT NULL,
+                PRIMARY KEY (model, dimensions, digest)
+            )
+            """
+        )
+        self._connection.execute("CREATE INDEX IF NOT EXISTS embeddings_lru ON embeddings (last_used)")
+        self._connection.commit()
+        row = self._connection.execute("SELECT COALESCE(MAX(last_used), 0), COUNT(*) FROM embeddings").fetchone()
+        self._clock = int(row[0])
+        self._size = int(row[1])
+
+    def __len__(self) -> int:
+        return self._size
+
+    def get_many(self, texts: Sequence[str]) -> Dict[str, List[float]]:
+        """Return cached vectors for ``texts`` keyed by their sha256 digest."""
+
+        digests = list(dict.fromkeys(text_digest(text) for text in texts))
+        found: Dict[str, List[float]] = {}
+        if not digests:
+            return found
+        with self._lock:
+            for offset in range(0, len(digests), 500):
+                chunk = digests[offset : offset + 500]
+                placeholders = ",".join("?" for _ in chunk)
+                rows = self._connection.execute(
+                    f"SELECT digest, vector FROM embeddings WHERE model = ? AND dimensions = ? "
+                    f"AND digest IN ({placeholders})",
+                    (self.model_id, self.dimensions, *chunk),
+                ).fetchall()
+                for digest, blob in rows:
+                    found[digest] = array("d", blob).tolist()
+            if found:
+                self._clock += 1
+                self._connection.executemany(
+                    "UPDATE embeddings SET last_used = ? WHERE model = ? AND dimensions = ? AND digest = ?",
+                    [(self._clock, self.model_id, self.dimensions, digest) for digest in found],
+                )
+                self._connection.commit()
+            hits = len(found)
+            misses = len(digests) - hits
+            self.hits += hits
+            self.misses += misses
+        record_embedding_cache(hits, misses, model=self.model_id)
+        return found
+
+    def put_many(self, vectors: Mapping[str, Sequence[float]]) -> None:
+        """Store vectors keyed by the chunk text they embed."""
+
+        if not vectors:
+            return
+        with self._lock:
+            self._clock += 1
+            rows = [
+                (self.model_id, self.dimensions, text_digest(text), array("d", vector).tobytes(), self._clock)
+                for text, vector in vectors.items()
+            ]
+            before = self._connection.total_changes
+            self._connection.executemany(
+                "INSERT OR IGNORE INTO embeddings (model, dimensions, digest, vector, last_used) "
+                "VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._size += self._connection.total_changes - before
+            if self._size > self.max_entries:
+                excess = self._size - self.max_entries
+                self._connection.execute(
+                    "DELETE FROM embeddings WHERE rowid IN "
+                    "(SELECT rowid FROM embeddings ORDER BY last_used ASC LIMIT ?)",
+                    (excess,),
+                )
+                self._size -= excess
+            self._connection.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+__all__ = ["EmbeddingCache", "text_digest"]
@@ -11,6 +11,8 @@ class MetadataModeEnum:
     """Minimal stand-in for LlamaIndex metadata mode enum."""
 
     ALL = "ALL"
+    EMBED = "EMBED"
+    LLM = "LLM"
 
 
 @dataclass
@@ -18,9 +20,18 @@ class FallbackDocument:
     text: str
     metadata: Dict[str, object]
 
-    def __init__(self, text: str, metadata: Dict[str, object] | None = None, metadata_mode: object | None = None) -> None:
+    def __init__(
+        self,
+        text: str,
+        metadata: Dict[str, object] | None = None,
+        metadata_mode: object | None = None,
+        excluded_embed_metadata_keys: List[str] | None = None,
+        excluded_llm_metadata_keys: List[str] | None = None,
+    ) -> None:
         self.text = text
         self.metadata = metadata or {}
+        self.excluded_embed_metadata_keys = list(excluded_embed_metadata_keys or [])
+        self.excluded_llm_metadata_keys = list(excluded_llm_metadata_keys or [])
 
     def get_content(self, metadata_mode: object | None = None) -> str:
         return self.text
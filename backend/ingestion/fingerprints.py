@@ -0,0 +1,99 @@
+"""Per-source file fingerprints used to skip unchanged files before they are loaded."""
+
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from threading import Lock
+from typing import Dict, Tuple
+
+from .utils import compute_sha256
+
+
+@dataclass(frozen=True, slots=True)
+class FileFingerprint:
+    """Size, modification time and content hash of a file at one point in time."""
+
+    size: int
+    mtime_ns: int
+    sha256: str
+
+
+class FingerprintManifest:
+    """JSON manifest of the fingerprints last committed for one ingestion root.
+
+    :meth:`check` answers from ``stat`` alone when a file's size and mtime match the
+    manifest and hashes the file exactly once otherwise, so the digest it returns can be
+    reused as the document checksum. Fingerprints only become part of the manifest through
+    :meth:`commit`, after the caller has durably ingested the file.
+    """
+
+    def __init__(self, path: Path, root: Path) -> None:
+        self.path = Path(path)
+        self.root = Path(root)
+        self._lock = Lock()
+        self._entries: Dict[str, FileFingerprint] = {}
+        self._observed: Dict[str, FileFingerprint] = {}
+        self._dirty = False
+        if self.path.exists():
+            try:
+                raw = json.loads(self.path.read_text(encoding="utf-8"))
+            except (OSError, json.JSONDecodeError):
+                raw = {}
+            self._entries = {key: FileFingerprint(*value) for key, value in raw.items()}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def check(self, path: Path) -> Tuple[FileFingerprint, bool]:
+        """Return ``path``'s current fingerprint and whether its content is unchanged."""
+
+        key = self._key(path)
+        stat = path.stat()
+        with self._lock:
+            known = self._entries.get(key)
+        if known is not None and known.size == stat.st_size and known.mtime_ns == stat.st_mtime_ns:
+            return known, True
+        fingerprint = FileFingerprint(stat.st_size, stat.st_mtime_ns, compute_sha256(path))
+        with self._lock:
+            self._observed[key] = fingerprint
+            if known is not None and known.sha256 == fingerprint.sha256:
+                # Touched but identical: remember the new mtime so the next check is stat-only.
+                self._entries[key] = fingerprint
+                self._dirty = True
+                return fingerprint, True
+        return fingerprint, False
+
+    def commit(self, path: Path) -> None:
+        """Record the fingerprint :meth:`check` observed for ``path`` as ingested."""
+
+        key = self._key(path)
+        with self._lock:
+            fingerprint = self._observed.pop(key, None)
+            if fingerprint is not None:
+                self._entries[key] = fingerprint
+                self._dirty = True
+
+    def save(self) -> None:
+        with self._lock:
+            if not self._dirty:
+                return
+            payload = {
+                key: [value.size, value.mtime_ns, value.sha256] for key, value in sorted(self._entries.items())
+            }
+            self._dirty = False
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp = self.path.with_name(f".{self.path.name}.tmp")
+        temp.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+        os.replace(temp, self.path)
+
+    def _key(self, path: Path) -> str:
+        try:
+            return path.relative_to(self.root).as_posix()
+        except ValueError:
+            return path.as_posix()
+
+
+__all__ = ["FileFingerprint", "FingerprintManifest"]
@@ -101,6 +101,9 @@ except ModuleNotFoundError:  # pragma: no cover - fallback for lightweight envir
         def get_query_embedding(self, text: str) -> list[float]:  # pragma: no cover - interface shim
             return self.get_text_embedding(text)
 
+        def get_text_embedding_batch(self, texts: list[str], **_: Any) -> list[list[float]]:  # pragma: no cover
+            return [self.get_text_embedding(text) for text in texts]
+
 
 class LocalHuggingFaceEmbedding(_BaseEmbedding):
     """Deterministic local embedding emulating HF behaviour without remote downloads."""
@@ -126,6 +129,9 @@ class LocalHuggingFaceEmbedding(_BaseEmbedding):
     def get_text_embedding(self, text: str) -> list[float]:
         return self._encode(text)
 
+    def get_text_embedding_batch(self, texts: list[str], **_: Any) -> list[list[float]]:
+        return [self._encode(text) for text in texts]
+
     def get_query_embedding(self, text: str) -> list[float]:
         return self._encode(text)
 
@@ -10,7 +10,7 @@ from email.policy import default as default_email_policy
 from importlib import import_module
 from importlib.util import find_spec
 from pathlib import Path
-from typing import Callable, Dict, Iterable, List, Optional, Protocol, Tuple
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Protocol, Tuple
 
 from .fallback import FallbackDocument, MetadataModeEnum
 
@@ -18,6 +18,7 @@ from backend.app.models.api import IngestionSource
 from backend.app.utils.text import read_text
 
 from .ocr import OcrEngine, OcrResult
+from .ocr_tokens import OcrTokenStore
 from .settings import LlamaIndexRuntimeConfig
 from .utils import compute_sha256
 
@@ -62,6 +63,32 @@ MetadataMode = _resolve_llama_index_metadata_mode()
 METADATA_MODE_ALL = getattr(MetadataMode, "ALL", MetadataModeEnum.ALL)
 
 
+# Provenance keys that say nothing about a document's content; they stay in metadata and
+# vector payloads but are kept out of the text sent to embedding models and LLMs.
+TEXT_EXCLUDED_METADATA_KEYS = (
+    "origin_uri",
+    "source_type",
+    "source_path",
+    "mime_type",
+    "size_bytes",
+    "ocr_engine",
+    "ocr_confidence",
+    "ocr_tokens_ref",
+    "ocr_token_count",
+)
+
+
+def build_document(text: str, metadata: Dict[str, object]) -> DocumentLike:
+    """Create a LlamaIndex document whose embed and LLM text omit provenance metadata."""
+
+    return Document(
+        text=text,
+        metadata=metadata,
+        excluded_embed_metadata_keys=list(TEXT_EXCLUDED_METADATA_KEYS),
+        excluded_llm_metadata_keys=list(TEXT_EXCLUDED_METADATA_KEYS),
+    )
+
+
 @dataclass
 class LoadedDocument:
     """Container holding a LlamaIndex document plus provenance metadata."""
@@ -96,6 +123,7 @@ class LoaderRegistry:
     _OCR_IMAGE_EXTENSIONS = {".png", ".jpg", ".jpeg", ".bmp", ".tif", ".tiff"}
     _DOCX_EXTENSIONS = {".docx"}
     _PDF_EXTENSION = ".pdf"
+    _REMOTE_SOURCES = {"sharepoint", "onedrive", "gmail", "imap", "gdrive"}
 
     def __init__(
         self,
@@ -111,42 +139,74 @@ class LoaderRegistry:
         self.logger = logger
         self.hub_factory = hub_factory or HubLoaderFactory()
         self._resolve_credentials = credential_resolver
+        self.ocr_tokens = OcrTokenStore(runtime_config.llama_cache_dir / "ocr_tokens")
 
     def load_documents(
         self, materialized_root: Path, source: IngestionSource, *, origin: str
     ) -> List[LoadedDocument]:
-        source_type = source.type.lower()
-        if source_type in {"sharepoint", "onedrive", "gmail", "imap", "gdrive"}:
-            return self._load_via_llamahub(source, origin)
-        return list(self._load_from_workspace(materialized_root, source, origin))
+        return list(self.iter_documents(materialized_root, source, origin=origin))
+
+    def iter_documents(
+        self, materialized_root: Path, source: IngestionSource, *, origin: str
+    ) -> Iterator[LoadedDocument]:
+        """Yield documents one at a time so callers never hold the whole source in memory."""
+
+        if self.is_remote(source):
+            return iter(self._load_via_llamahub(source, origin))
+        return iter(self._load_from_workspace(materialized_root, source, origin))
+
+    def is_remote(self, source: IngestionSource) -> bool:
+        """Return whether ``source`` is read through a LlamaHub connector rather than files."""
+
+        return source.type.lower() in self._REMOTE_SOURCES
+
+    def iter_workspace_paths(self, root: Path) -> Iterator[Path]:
+        """Yield the files under ``root`` in the order :meth:`iter_documents` loads them."""
+
+        for path in sorted(root.rglob("*")):
+            if path.is_file():
+                yield path
+
+    def load_path(
+        self, path: Path, source: IngestionSource, origin: str, *, checksum: Optional[str] = None
+    ) -> LoadedDocument:
+        """Load a single workspace file with the loader matching its extension.
+
+        ``checksum`` is the file's SHA-256 when the caller has already hashed it; otherwise
+        the loader hashes the file itself.
+        """
+
+        suffix = path.suffix.lower()
+        if suffix == self._PDF_EXTENSION:
+            loader = self._load_pdf
+        elif suffix in self._OCR_IMAGE_EXTENSIONS:
+            loader = self._load_image
+        elif suffix in self._EMAIL_EXTENSIONS:
+            loader = self._load_email
+        elif suffix in self._DOCX_EXTENSIONS:
+            loader = self._load_docx
+        else:
+            loader = self._load_text
+        return loader(path, source, origin, checksum=checksum or compute_sha256(path))
 
     # ------------------------------------------------------------------
     def _load_from_workspace(
         self, root: Path, source: IngestionSource, origin: str
     ) -> Iterable[LoadedDocument]:
-        for path in sorted(root.rglob("*")):
-            if not path.is_file():
-                continue
-            suffix = path.suffix.lower()
-            if suffix == self._PDF_EXTENSION:
-                yield self._load_pdf(path, source, origin)
-            elif suffix in self._OCR_IMAGE_EXTENSIONS:
-                yield self._load_image(path, source, origin)
-            elif suffix in self._EMAIL_EXTENSIONS:
-                yield self._load_email(path, source, origin)
-            elif suffix in self._DOCX_EXTENSIONS:
-                yield self._load_docx(path, source, origin)
-            else:
-                yield self._load_text(path, source, origin)
-
-    def _load_text(self, path: Path, source: IngestionSource, origin: str) -> LoadedDocument:
+        for path in self.iter_workspace_paths(root):
+            yield self.load_path(path, source, origin)
+
+    def _load_text(
+        self, path: Path, source: IngestionSource, origin: str, *, checksum: str
+    ) -> LoadedDocument:
         text = read_text(path)
         metadata = self._base_metadata(path, source, origin)
-        document = Document(text=text, metadata=metadata, metadata_mode=METADATA_MODE_ALL)
-        checksum = compute_sha256(path)
+        document = build_document(text, metadata)
         return LoadedDocument(source=source, path=path, document=document, text=text, checksum=checksum, metadata=metadata, ocr=None)
 
-    def _load_pdf(self, path: Path, source: IngestionSource, origin: str) -> LoadedDocument:
+    def _load_pdf(
+        self, path: Path, source: IngestionSource, origin: str, *, checksum: str
+    ) -> LoadedDocument:
         ocr_result = self.ocr_engine.extract_from_pdf(path)
         text = ocr_result.text or read_text(path)
         metadata = self._base_metadata(path, source, origin)
@@ -154,38 +214,41 @@ class LoaderRegistry:
             {
                 "ocr_engine": ocr_result.engine,
                 "ocr_confidence": ocr_result.confidence,
-                "ocr_tokens": ocr_result.tokens,
+                **self._ocr_token_metadata(checksum, text, ocr_result),
             }
         )
-        document = Document(text=text, metadata=metadata, metadata_mode=METADATA_MODE_ALL)
-        checksum = compute_sha256(path)
+        document = build_document(text, metadata)
         return LoadedDocument(source=source, path=path, document=document, text=text, checksum=checksum, metadata=metadata, ocr=ocr_result)
 
-    def _load_image(self, path: Path, source: IngestionSource, origin: str) -> LoadedDocument:
+    def _load_image(
+        self, path: Path, source: IngestionSource, origin: str, *, checksum: str
+    ) -> LoadedDocument:
         ocr_result = self.ocr_engine.extract_from_image(path)
         metadata = self._base_metadata(path, source, origin)
         metadata.update(
             {
                 "ocr_engine": ocr_result.engine,
                 "ocr_confidence": ocr_result.confidence,
-                "ocr_tokens": ocr_result.tokens,
+                **self._ocr_token_metadata(checksum, ocr_result.text, ocr_result),
             }
         )
-        document = Document(text=ocr_result.text, metadata=metadata, metadata_mode=METADATA_MODE_ALL)
-        checksum = compute_sha256(path)
+        document = build_document(ocr_result.text, metadata)
         return LoadedDocument(source=source, path=path, document=document, text=ocr_result.text, checksum=checksum, metadata=metadata, ocr=ocr_result)
 
-    def _load_docx(self, path: Path, source: IngestionSource, origin: str) -> LoadedDocument:
+    def _load_docx(
+        self, path: Path, source: IngestionSource, origin: str, *, checksum: str
+    ) -> LoadedDocument:
         from docx import Document as DocxDocument
 
         docx = DocxDocument(str(path))
         text = "\n".join(paragraph.text for paragraph in docx.paragraphs)
         metadata = self._base_metadata(path, source, origin)
-        document = Document(text=text, metadata=metadata, metadata_mode=METADATA_MODE_ALL)
-        checksum = compute_sha256(path)
+        document = build_document(text, metadata)
         return LoadedDocument(source=source, path=path, document=document, text=text, checksum=checksum, metadata=metadata, ocr=None)
 
-    def _load_email(self, path: Path, source: IngestionSource, origin: str) -> LoadedDocument:
+    def _load_email(
+        self, path: Path, source: IngestionSource, origin: str, *, checksum: str
+    ) -> LoadedDocument:
         raw = path.read_bytes()
         if path.suffix.lower() == ".msg":
             from extract_msg import Message  # type: ignore
@@ -209,8 +272,7 @@ class LoaderRegistry:
             }
         base = self._base_metadata(path, source, origin)
         base.update({f"email_{key}": value for key, value in metadata.items() if value})
-        document = Document(text=text, metadata=base, metadata_mode=MetadataMode.ALL)
-        checksum = compute_sha256(path)
+        document = build_document(text, base)
         return LoadedDocument(source=source, path=path, document=document, text=text, checksum=checksum, metadata=base, ocr=None)
 
     def _load_via_llamahub(self, source: IngestionSource, origin: str) -> List[LoadedDocument]:
@@ -237,7 +299,7 @@ class LoaderRegistry:
                 LoadedDocument(
                     source=source,
                     path=fake_path,
-                    document=Document(text=text, metadata=metadata, metadata_mode=METADATA_MODE_ALL),
+                    document=build_document(text, metadata),
                     text=text,
                     checksum=checksum,
                     metadata=metadata,
@@ -246,6 +308,13 @@ class LoaderRegistry:
             )
         return documents
 
+    def _ocr_token_metadata(self, checksum: str, text: str, ocr_result: OcrResult) -> Dict[str, object]:
+        if not ocr_result.tokens:
+            return {}
+        # Sidecars are content-addressed, so duplicate exhibits share one file.
+        ref = self.ocr_tokens.write(checksum, text, ocr_result.tokens)
+        return {"ocr_tokens_ref": ref, "ocr_token_count": len(ocr_result.tokens)}
+
     def _base_metadata(self, path: Path, source: IngestionSource, origin: str) -> Dict[str, object]:
         mime_type, _ = mimetypes.guess_type(path.name)
         return {
@@ -34,6 +34,30 @@ _PIPELINE_ERRORS = _meter.create_counter(
     description="Pipeline failures",
 )
 
+_EMBEDDING_BATCH_DURATION = _meter.create_histogram(
+    "ingestion.embedding.batch.duration",
+    unit="s",
+    description="Time taken to embed one batch of nodes",
+)
+
+_EMBEDDING_BATCH_SIZE = _meter.create_histogram(
+    "ingestion.embedding.batch.size",
+    unit="1",
+    description="Nodes embedded per batch",
+)
+
+_EMBEDDING_CACHE_LOOKUPS = _meter.create_counter(
+    "ingestion.embedding.cache.lookups",
+    unit="1",
+    description="Embedding cache lookups partitioned by hit or miss",
+)
+
+_OCR_CACHE_LOOKUPS = _meter.create_counter(
+    "ingestion.ocr.cache.lookups",
+    unit="1",
+    description="OCR page cache lookups partitioned by hit or miss",
+)
+
 _JOB_STATUS_TRANSITIONS = _meter.create_counter(
     "ingestion.job.status_transitions",
     unit="1",
@@ -72,6 +96,25 @@ def record_document_yield(count: int, *, source_type: str, job_id: str) -> None:
         _PIPELINE_DOCUMENTS.add(count, {"source_type": source_type, "job_id": job_id})
 
 
+def record_embedding_batch(size: int, elapsed: float, *, source_type: str, job_id: str) -> None:
+    """Record the size and latency of a single embedding batch."""
+
+    attributes = {"source_type": source_type, "job_id": job_id}
+    _EMBEDDING_BATCH_DURATION.record(elapsed, attributes)
+    _EMBEDDING_BATCH_SIZE.record(size, attributes)
+
+
+def record_embedding_cache(hits: int, misses: int, *, model: str) -> None:
+    if hits:
+        _EMBEDDING_CACHE_LOOKUPS.add(hits, {"model": model, "result": "hit"})
+    if misses:
+        _EMBEDDING_CACHE_LOOKUPS.add(misses, {"model": model, "result": "miss"})
+
+
+def record_ocr_cache(hit: bool, *, engine: str) -> None:
+    _OCR_CACHE_LOOKUPS.add(1, {"engine": engine, "result": "hit" if hit else "miss"})
+
+
 def record_job_transition(job_id: str, previous: str | None, new: str) -> None:
     """Count a lifecycle transition for an ingestion job."""
 
@@ -94,6 +137,9 @@ __all__ = [
     "record_pipeline_metrics",
     "record_node_yield",
     "record_document_yield",
+    "record_embedding_batch",
+    "record_embedding_cache",
+    "record_ocr_cache",
     "record_job_transition",
     "record_queue_event",
 ]
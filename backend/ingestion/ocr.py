@@ -6,9 +6,11 @@ import base64
 import io
 import json
 import logging
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple
 
 import httpx
 from PIL import Image
@@ -37,12 +39,19 @@ except ModuleNotFoundError:  # pragma: no cover - offline fallback
     Output = _FallbackOutput()
     TesseractNotFoundError = _MissingTesseract
 
+from .ocr_cache import OcrCache, image_digest
 from .settings import OcrConfig, OcrProvider
 
+_TESSERACT_FLAGS = "--oem 3 --psm 6"
+
 
 @dataclass
 class OcrResult:
-    """Structured OCR response used for provenance metadata."""
+    """Structured OCR response used for provenance metadata.
+
+    Tokens produced by tesseract carry ``start``, the character offset of their word in
+    ``text``; other engines may omit it.
+    """
 
     text: str
     engine: str
@@ -60,22 +69,59 @@ class OcrEngine:
             import os
 
             os.environ.setdefault("TESSDATA_PREFIX", str(config.tessdata_path))
+        self.cache: OcrCache | None = None
+        if config.cache_path and config.cache_max_entries > 0:
+            self.cache = OcrCache(
+                config.cache_path,
+                signature=f"tesseract:{config.languages or 'eng'}:{_TESSERACT_FLAGS}",
+                max_entries=config.cache_max_entries,
+            )
 
     def extract_from_pdf(self, path: Path) -> OcrResult:
+        """Extract text from every page, OCR-ing scanned pages in parallel.
+
+        pypdf is not thread-safe, so pages are read and their images decoded from the PDF
+        on this thread; only recognition runs on the pool. Results are collected in page
+        order, with at most twice the worker count of scanned pages in flight.
+        """
+
         reader = PdfReader(str(path))
         fragments: List[str] = []
         tokens: List[Dict[str, Any]] = []
-        for page_index, page in enumerate(reader.pages):
-            extracted = (page.extract_text() or "").strip()
-            if extracted:
-                fragments.append(extracted)
-                continue
-            self.logger.debug("Running OCR on rasterised PDF page", extra={"page": page_index, "path": str(path)})
-            page_tokens, page_text = self._extract_images_from_page(page)
-            tokens.extend(page_tokens)
+        workers = max(1, self.config.workers)
+        ordered: Deque[str | Future] = deque()
+        length = 0
+
+        def collect(item: str | Future) -> None:
+            nonlocal length
+            page_tokens: List[Dict[str, Any]] = []
+            if isinstance(item, str):
+                page_text = item
+            else:
+                page_tokens, page_text = item.result()
+            # Offsets are rebased onto the joined text, which separates pages with "\n\n".
+            offset = length + 2 if fragments else length
+            tokens.extend(_shift_tokens(page_tokens, offset))
             if page_text:
                 fragments.append(page_text)
-        text = "\n\n".join(fragment for fragment in fragments if fragment)
+                length = offset + len(page_text)
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ocr-page") as pool:
+            for page_index, page in enumerate(reader.pages):
+                extracted = (page.extract_text() or "").strip()
+                if extracted:
+                    ordered.append(extracted)
+                else:
+                    self.logger.debug(
+                        "Running OCR on rasterised PDF page", extra={"page": page_index, "path": str(path)}
+                    )
+                    images = [image.data for image in getattr(page, "images", [])]
+                    ordered.append(pool.submit(self._extract_images_from_page, images))
+                while ordered and (isinstance(ordered[0], str) or len(ordered) > 2 * workers):
+                    collect(ordered.popleft())
+            while ordered:
+                collect(ordered.popleft())
+        text = "\n\n".join(fragments)
         confidence = _average_confidence(tokens)
         return OcrResult(text=text, engine=self.config.provider.value, confidence=confidence, tokens=tokens)
 
@@ -85,22 +131,24 @@ class OcrEngine:
 
     # Internal helpers -------------------------------------------------
 
-    def _extract_images_from_page(self, page) -> Tuple[List[Dict[str, Any]], str]:
+    def _extract_images_from_page(self, images: List[bytes]) -> Tuple[List[Dict[str, Any]], str]:
         tokens: List[Dict[str, Any]] = []
         fragments: List[str] = []
-        for image_index, image in enumerate(getattr(page, "images", [])):
+        length = 0
+        for image_index, image_bytes in enumerate(images):
             try:
-                with Image.open(io.BytesIO(image.data)) as img:
-                    result = self._image_to_tokens(img)
+                result = self._recognise(image_bytes)
             except Exception:  # pragma: no cover - defensive guard
                 self.logger.exception(
                     "Failed to decode PDF image for OCR",
                     extra={"image_index": image_index},
                 )
                 continue
-            tokens.extend(result.tokens)
+            offset = length + 1 if fragments else length
+            tokens.extend(_shift_tokens(result.tokens, offset))
             if result.text:
                 fragments.append(result.text)
+                length = offset + len(result.text)
         text = "\n".join(fragments)
         return tokens, text
 
@@ -112,8 +160,7 @@ class OcrEngine:
             confidence = vision_payload.get("confidence")
             return OcrResult(text=text, engine="vision", confidence=confidence, tokens=tokens)
         try:
-            with Image.open(io.BytesIO(image_bytes)) as image:
-                return self._image_to_tokens(image, source=source)
+            return self._recognise(image_bytes, source=source)
         except (pytesseract.TesseractError, TesseractNotFoundError) as exc:  # pragma: no cover - escalated to fallback
             fallback = self.config.extra.get("vision_fallback") if self.config.extra else None
             if not fallback:
@@ -132,18 +179,40 @@ class OcrEngine:
             confidence = payload.get("confidence")
             return OcrResult(text=text, engine="vision", confidence=confidence, tokens=tokens)
 
+    def _recognise(self, image_bytes: bytes, source: str | None = None) -> OcrResult:
+        """Run tesseract on encoded image bytes, answering from the page cache when possible."""
+
+        digest = image_digest(image_bytes) if self.cache is not None else ""
+        if self.cache is not None:
+            cached = self.cache.get(digest)
+            if cached is not None:
+                text, confidence, tokens = cached
+                for token in tokens:
+                    token["source"] = source
+                return OcrResult(text=text, engine="tesseract", confidence=confidence, tokens=tokens)
+        with Image.open(io.BytesIO(image_bytes)) as image:
+            result = self._image_to_tokens(image, source=source)
+        if self.cache is not None:
+            # Tokens are stored without their source so duplicate exhibits can share entries.
+            stored = [{**token, "source": None} for token in result.tokens]
+            self.cache.put(digest, result.text, result.confidence, stored)
+        return result
+
     def _image_to_tokens(self, image: Image.Image, source: str | None = None) -> OcrResult:
         languages = self.config.languages or "eng"
-        tess_config = "--oem 3 --psm 6"
-        data = pytesseract.image_to_data(image, lang=languages, config=tess_config, output_type=Output.DICT)
+        data = pytesseract.image_to_data(image, lang=languages, config=_TESSERACT_FLAGS, output_type=Output.DICT)
         tokens: List[Dict[str, Any]] = []
         fragments: List[str] = []
+        cursor = 0
         for idx, text in enumerate(data.get("text", [])):
             if not text:
                 continue
+            if fragments:
+                cursor += 1
             conf = _coerce_confidence(data.get("conf", [None])[idx])
             token_payload = {
                 "text": text,
+                "start": cursor,
                 "confidence": conf,
                 "left": data.get("left", [None])[idx],
                 "top": data.get("top", [None])[idx],
@@ -153,6 +222,7 @@ class OcrEngine:
             }
             tokens.append(token_payload)
             fragments.append(text)
+            cursor += len(text)
         text = " ".join(fragments)
         confidence = _average_confidence(tokens)
         return OcrResult(text=text, engine="tesseract", confidence=confidence, tokens=tokens)
@@ -176,6 +246,17 @@ class OcrEngine:
             return response.json()
 
 
+def _shift_tokens(tokens: List[Dict[str, Any]], offset: int) -> List[Dict[str, Any]]:
+    """Return copies of ``tokens`` with their ``start`` moved ``offset`` characters on."""
+
+    if not offset:
+        return list(tokens)
+    return [
+        {**token, "start": token["start"] + offset} if isinstance(token.get("start"), int) else token
+        for token in tokens
+    ]
+
+
 def _average_confidence(tokens: Iterable[Dict[str, Any]]) -> Optional[float]:
     confidences: List[float] = []
     for token in tokens:
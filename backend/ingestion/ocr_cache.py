@@ -0,0 +1,108 @@
+"""Persistent, content-addressed cache for OCR output of page images."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+from pathlib import Path
+from threading import Lock
+from typing import Any, Dict, List, Optional, Tuple
+
+from .metrics import record_ocr_cache
+
+CachedOcr = Tuple[str, Optional[float], List[Dict[str, Any]]]
+
+
+def image_digest(image_bytes: bytes) -> str:
+    return hashlib.sha256(image_bytes).hexdigest()
+
+
+class OcrCache:
+    """SQLite-backed OCR cache keyed by ``(engine signature, sha256(image bytes))``.
+
+    The signature folds in the recognition settings (languages, tesseract flags), so
+    changing them never serves stale text. Entries are evicted least recently used once
+    the cache holds more than ``max_entries`` rows.
+    """
+
+    def __init__(self, path: Path, *, signature: str, max_entries: int) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.signature = signature
+        self.max_entries = max(1, int(max_entries))
+        self.hits = 0
+        self.misses = 0
+        self._lock = Lock()
+        self._connection = sqlite3.connect(str(self.path), check_same_thread=False, timeout=30.0)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS ocr_pages (
+                signature TEXT NOT NULL,
+                digest TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                last_used INTEGER NOT NULL,
+                PRIMARY KEY (signature, digest)
+            )
+            """
+        )
+        self._connection.execute("CREATE INDEX IF NOT EXISTS ocr_pages_lru ON ocr_pages (last_used)")
+        self._connection.commit()
+        row = self._connection.execute("SELECT COALESCE(MAX(last_used), 0), COUNT(*) FROM ocr_pages").fetchone()
+        self._clock = int(row[0])
+        self._size = int(row[1])
+
+    def __len__(self) -> int:
+        return self._size
+
+    def get(self, digest: str) -> CachedOcr | None:
+        """Return ``(text, confidence, tokens)`` recognised earlier for the image ``digest``."""
+
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT payload FROM ocr_pages WHERE signature = ? AND digest = ?",
+                (self.signature, digest),
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._clock += 1
+                self._connection.execute(
+                    "UPDATE ocr_pages SET last_used = ? WHERE signature = ? AND digest = ?",
+                    (self._clock, self.signature, digest),
+                )
+                self._connection.commit()
+        record_ocr_cache(row is not None, engine=self.signature)
+        if row is None:
+            return None
+        text, confidence, tokens = json.loads(row[0])
+        return text, confidence, tokens
+
+    def put(self, digest: str, text: str, confidence: Optional[float], tokens: List[Dict[str, Any]]) -> None:
+        payload = json.dumps([text, confidence, tokens], separators=(",", ":"))
+        with self._lock:
+            self._clock += 1
+            before = self._connection.total_changes
+            self._connection.execute(
+                "INSERT OR IGNORE INTO ocr_pages (signature, digest, payload, last_used) VALUES (?, ?, ?, ?)",
+                (self.signature, digest, payload, self._clock),
+            )
+            self._size += self._connection.total_changes - before
+            if self._size > self.max_entries:
+                excess = self._size - self.max_entries
+                self._connection.execute(
+                    "DELETE FROM ocr_pages WHERE rowid IN "
+                    "(SELECT rowid FROM ocr_pages ORDER BY last_used ASC LIMIT ?)",
+                    (excess,),
+                )
+                self._size -= excess
+            self._connection.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+__all__ = ["OcrCache", "image_digest"]
@@ -0,0 +1,159 @@
+"""Columnar sidecar files holding OCR token geometry outside document metadata."""
+
+from __future__ import annotations
+
+import math
+import os
+import struct
+import sys
+from array import array
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Sequence
+
+_MAGIC = b"CCOCRTK1"
+_HEADER = struct.Struct("<8sI")
+_INT_COLUMNS = ("start", "end", "left", "top", "width", "height")
+
+
+@dataclass(frozen=True)
+class OcrTokenColumns:
+    """Parallel arrays describing every OCR token of one document.
+
+    ``start``/``end`` are character offsets into the document text (``-1`` when a token
+    could not be located), boxes are in source image pixels with ``-1`` for unknown
+    values, and ``confidence`` is ``nan`` where the engine reported none. ``words`` holds
+    each token's recognised text.
+    """
+
+    start: array
+    end: array
+    left: array
+    top: array
+    width: array
+    height: array
+    confidence: array
+    words: Sequence[str]
+
+    def __len__(self) -> int:
+        return len(self.start)
+
+    def tokens(self) -> List[Dict[str, Any]]:
+        """Rebuild the per-token dicts the OCR engine produced."""
+
+        rebuilt: List[Dict[str, Any]] = []
+        for index in range(len(self)):
+            confidence = self.confidence[index]
+            rebuilt.append(
+                {
+                    "text": self.words[index],
+                    "confidence": None if math.isnan(confidence) else confidence,
+                    "left": _unknown_as_none(self.left[index]),
+                    "top": _unknown_as_none(self.top[index]),
+                    "width": _unknown_as_none(self.width[index]),
+                    "height": _unknown_as_none(self.height[index]),
+                }
+            )
+        return rebuilt
+
+
+class OcrTokenStore:
+    """Write and read one sidecar per document, addressed by a caller-chosen reference.
+
+    Documents reference their sidecar from metadata by id instead of carrying the token
+    list, so the geometry is never copied into chunk metadata, vector payloads, or text
+    sent to embedding models and LLMs.
+    """
+
+    SUFFIX = ".tokens"
+
+    def __init__(self, root: Path) -> None:
+        self.root = Path(root)
+
+    def path_for(self, ref: str) -> Path:
+        return self.root / ref[:2] / f"{ref}{self.SUFFIX}"
+
+    def write(self, ref: str, text: str, tokens: Sequence[Mapping[str, Any]]) -> str:
+        """Store ``tokens`` for ``text``.
+
+        Offsets come from each token's ``start`` when the OCR engine recorded one; otherwise
+        the word is searched for after the previous token.
+        """
+
+        columns = {name: array("i") for name in _INT_COLUMNS}
+        confidence = array("f")
+        encoded_words: List[bytes] = []
+        word_ends = array("i")
+        cursor = 0
+        for token in tokens:
+            word = str(token.get("text") or "")
+            start = token.get("start")
+            if not isinstance(start, int) or start < 0 or text[start : start + len(word)] != word:
+                start = text.find(word, cursor) if word else -1
+            if start >= 0:
+                cursor = start + len(word)
+            encoded = word.encode("utf-8")
+            encoded_words.append(encoded)
+            word_ends.append((word_ends[-1] if word_ends else 0) + len(encoded))
+            columns["start"].append(start)
+            columns["end"].append(start + len(word) if start >= 0 else -1)
+            for name in ("left", "top", "width", "height"):
+                columns[name].append(_coerce_int(token.get(name)))
+            value = token.get("confidence")
+            confidence.append(float("nan") if value is None else float(value))
+
+        path = self.path_for(ref)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp = path.with_name(f".{path.name}.tmp")
+        with temp.open("wb") as handle:
+            handle.write(_HEADER.pack(_MAGIC, len(confidence)))
+            for name in _INT_COLUMNS:
+                _write_column(handle, columns[name])
+            _write_column(handle, confidence)
+            _write_column(handle, word_ends)
+            handle.write(b"".join(encoded_words))
+        os.replace(temp, path)
+        return ref
+
+    def read(self, ref: str) -> OcrTokenColumns:
+        data = memoryview(self.path_for(ref).read_bytes())
+        magic, count = _HEADER.unpack_from(data, 0)
+        if magic != _MAGIC:
+            raise ValueError(f"{self.path_for(ref)} is not an OCR token sidecar")
+        offset = _HEADER.size
+        loaded: Dict[str, Any] = {}
+        layout = [(name, "i") for name in _INT_COLUMNS] + [("confidence", "f"), ("word_ends", "i")]
+        for name, typecode in layout:
+            column = array(typecode)
+            end = offset + count * column.itemsize
+            column.frombytes(data[offset:end])
+            if sys.byteorder != "little":  # pragma: no cover - sidecars are little-endian on disk
+                column.byteswap()
+            loaded[name] = column
+            offset = end
+        word_ends = loaded.pop("word_ends")
+        blob = bytes(data[offset:])
+        bounds = zip([0, *word_ends[:-1]], word_ends)
+        loaded["words"] = [blob[begin:end].decode("utf-8") for begin, end in bounds]
+        return OcrTokenColumns(**loaded)
+
+
+def _write_column(handle, column: array) -> None:
+    if sys.byteorder != "little":  # pragma: no cover - sidecars are little-endian on disk
+        column = array(column.typecode, column)
+        column.byteswap()
+    handle.write(column.tobytes())
+
+
+def _coerce_int(value: Any) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return -1
+
+
+def _unknown_as_none(value: int) -> int | None:
+    return None if value < 0 else value
+
+
+__all__ = ["OcrTokenColumns", "OcrTokenStore"]
@@ -2,9 +2,17 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import contextvars
+import logging
+import multiprocessing
+import queue
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
 from pathlib import Path
-from typing import Any, Dict, List, Sequence
+from threading import Event, Thread
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Sequence, Tuple
 
 from importlib import import_module
 from importlib.util import find_spec
@@ -15,7 +23,8 @@ from backend.app.forensics.analyzer import ForensicAnalyzer
 from backend.app.forensics.crypto_tracer import CryptoTracer
 from backend.app.forensics.models import ForensicAnalysisResult, CryptoTracingResult
 
-from .loader_registry import LoadedDocument, LoaderRegistry
+from .embedding_cache import EmbeddingCache, text_digest
+from .loader_registry import LoadedDocument, LoaderRegistry, build_document
 from .llama_index_factory import (
     configure_global_settings,
     create_embedding_model,
@@ -23,7 +32,13 @@ from .llama_index_factory import (
     create_llm_service, # Added
     BaseLlmService, # Added
 )
-from .metrics import record_document_yield, record_node_yield, record_pipeline_metrics
+from .ocr import OcrEngine
+from .metrics import (
+    record_document_yield,
+    record_embedding_batch,
+    record_node_yield,
+    record_pipeline_metrics,
+)
 from .settings import LlamaIndexRuntimeConfig
 from .fallback import MetadataModeEnum
 from .categorization import categorize_document, tag_document
@@ -47,7 +62,7 @@ def _resolve_metadata_mode() -> object:
 
 
 MetadataMode = _resolve_metadata_mode()
-METADATA_MODE_ALL = getattr(MetadataMode, "ALL", MetadataModeEnum.ALL)
+METADATA_MODE_EMBED = getattr(MetadataMode, "EMBED", MetadataModeEnum.EMBED)
 
 
 @dataclass
@@ -82,6 +97,86 @@ class PipelineResult:
         return sum(len(doc.nodes) for doc in self.documents)
 
 
+class EmbeddingBatcher:
+    """Accumulate node records across documents and embed them in fixed-size batches.
+
+    Records are appended with an empty embedding and filled in place when their batch is
+    flushed, so callers must :meth:`flush` before reading embeddings. Batches flush in
+    insertion order and :attr:`flushed` counts the records embedded so far. When a cache is
+    given, only texts it does not already hold reach the model.
+    """
+
+    def __init__(
+        self,
+        embedding_model,
+        batch_size: int,
+        *,
+        source_type: str,
+        job_id: str,
+        cache: EmbeddingCache | None = None,
+    ) -> None:
+        self.embedding_model = embedding_model
+        self.batch_size = max(1, int(batch_size))
+        self.source_type = source_type
+        self.job_id = job_id
+        self.cache = cache
+        self.flushed = 0
+        self._pending: List[PipelineNodeRecord] = []
+
+    def add(self, record: PipelineNodeRecord) -> None:
+        self._pending.append(record)
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        while self._pending:
+            batch = self._pending[: self.batch_size]
+            self._pending = self._pending[self.batch_size :]
+            cached = self.cache.get_many([record.text for record in batch]) if self.cache else {}
+            missing = list(
+                dict.fromkeys(record.text for record in batch if text_digest(record.text) not in cached)
+            )
+            if missing:
+                start = time.perf_counter()
+                fresh = dict(zip(missing, _embed_batch(self.embedding_model, missing)))
+                record_embedding_batch(
+                    len(missing),
+                    time.perf_counter() - start,
+                    source_type=self.source_type,
+                    job_id=self.job_id,
+                )
+                if self.cache is not None:
+                    self.cache.put_many(fresh)
+                for text, vector in fresh.items():
+                    cached[text_digest(text)] = vector
+            for record in batch:
+                record.embedding = list(cached[text_digest(record.text)])
+            self.flushed += len(batch)
+
+
+def _embed_batch(embedding_model, texts: List[str]) -> List[List[float]]:
+    batch_embed = getattr(embedding_model, "get_text_embedding_batch", None)
+    if batch_embed is None:
+        return [embedding_model.get_text_embedding(text) for text in texts]
+    vectors = batch_embed(texts)
+    if len(vectors) != len(texts):
+        raise RuntimeError(f"Embedding model returned {len(vectors)} vectors for {len(texts)} texts")
+    return vectors
+
+
+def _open_embedding_cache(runtime_config: LlamaIndexRuntimeConfig) -> EmbeddingCache | None:
+    max_entries = runtime_config.tuning.embedding_cache_max_entries
+    if max_entries <= 0:
+        return None
+    embedding = runtime_config.embedding
+    return EmbeddingCache(
+        runtime_config.llama_cache_dir / "embeddings.sqlite",
+        model_id=f"{embedding.provider.value}:{embedding.model}",
+        dimensions=embedding.dimensions,
+        max_entries=max_entries,
+    )
+
+
 def run_ingestion_pipeline(
     job_id: str,
     materialized_root: Path,
@@ -93,49 +188,215 @@ def run_ingestion_pipeline(
 ) -> PipelineResult:
     """Materialise documents, chunk into nodes, and enrich with embeddings."""
 
+    documents = list(
+        stream_ingestion_pipeline(
+            job_id,
+            materialized_root,
+            source,
+            origin,
+            registry=registry,
+            runtime_config=runtime_config,
+        )
+    )
+    return PipelineResult(job_id=job_id, source=source, documents=documents)
+
+
+def stream_ingestion_pipeline(
+    job_id: str,
+    materialized_root: Path,
+    source: IngestionSource,
+    origin: str,
+    *,
+    registry: LoaderRegistry,
+    runtime_config: LlamaIndexRuntimeConfig,
+    files: Iterable[Tuple[Path, str | None]] | None = None,
+) -> Iterator[DocumentPipelineResult]:
+    """Yield fully embedded documents in source order as soon as each one is ready.
+
+    Loading runs on a background thread that stays at most ``pipeline_window`` documents
+    ahead, and at most that many split documents wait on the embedding batcher before a
+    flush is forced. The caller commits each yielded document before the next is pulled,
+    so peak memory tracks the window rather than the size of the source.
+
+    With ``process_workers`` above one, workspace files are loaded, split and mined for
+    entities and triples in a process pool instead; embedding, enrichment and commits stay
+    in this process and documents still arrive in source order.
+
+    ``files`` restricts a workspace source to the given ``(path, sha256)`` pairs, letting a
+    caller that already fingerprinted the files skip unchanged ones and reuse their hashes.
+    """
+
     configure_global_settings(runtime_config)
     splitter = create_sentence_splitter(runtime_config.tuning)
     embedding_model = create_embedding_model(runtime_config.embedding)
     llm_service = create_llm_service(runtime_config.llm) # Create LLM service
+    window = max(1, runtime_config.tuning.pipeline_window)
+    source_type = source.type.lower()
 
-    with record_pipeline_metrics(source.type.lower(), job_id):
-        loaded_documents = registry.load_documents(materialized_root, source, origin=origin)
-        record_document_yield(len(loaded_documents), source_type=source.type.lower(), job_id=job_id)
-        documents = [
-            _process_loaded_document(loaded, splitter, embedding_model, llm_service) # Pass LLM service
-            for loaded in loaded_documents
-        ]
-        total_nodes = sum(len(doc.nodes) for doc in documents)
-        record_node_yield(total_nodes, source_type=source.type.lower(), job_id=job_id)
-        return PipelineResult(job_id=job_id, source=source, documents=documents)
-
-
-def _process_loaded_document(
-    loaded: LoadedDocument,
-    splitter,
-    embedding_model,
-    llm_service: BaseLlmService, # Accept LLM service
-) -> DocumentPipelineResult:
-    nodes = _split_nodes(splitter, loaded.document)
-    pipeline_nodes: List[PipelineNodeRecord] = []
-    for index, node in enumerate(nodes):
-        text = node.get_content(metadata_mode=METADATA_MODE_ALL)
-        vector = embedding_model.get_text_embedding(text)
+    with record_pipeline_metrics(source_type, job_id):
+        cache = _open_embedding_cache(runtime_config)
+        batcher = EmbeddingBatcher(
+            embedding_model,
+            runtime_config.tuning.embedding_batch_size,
+            source_type=source_type,
+            job_id=job_id,
+            cache=cache,
+        )
+        workers = max(1, runtime_config.tuning.process_workers)
+        if registry.is_remote(source):
+            prepared_documents = _prepare_in_process(
+                registry.iter_documents(materialized_root, source, origin=origin), splitter, window
+            )
+        else:
+            if files is None:
+                files = ((path, None) for path in registry.iter_workspace_paths(materialized_root))
+            if workers > 1:
+                prepared_documents = _prepare_in_pool(files, source, origin, runtime_config, workers, window)
+            else:
+                prepared_documents = _prepare_in_process(
+                    (registry.load_path(path, source, origin, checksum=checksum) for path, checksum in files),
+                    splitter,
+                    window,
+                )
+        # Each entry remembers how many records the batcher must have flushed before the
+        # document's embeddings are complete.
+        pending: Deque[Tuple[int, DocumentPipelineResult]] = deque()
+        submitted = 0
+        document_count = 0
+        node_count = 0
+        try:
+            for prepared in prepared_documents:
+                result = _complete_document(prepared, batcher, llm_service) # Pass LLM service
+                document_count += 1
+                node_count += len(result.nodes)
+                submitted += len(result.nodes)
+                pending.append((submitted, result))
+                if len(pending) >= window:
+                    batcher.flush()
+                while pending and pending[0][0] <= batcher.flushed:
+                    yield pending.popleft()[1]
+            batcher.flush()
+            while pending:
+                yield pending.popleft()[1]
+        finally:
+            prepared_documents.close()
+            if cache is not None:
+                cache.close()
+        record_document_yield(document_count, source_type=source_type, job_id=job_id)
+        record_node_yield(node_count, source_type=source_type, job_id=job_id)
+
+
+class _LoaderFailure:
+    __slots__ = ("error",)
+
+    def __init__(self, error: BaseException) -> None:
+        self.error = error
+
+
+_LOADER_DONE = object()
+
+
+class _PrefetchingLoader:
+    """Pull documents from ``documents`` on a background thread into a bounded queue.
+
+    The thread blocks once ``window`` documents are waiting, which is the backpressure that
+    keeps slow embedding or commits from letting loading run arbitrarily far ahead. Loader
+    errors are re-raised in the consuming thread.
+    """
+
+    def __init__(self, documents: Iterable[LoadedDocument], window: int) -> None:
+        self._documents = documents
+        self._queue: "queue.Queue[object]" = queue.Queue(maxsize=max(1, window))
+        self._stopped = Event()
+        context = contextvars.copy_context()
+        self._thread = Thread(target=context.run, args=(self._run,), name="ingestion-loader", daemon=True)
+        self._thread.start()
+
+    def __iter__(self) -> Iterator[LoadedDocument]:
+        while True:
+            item = self._queue.get()
+            if item is _LOADER_DONE:
+                return
+            if isinstance(item, _LoaderFailure):
+                raise item.error
+            yield item  # type: ignore[misc]
+
+    def close(self) -> None:
+        """Stop the loader thread, discarding anything it already queued."""
+
+        self._stopped.set()
+        while self._thread.is_alive():
+            try:
+                self._queue.get(timeout=0.05)
+            except queue.Empty:
+                continue
+        self._thread.join()
+
+    def _run(self) -> None:
+        try:
+            for document in self._documents:
+                if not self._put(document):
+                    return
+        except BaseException as exc:
+            self._put(_LoaderFailure(exc))
+            return
+        self._put(_LOADER_DONE)
+
+    def _put(self, item: object) -> bool:
+        while not self._stopped.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+
+@dataclass
+class _PreparedDocument:
+    """CPU-bound half of a document's processing, compact enough to return from a worker."""
+
+    loaded: LoadedDocument
+    chunks: List[Tuple[str, str, Dict[str, object]]]
+    entities: List[EntitySpan]
+    triples: List[Triple]
+
+
+def _prepare_loaded_document(loaded: LoadedDocument, splitter) -> _PreparedDocument:
+    chunks: List[Tuple[str, str, Dict[str, object]]] = []
+    for node in _split_nodes(splitter, loaded.document):
+        # Embed mode honours the document's excluded keys, keeping provenance out of the text.
+        text = node.get_content(metadata_mode=METADATA_MODE_EMBED)
         metadata = dict(getattr(node, "metadata", {}) or {})
         metadata.setdefault("source_path", str(loaded.path))
         metadata.setdefault("source_type", loaded.source.type.lower())
-        pipeline_nodes.append(
-            PipelineNodeRecord(
-                node_id=node.node_id,
-                text=text,
-                embedding=vector,
-                metadata=metadata,
-                chunk_index=index,
-            )
+        chunks.append((node.node_id, text, metadata))
+    return _PreparedDocument(
+        loaded=loaded,
+        chunks=chunks,
+        entities=extract_entities(loaded.text),
+        triples=extract_triples(loaded.text),
+    )
+
+
+def _complete_document(
+    prepared: _PreparedDocument,
+    batcher: EmbeddingBatcher,
+    llm_service: BaseLlmService,
+) -> DocumentPipelineResult:
+    loaded = prepared.loaded
+    pipeline_nodes: List[PipelineNodeRecord] = []
+    for index, (node_id, text, metadata) in enumerate(prepared.chunks):
+        record = PipelineNodeRecord(
+            node_id=node_id,
+            text=text,
+            embedding=[],
+            metadata=metadata,
+            chunk_index=index,
         )
-    entities = extract_entities(loaded.text)
-    triples = extract_triples(loaded.text)
-    
+        pipeline_nodes.append(record)
+        batcher.add(record)
+
     # Categorization and Tagging
     categories = categorize_document(loaded.text, llm_service) # Use llm_service
     tags = tag_document(loaded.text, llm_service) # Use llm_service
@@ -148,20 +409,20 @@ def _process_loaded_document(
         forensic_analyzer = ForensicAnalyzer()
         forensic_analysis_result = forensic_analyzer.analyze_document(
             document_id=loaded.source.source_id,
-            document_content=loaded.document.text.encode('utf-8'), # Assuming text can be encoded
+            document_content=loaded.text.encode('utf-8'), # Assuming text can be encoded
             metadata=loaded.source.metadata,
         )
         crypto_tracer = CryptoTracer()
         crypto_tracing_result = crypto_tracer.trace_document_for_crypto(
-            document_content=loaded.document.text,
+            document_content=loaded.text,
             document_id=loaded.source.source_id,
         )
 
     return DocumentPipelineResult(
         loaded=loaded,
         nodes=pipeline_nodes,
-        entities=entities,
-        triples=triples,
+        entities=prepared.entities,
+        triples=prepared.triples,
         categories=categories,
         tags=tags,
         forensic_analysis_result=forensic_analysis_result, # Added
@@ -169,9 +430,90 @@ def _process_loaded_document(
     )
 
 
+# Per-process loader and splitter, built once by ``_init_document_worker`` in each pool worker.
+_worker_state: Dict[str, Any] = {}
+
+
+def _init_document_worker(runtime_config: LlamaIndexRuntimeConfig) -> None:
+    configure_global_settings(runtime_config)
+    logger = logging.getLogger("backend.ingestion.worker")
+    _worker_state["registry"] = LoaderRegistry(
+        runtime_config,
+        OcrEngine(runtime_config.ocr, logger.getChild("ocr")),
+        logger=logger.getChild("loader"),
+    )
+    _worker_state["splitter"] = create_sentence_splitter(runtime_config.tuning)
+
+
+def _prepare_path_in_worker(
+    path: Path, checksum: str | None, source: IngestionSource, origin: str
+) -> _PreparedDocument:
+    loaded = _worker_state["registry"].load_path(path, source, origin, checksum=checksum)
+    prepared = _prepare_loaded_document(loaded, _worker_state["splitter"])
+    # The LlamaIndex document only repeats ``text`` and ``metadata``; the parent rebuilds it
+    # rather than paying to pickle it twice.
+    prepared.loaded = replace(loaded, document=None)
+    return prepared
+
+
+def _attach_document(prepared: _PreparedDocument) -> _PreparedDocument:
+    loaded = prepared.loaded
+    document = build_document(loaded.text, loaded.metadata)
+    prepared.loaded = replace(loaded, document=document)
+    return prepared
+
+
+def _prepare_in_process(
+    documents: Iterable[LoadedDocument], splitter, window: int
+) -> Iterator[_PreparedDocument]:
+    loader = _PrefetchingLoader(documents, window)
+    try:
+        for loaded in loader:
+            yield _prepare_loaded_document(loaded, splitter)
+    finally:
+        loader.close()
+
+
+def _prepare_in_pool(
+    files: Iterable[Tuple[Path, str | None]],
+    source: IngestionSource,
+    origin: str,
+    runtime_config: LlamaIndexRuntimeConfig,
+    workers: int,
+    window: int,
+) -> Iterator[_PreparedDocument]:
+    """Fan files out to worker processes by path and yield results in submission order.
+
+    Results are consumed strictly in the order the paths were submitted, so the output is
+    identical for any worker count. At most ``max(window, workers)`` documents are in
+    flight, enough to keep every worker busy without letting the pool run ahead of commits.
+    """
+
+    in_flight_limit = max(window, workers)
+    # ``spawn`` keeps workers from inheriting the parent's threads and open clients.
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=context,
+        initializer=_init_document_worker,
+        initargs=(runtime_config,),
+    ) as pool:
+        in_flight: Deque[Future] = deque()
+        try:
+            for path, checksum in files:
+                in_flight.append(pool.submit(_prepare_path_in_worker, path, checksum, source, origin))
+                if len(in_flight) >= in_flight_limit:
+                    yield _attach_document(in_flight.popleft().result())
+            while in_flight:
+                yield _attach_document(in_flight.popleft().result())
+        finally:
+            for future in in_flight:
+                future.cancel()
+
+
 def _split_nodes(splitter, document) -> Sequence[Any]:
     nodes = splitter.get_nodes_from_documents([document])
     return nodes
 
 
-__all__ = ["PipelineResult", "run_ingestion_pipeline"]
+__all__ = ["EmbeddingBatcher", "PipelineResult", "run_ingestion_pipeline", "stream_ingestion_pipeline"]
@@ -72,6 +72,9 @@ class OcrConfig:
     vision_model: Optional[str] = None
     api_key: Optional[str] = None
     extra: Dict[str, Any] = field(default_factory=dict)
+    workers: int = 1
+    cache_path: Optional[Path] = None
+    cache_max_entries: int = 0
 
 
 @dataclass(frozen=True)
@@ -93,6 +96,10 @@ class PipelineTuning:
     chunk_overlap: int
     max_triplets_per_chunk: int
     graph_batch_size: int
+    embedding_batch_size: int = 64
+    embedding_cache_max_entries: int = 0
+    pipeline_window: int = 8
+    process_workers: int = 1
 
 
 @dataclass(frozen=True)
@@ -166,11 +173,17 @@ def build_embedding_config(settings: "Settings") -> EmbeddingConfig:
 
 def build_ocr_config(settings: "Settings") -> OcrConfig:
     mode = resolve_cost_mode(settings.ingestion_cost_mode)
+    throughput = {
+        "workers": max(1, settings.ingestion_ocr_workers),
+        "cache_path": Path(settings.ingestion_llama_cache_dir) / "ocr.sqlite",
+        "cache_max_entries": max(0, settings.ingestion_ocr_cache_max_entries),
+    }
     if mode is IngestionCostMode.COMMUNITY:
         return OcrConfig(
             provider=OcrProvider.TESSERACT,
             languages=settings.ingestion_tesseract_languages,
             tessdata_path=settings.ingestion_tesseract_path,
+            **throughput,
         )
     if mode is IngestionCostMode.PRO:
         return OcrConfig(
@@ -182,6 +195,7 @@ def build_ocr_config(settings: "Settings") -> OcrConfig:
                 "model": settings.ingestion_vision_model,
                 "api_key": settings.ingestion_vision_api_key,
             }},
+            **throughput,
         )
     return OcrConfig(
         provider=OcrProvider.VISION,
@@ -190,6 +204,7 @@ def build_ocr_config(settings: "Settings") -> OcrConfig:
         vision_endpoint=settings.ingestion_vision_endpoint,
         vision_model=settings.ingestion_vision_model,
         api_key=settings.ingestion_vision_api_key,
+        **throughput,
     )
 
 
@@ -229,6 +244,10 @@ def build_pipeline_tuning(settings: "Settings") -> PipelineTuning:
         chunk_overlap=settings.ingestion_chunk_overlap,
         max_triplets_per_chunk=settings.ingestion_max_triplets_per_chunk,
         graph_batch_size=settings.ingestion_graph_batch_size,
+        embedding_batch_size=max(1, settings.ingestion_embedding_batch_size),
+        embedding_cache_max_entries=max(0, settings.ingestion_embedding_cache_max_entries),
+        pipeline_window=max(1, settings.ingestion_pipeline_window),
+        process_workers=max(1, settings.ingestion_process_workers),
     )
 
 
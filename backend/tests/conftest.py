@@ -333,6 +333,7 @@ def client(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, security_materials:
 
     from backend.app import config as app_config
     from backend.app.services import graph as graph_service
+    from backend.app.services import retrieval as retrieval_service
     from backend.app.services import vector as vector_service
     from backend.app.telemetry.billing import reset_billing_registry
 
@@ -341,6 +342,7 @@ def client(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, security_materials:
     reset_audit_trail()
     vector_service.reset_vector_service()
     graph_service.reset_graph_service()
+    retrieval_service.reset_retrieval_service()
     reset_billing_registry()
 
     settings = app_config.get_settings()
@@ -6,11 +6,12 @@ from pathlib import Path
 import pytest
 from fastapi.testclient import TestClient
 
-from backend.app.config import reset_settings_cache
+from backend.app.config import get_settings, reset_settings_cache
 from backend.app.security.authz import Principal
 from backend.app.telemetry.billing import (
     BILLING_PLANS,
     BillingEventType,
+    BillingTelemetry,
     export_customer_health,
     export_plan_catalogue,
     record_billing_event,
@@ -55,6 +56,35 @@ def test_record_billing_event_accumulates_usage(monkeypatch: pytest.MonkeyPatch,
     assert tenant["projected_monthly_cost"] >= BILLING_PLANS["community"].monthly_price_usd
 
 
+def test_write_behind_journal_replays_after_compaction(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    usage_path = tmp_path / "usage.json"
+    monkeypatch.setenv("BILLING_USAGE_PATH", str(usage_path))
+    monkeypatch.setenv("BILLING_JOURNAL_FLUSH_SECONDS", "3600")
+    reset_settings_cache()
+    settings = get_settings()
+
+    telemetry = BillingTelemetry(settings)
+    for _ in range(3):
+        telemetry.record_event(None, BillingEventType.QUERY, attributes={"tenant_id": "t-1", "latency_ms": 10.0})
+    assert not usage_path.exists()
+    telemetry.flush()
+    journal = usage_path.with_name("usage.json.journal.jsonl")
+    assert len(journal.read_text().splitlines()) == 3
+
+    telemetry.compact()
+    assert not journal.exists()
+    telemetry.record_event(None, BillingEventType.INGESTION, attributes={"tenant_id": "t-1", "gigabytes": 1.5})
+    telemetry.flush()
+
+    restored = BillingTelemetry(settings)
+    tenant = restored.snapshot()[0]
+    assert tenant.query_count == pytest.approx(3.0)
+    assert tenant.ingestion_gb == pytest.approx(1.5)
+    assert tenant.total_events == pytest.approx(4.0)
+    telemetry.close()
+    reset_settings_cache()
+
+
 def test_billing_endpoints_and_onboarding_flow(
     client: TestClient,
     auth_headers_factory,
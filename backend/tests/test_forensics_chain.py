@@ -44,6 +44,52 @@ def test_chain_ledger_detects_tampering(tmp_path: Path) -> None:
     assert "digest" in issues[0] or "prev_hash" in issues[0]
 
 
+def test_chain_ledger_tail_and_checkpoints(tmp_path: Path) -> None:
+    ledger_path = tmp_path / "ledger.jsonl"
+    ledger = ForensicsChainLedger(ledger_path, signing_key="k" * 32, checkpoint_interval=4)
+    for index in range(10):
+        ledger.append("tester", "step", {"n": index})
+
+    reopened = ForensicsChainLedger(ledger_path, signing_key="k" * 32, checkpoint_interval=4)
+    latest = reopened.latest()
+    assert latest is not None and latest.index == 9
+    appended = reopened.append("tester", "step", {"n": 10})
+    assert appended.prev_hash == latest.digest
+    assert reopened.verify() == (True, [])
+
+    # Entries before the newest checkpoint are not re-hashed on the fast path.
+    lines = ledger_path.read_text().splitlines()
+    tampered = json.loads(lines[1])
+    tampered["payload"]["n"] = 7
+    lines[1] = json.dumps(tampered, separators=(",", ":"), sort_keys=True)
+    ledger_path.write_text("\n".join(lines) + "\n")
+    assert reopened.verify() == (True, [])
+    ok, issues = reopened.verify(full=True)
+    assert ok is False and "entry 1 digest mismatch" in issues[0]
+
+    checkpoints = reopened.checkpoint_path.read_text().splitlines()
+    forged = json.loads(checkpoints[-1])
+    forged["index"] = 10
+    reopened.checkpoint_path.write_text("\n".join(checkpoints[:-1] + [json.dumps(forged)]) + "\n")
+    # Unverifiable checkpoints are skipped, so the next one back anchors verification.
+    assert reopened.verify() == (True, [])
+    reopened.checkpoint_path.write_text(json.dumps(forged) + "\n")
+    ok, issues = reopened.verify()
+    assert ok is False and len(issues) == 1 and "entry 1 digest mismatch" in issues[0]
+
+
+def test_chain_ledger_key_rotation_falls_back_to_genesis(tmp_path: Path) -> None:
+    ledger_path = tmp_path / "ledger.jsonl"
+    ledger = ForensicsChainLedger(ledger_path, signing_key="k" * 32, checkpoint_interval=2)
+    for index in range(5):
+        ledger.append("tester", "step", {"n": index})
+
+    rotated = ForensicsChainLedger(ledger_path, signing_key="r" * 32, checkpoint_interval=2)
+    assert rotated.verify() == (True, [])
+    rotated.append("tester", "step", {"n": 5})
+    assert rotated._latest_valid_checkpoint([])["index"] == 5
+
+
 def test_chain_cli_reports_status(tmp_path: Path) -> None:
     ledger_path = tmp_path / "ledger.jsonl"
     ledger = ForensicsChainLedger(ledger_path)
@@ -96,3 +96,21 @@ def test_execute_agent_cypher_rejects_unsafe(memory_graph):
     service = memory_graph
     with pytest.raises(WorkflowAbort):
         service.execute_agent_cypher("Describe", "DELETE n")
+
+
+def test_execute_agent_cypher_supports_order_by(memory_graph):
+    service = memory_graph
+    for entity_id, label in (("e-zed", "Zed Corp"), ("e-acme", "Acme LLC"), ("e-bolt", "Bolt Inc")):
+        service.upsert_entity(entity_id, "Entity", {"label": label})
+
+    result = service.execute_agent_cypher(
+        "Which entities are known?",
+        "MATCH (n:Entity) RETURN n.label AS label ORDER BY n.label DESC LIMIT 2",
+    )
+
+    assert [record["label"] for record in result.records] == ["Zed Corp", "Bolt Inc"]
+    assert "Sort" in [step["operator"] for step in result.summary["plan"]]
+    distinct = service.execute_agent_cypher(
+        "Which entity labels exist?", "MATCH (n:Entity) RETURN DISTINCT n.label ORDER BY n.label"
+    )
+    assert [record["n.label"] for record in distinct.records] == ["Acme LLC", "Bolt Inc", "Zed Corp"]
@@ -56,6 +56,35 @@ def test_search_entities_filters_types(memory_graph: graph_module.GraphService)
     assert service.search_entities("") == []
 
 
+def test_search_entities_ranks_trigram_matches(memory_graph: graph_module.GraphService) -> None:
+    service = memory_graph
+    service.upsert_entity("entity-inner", "Entity", {"label": "Megacorp Holdings"})
+    service.upsert_entity("entity-prefix", "Organization", {"label": "Acme Widgets"})
+    service.upsert_entity("entity-exact", "Entity", {"label": "Acme"})
+    service.upsert_entity("entity-word", "Person", {"label": "Road Runner", "aliases": ["The Acme Buyer"]})
+    service.upsert_entity("entity-infix", "Entity", {"label": "Dacmen"})
+
+    assert [node.id for node in service.search_entities("ACME", limit=10)] == [
+        "entity-exact",
+        "entity-prefix",
+        "entity-word",
+        "entity-infix",
+    ]
+    assert [node.id for node in service.search_entities("acme", limit=2)] == ["entity-exact", "entity-prefix"]
+    assert service._entity_text_index.candidates("acme") == {
+        "entity-exact",
+        "entity-prefix",
+        "entity-word",
+        "entity-infix",
+    }
+    assert [node.id for node in service.search_entities("ru")] == ["entity-word"]
+
+    service.upsert_entity("entity-infix", "Entity", {"label": "Daffy"})
+    service.upsert_entity("entity-word", "Evidence", {"label": "Road Runner"})
+    assert [node.id for node in service.search_entities("acme", limit=10)] == ["entity-exact", "entity-prefix"]
+    assert service.search_entities("holdings")[0].id == "entity-inner"
+
+
 def test_edge_key_includes_doc_id(memory_graph: graph_module.GraphService) -> None:
     key = memory_graph._edge_key("doc-1", "REL", "entity-1", {"doc_id": "case-9"})
     assert key == ("doc-1", "REL", "entity-1", "case-9")
@@ -283,6 +312,9 @@ def test_graph_service_neo4j_mode(monkeypatch: pytest.MonkeyPatch) -> None:
     assert mapping["doc-9"][0].id == "entity-9"
 
     assert any("MERGE (d:Document" in call[0] for call in dummy_driver.write_calls)
+    assert any("CREATE FULLTEXT INDEX entity_label_fulltext" in call[0] for call in dummy_driver.write_calls)
+    search_query, search_params = dummy_driver.read_calls[1]
+    assert "db.index.fulltext.queryNodes" in search_query and search_params["search"] == "acme*"
     assert any("MATCH (d:Document)-[:MENTIONS]->(e:Entity)" in call[0] for call in dummy_driver.read_calls)
 
 
@@ -314,3 +346,452 @@ def test_synthesize_strategy_brief_maps_arguments(memory_graph: graph_module.Gra
     assert brief.leverage_points
     payload = brief.to_dict()
     assert payload["argument_map"][0]["node"]["id"] == "claim-alpha"
+
+
+def test_adjacency_indexes_track_merged_edges(memory_graph: graph_module.GraphService) -> None:
+    service = memory_graph
+    service.upsert_document("doc-adj", "Adjacency", {})
+    for entity_id in ("entity-a", "entity-b", "entity-c"):
+        service.upsert_entity(entity_id, "Entity", {"label": entity_id})
+    service.merge_relation("doc-adj", "MENTIONS", "entity-a", {"doc_id": "doc-adj"})
+    service.merge_relation("entity-b", "KNOWS", "entity-a", {"doc_id": "doc-adj"})
+    service.merge_relation("entity-a", "KNOWS", "entity-c", {"doc_id": "doc-other"})
+    service.merge_relation("entity-a", "KNOWS", "entity-c", {"doc_id": "doc-other", "weight": 0.4})
+
+    _, edges = service.neighbors("entity-a")
+    assert [(edge.source, edge.target) for edge in edges] == [
+        ("doc-adj", "entity-a"),
+        ("entity-b", "entity-a"),
+        ("entity-a", "entity-c"),
+    ]
+    assert edges[-1].properties["weight"] == 0.4
+    _, leaf_edges = service.neighbors("entity-c")
+    assert [(edge.source, edge.target) for edge in leaf_edges] == [("entity-a", "entity-c")]
+
+    assert [edge.type for edge in service.document_edges("doc-adj")] == ["MENTIONS", "KNOWS"]
+    assert {node.id for node in service.document_entities(["doc-adj"])["doc-adj"]} == {"entity-a"}
+    assert set(service.subgraph(["entity-b"]).nodes) == {"entity-a", "entity-b"}
+
+
+def test_batch_writer_matches_individual_writes(memory_graph: graph_module.GraphService) -> None:
+    service = memory_graph
+    service.upsert_document("doc-batch", "Batch", {})
+    with service.batch_writer(batch_size=3) as writer:
+        writer.upsert_entity("entity-a", "Entity", {"label": "A"})
+        writer.merge_relation("doc-batch", "MENTIONS", "entity-a", {"doc_id": "doc-batch", "evidence": ["p1"]})
+        writer.upsert_entity("entity-b", "Entity", {"label": "B"})
+        assert writer.pending == 0 and writer.batches_flushed == 1
+        writer.merge_relation("entity-a", "KNOWS", "entity-b", {"doc_id": "doc-batch"})
+        writer.merge_relation("doc-batch", "MENTIONS", "entity-a", {"doc_id": "doc-batch", "evidence": "p2"})
+        assert writer.pending == 2
+    assert writer.pending == 0 and writer.batches_flushed == 2
+
+    _, edges = service.neighbors("entity-a")
+    assert [(edge.source, edge.type, edge.target) for edge in edges] == [
+        ("doc-batch", "MENTIONS", "entity-a"),
+        ("entity-a", "KNOWS", "entity-b"),
+    ]
+    assert edges[0].properties["evidence"] == ["p1", "p2"]
+    assert service.search_entities("b", limit=5)[0].id == "entity-b"
+
+
+def test_batch_writer_flushes_when_block_raises(memory_graph: graph_module.GraphService) -> None:
+    service = memory_graph
+    service.upsert_document("doc-fail", "Fail", {})
+    with pytest.raises(RuntimeError):
+        with service.batch_writer(batch_size=10) as writer:
+            writer.upsert_entity("entity-f", "Entity", {"label": "F"})
+            writer.merge_relation("doc-fail", "MENTIONS", "entity-f", {"doc_id": "doc-fail"})
+            raise RuntimeError("next document failed")
+
+    assert writer.pending == 0
+    assert [edge.target for edge in service.document_edges("doc-fail")] == ["entity-f"]
+
+
+def test_batch_writer_uses_one_neo4j_transaction_per_batch(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("NEO4J_URI", "bolt://neo4j")
+    config.reset_settings_cache()
+    dummy_driver = _DummyDriver()
+    monkeypatch.setattr(graph_module, "GraphDatabase", _DummyGraphDatabase(dummy_driver))
+    graph_module.reset_graph_service()
+    service = graph_module.GraphService()
+    transactions: list[int] = []
+    original_session = dummy_driver.session
+
+    def counting_session():
+        session = original_session()
+        execute_write = session.execute_write
+
+        def tracked(func):
+            transactions.append(len(dummy_driver.write_calls))
+            return execute_write(func)
+
+        session.execute_write = tracked
+        return session
+
+    monkeypatch.setattr(dummy_driver, "session", counting_session)
+    dummy_driver.write_calls.clear()
+
+    with service.batch_writer(batch_size=100) as writer:
+        for index in range(4):
+            writer.upsert_entity(f"entity-{index}", "Entity", {"label": f"E{index}"})
+            writer.merge_relation("doc-1", "MENTIONS", f"entity-{index}", {"doc_id": "doc-1"})
+        writer.merge_relation("entity-0", "KNOWS", "entity-1", {"doc_id": "doc-1"})
+
+    assert len(transactions) == 1
+    queries = [query for query, _ in dummy_driver.write_calls]
+    assert len(queries) == 3 and all(query.startswith("UNWIND $rows AS row") for query in queries)
+    assert [len(params["rows"]) for _, params in dummy_driver.write_calls] == [4, 4, 1]
+    assert "MERGE (s)-[r:KNOWS]->(t)" in queries[2]
+    assert service._edge_cache[("entity-0", "KNOWS", "entity-1", "doc-1")].type == "KNOWS"
+
+
+def test_community_refresh_recomputes_only_touched_components(
+    memory_graph: graph_module.GraphService,
+) -> None:
+    service = memory_graph
+    for entity_id in ("a1", "a2", "a3", "b1", "b2"):
+        service.upsert_entity(entity_id, "Entity", {"label": entity_id})
+    service.merge_relation("a1", "KNOWS", "a2", {"doc_id": "doc-a"})
+    service.merge_relation("a2", "KNOWS", "a3", {"doc_id": "doc-a"})
+    service.merge_relation("b1", "KNOWS", "b2", {"doc_id": "doc-b"})
+
+    first = service.communities_for_nodes(["a1", "b1"])
+    assert {node["id"] for node in first[1].nodes} == {"b1", "b2"}
+    assert first[1].documents == ["doc-b"]
+    assert service.community_status()["stale"] is False
+
+    service.upsert_entity("a4", "Entity", {"label": "a4"})
+    service.merge_relation("a3", "KNOWS", "a4", {"doc_id": "doc-a2"})
+    status = service.community_status()
+    assert status["stale"] is True and status["pending_nodes"] == 2
+    # A property-only update does not invalidate the assignment.
+    service.upsert_entity("b1", "Entity", {"label": "B1"})
+    assert service.community_status()["pending_nodes"] == 2
+
+    assert service.schedule_community_refresh() is True
+    service._community_thread.join(timeout=5)
+    assert service.community_status()["stale"] is False
+
+    refreshed = service.communities_for_nodes(["a4", "b2"])
+    assert refreshed[1] is first[1]
+    assert "a4" in {node["id"] for node in refreshed[0].nodes}
+    assert service.schedule_community_refresh() is False
+    # Refreshes gather edges from the touched components only, in insertion order.
+    assert [(edge.source, edge.target) for edge in service._scope_edges({"a1", "a2", "a3", "a4"})] == [
+        ("a1", "a2"),
+        ("a2", "a3"),
+        ("a3", "a4"),
+    ]
+
+
+def test_strategy_rankings_are_cached_per_graph_version(memory_graph: graph_module.GraphService) -> None:
+    service = memory_graph
+    for entity_id in ("hub", "left", "right", "leaf"):
+        service.upsert_entity(entity_id, "Entity", {"label": entity_id})
+    service.merge_relation("left", "KNOWS", "hub", {"doc_id": "doc-1"})
+    service.merge_relation("hub", "KNOWS", "right", {"doc_id": "doc-1"})
+    service.merge_relation("hub", "KNOWS", "right", {"doc_id": "doc-2"})
+
+    brief = service.synthesize_strategy_brief(limit=2)
+    assert "hub" in {node["id"] for node in brief.focus_nodes}
+    assert brief.leverage_points[0].node["id"] == "hub"
+    assert brief.leverage_points[0].connections == 3
+    rankings = service.graph_rankings()
+    assert service.rankings_status()["stale"] is False
+    assert service.graph_rankings() is rankings
+
+    service.merge_relation("right", "KNOWS", "leaf", {"doc_id": "doc-3"})
+    assert service.rankings_status()["stale"] is True
+    # Stale rankings are served while the refresh runs in the background.
+    assert service.graph_rankings() is rankings
+    service._rankings_thread.join(timeout=5)
+    assert service.rankings_status()["stale"] is False
+    assert dict(service.graph_rankings().focus)["right"] == 2
+    assert service._degree_map()["right"] == 3
+
+
+def test_expand_tracks_hops_and_path_weights(memory_graph: graph_module.GraphService) -> None:
+    service = memory_graph
+    for entity_id in ("seed-a", "seed-b", "mid", "far", "other"):
+        service.upsert_entity(entity_id, "Entity", {"label": entity_id})
+    service.merge_relation("seed-a", "KNOWS", "mid", {"doc_id": "doc-1", "weight": 0.5})
+    service.merge_relation("seed-b", "KNOWS", "mid", {"doc_id": "doc-1", "weight": 0.8})
+    service.merge_relation("mid", "KNOWS", "far", {"doc_id": "doc-2", "weight": 0.5})
+    service.merge_relation("far", "KNOWS", "other", {"doc_id": "doc-3"})
+
+    expansion = service.expand(["seed-a", "seed-b", "missing"], max_hops=2)
+    assert expansion.hops == {"seed-a": 0, "seed-b": 0, "mid": 1, "far": 2}
+    assert expansion.weights["mid"] == pytest.approx(0.8)
+    assert expansion.weights["far"] == pytest.approx(0.4)
+    assert ("far", "KNOWS", "other", "doc-3") not in expansion.edges
+
+    limited = service.expand(["seed-a", "seed-b"], max_hops=3, edge_limit=2)
+    assert list(limited.edges) == [
+        ("seed-a", "KNOWS", "mid", "doc-1"),
+        ("seed-b", "KNOWS", "mid", "doc-1"),
+    ]
+    assert set(service.subgraph(["mid"]).nodes) == {"mid", "seed-a", "seed-b", "far"}
+
+
+def test_expand_shares_edge_budget_across_seeds(memory_graph: graph_module.GraphService) -> None:
+    service = memory_graph
+    for entity_id in ("hub", "quiet", "linked"):
+        service.upsert_entity(entity_id, "Entity", {"label": entity_id})
+    for index in range(6):
+        service.upsert_entity(f"spoke-{index}", "Entity", {"label": f"spoke {index}"})
+        service.merge_relation("hub", "KNOWS", f"spoke-{index}", {"doc_id": "doc-1"})
+    service.merge_relation("quiet", "KNOWS", "linked", {"doc_id": "doc-2"})
+
+    expansion = service.expand(["hub", "quiet"], max_hops=2, edge_limit=4)
+
+    assert len(expansion.edges) == 4
+    assert ("quiet", "KNOWS", "linked", "doc-2") in expansion.edges
+    assert expansion.hops["linked"] == 1
+    assert len(service.expand(["hub"], max_hops=50).hops) == 7
+
+
+def test_expand_neo4j_walks_levels_in_one_transaction(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("NEO4J_URI", "bolt://neo4j")
+    config.reset_settings_cache()
+    dummy_driver = _DummyDriver()
+    monkeypatch.setattr(graph_module, "GraphDatabase", _DummyGraphDatabase(dummy_driver))
+    graph_module.reset_graph_service()
+    service = graph_module.GraphService()
+    seed = _DummyNode("seed", ["Entity"], {"label": "Seed"})
+    mid = _DummyNode("mid", ["Entity"], {"label": "Mid"})
+    far = _DummyNode("far", ["Entity"], {"label": "Far"})
+    first = _DummyRelationship("seed", "mid", "KNOWS", {"doc_id": "doc-1", "weight": 0.5})
+    second = _DummyRelationship("far", "mid", "KNOWS", {"doc_id": "doc-1"})
+    dummy_driver.read_results = [
+        [_DummyRecord(seed=seed)],
+        [_DummyRecord(node_id="seed", r=first, m=mid)],
+        [
+            _DummyRecord(node_id="mid", r=first, m=seed),
+            _DummyRecord(node_id="mid", r=second, m=far),
+        ],
+    ]
+
+    expansion = service.expand(["seed"], max_hops=2, edge_limit=10)
+
+    assert len(dummy_driver.read_calls) == 3
+    assert dummy_driver.read_calls[0][1] == {"seed_ids": ["seed"]}
+    hop_query, params = dummy_driver.read_calls[1]
+    assert "*" not in hop_query and "LIMIT $per_node" in hop_query
+    assert params == {"frontier": ["seed"], "per_node": 10}
+    assert dummy_driver.read_calls[2][1] == {"frontier": ["mid"], "per_node": 9}
+    assert expansion.hops == {"seed": 0, "mid": 1, "far": 2}
+    assert expansion.weights["far"] == pytest.approx(0.5)
+    assert [edge.source for edge in expansion.edges.values()] == ["seed", "far"]
+
+
+def test_memory_graph_reloads_from_snapshot_and_journal(
+    monkeypatch: pytest.MonkeyPatch, tmp_path
+) -> None:
+    monkeypatch.setenv("NEO4J_URI", "memory://")
+    monkeypatch.setenv("GRAPH_MEMORY_PERSIST", "true")
+    monkeypatch.setenv("GRAPH_MEMORY_DIR", str(tmp_path / "graph"))
+    monkeypatch.setenv("GRAPH_JOURNAL_COMPACT_EVENTS", "8")
+    config.reset_settings_cache()
+    graph_module.reset_graph_service()
+    service = graph_module.GraphService()
+    service.upsert_document("doc-1", "Agreement", {"case": "alpha"})
+    for index in range(6):
+        service.upsert_entity(f"entity-{index}", "Entity", {"label": f"Acme {index}"})
+        service.merge_relation("doc-1", "MENTIONS", f"entity-{index}", {"doc_id": "doc-1", "evidence": ["p1"]})
+    # Waits for the compactions the writes above started in the background.
+    service.close()
+    assert service.snapshot_memory_graph()
+    service.upsert_entity("entity-2", "Entity", {"aliases": ["Acme Two"]})
+    service.merge_relation("doc-1", "MENTIONS", "entity-0", {"doc_id": "doc-1", "evidence": "p2"})
+    service.merge_relation("entity-1", "OWNS", "unknown-target", {"doc_id": "doc-2", "weight": 0.5})
+    store_root = tmp_path / "graph"
+    assert (store_root / "graph.snapshot").exists()
+    assert (store_root / "journal.jsonl").read_text(encoding="utf-8").strip()
+    expected_nodes, expected_edges = service.neighbors("doc-1")
+    expected_export = list(service.iter_export())
+    service.close()
+
+    reloaded = graph_module.GraphService()
+
+    assert list(reloaded.iter_export()) == expected_export
+    assert reloaded._node_cache["entity-2"].properties == {"label": "Acme 2", "aliases": ["Acme Two"]}
+    nodes, edges = reloaded.neighbors("doc-1")
+    assert [node.id for node in nodes] == [node.id for node in expected_nodes]
+    assert edges == expected_edges
+    assert edges[0].properties["evidence"] == ["p1", "p2"]
+    assert reloaded.neighbors("entity-1")[1][-1].properties["weight"] == 0.5
+    assert [node.id for node in reloaded.search_entities("acme 3")] == ["entity-3"]
+    assert reloaded._node_cache["unknown-target"].type == "Unknown"
+    assert reloaded.community_status()["stale"] is True
+    assert reloaded._property_graph_hydrated is False
+    reloaded.get_property_graph_store()
+    assert reloaded._property_graph_hydrated is True
+    assert reloaded.snapshot_memory_graph()
+    reloaded.close()
+
+    compacted = graph_module.GraphService()
+    assert list(compacted.iter_export()) == expected_export
+    compacted.close()
+
+
+def test_run_cypher_memory_plans_with_indexes(memory_graph: graph_module.GraphService) -> None:
+    service = memory_graph
+    service.upsert_document("doc-plan", "Plan Doc", {})
+    for entity_id, label in (("acme", "Acme"), ("bolt", "Bolt"), ("crane", "Crane")):
+        service.upsert_entity(entity_id, "Entity", {"label": label})
+    service.upsert_entity("pat", "Person", {"label": "Pat"})
+    service.merge_relation("doc-plan", "MENTIONS", "acme", {"doc_id": "doc-plan"})
+    service.merge_relation("acme", "SUPPLIES", "bolt", {"doc_id": "doc-plan", "weight": 0.9})
+    service.merge_relation("acme", "SUPPLIES", "crane", {"doc_id": "doc-other", "weight": 0.2})
+    service.merge_relation("pat", "WORKS_FOR", "acme", {"doc_id": "doc-other"})
+
+    result = service.run_cypher(
+        "MATCH (a:Entity)-[r:SUPPLIES]->(b) WHERE a.id = $id AND r.weight > 0.5 RETURN b.label AS supplier, r",
+        {"id": "acme"},
+    )
+    assert result["records"] == [
+        {
+            "supplier": "Bolt",
+            "r": {
+                "type": "SUPPLIES",
+                "source": "acme",
+                "target": "bolt",
+                "properties": {"doc_id": "doc-plan", "weight": 0.9},
+            },
+        }
+    ]
+    operators = [step["operator"] for step in result["summary"]["plan"]]
+    assert operators[0] == "NodeByIdSeek" and "Expand(All)" in operators
+    assert result["summary"]["plan"][0]["rows"] == 1
+
+    incoming = service.run_cypher("MATCH (e:Entity)<-[:WORKS_FOR]-(p:Person) RETURN p.id, e.id")
+    assert incoming["records"] == [{"p.id": "pat", "e.id": "acme"}]
+
+    by_document = service.run_cypher("MATCH (s)-[r {doc_id: 'doc-other'}]->(t) RETURN s.id, t.id")
+    assert by_document["summary"]["plan"][0]["operator"] == "RelationshipByDocumentSeek"
+    assert {(row["s.id"], row["t.id"]) for row in by_document["records"]} == {("acme", "crane"), ("pat", "acme")}
+
+    limited = service.run_cypher("MATCH (n:Entity) RETURN n.id LIMIT 2")
+    assert limited["records"] == [{"n.id": "acme"}, {"n.id": "bolt"}]
+    scan = limited["summary"]["plan"][0]
+    assert scan["operator"] == "NodeByLabelScan" and scan["rows"] == 2
+
+    explained = service.explain_cypher("MATCH (n:Person) WHERE n.label CONTAINS 'a' RETURN n")
+    assert [step["operator"] for step in explained["plan"]] == ["NodeByLabelScan", "Filter", "ProduceResults"]
+    assert "rows" not in explained["plan"][0]
+
+    with pytest.raises(ValueError):
+        service.run_cypher("MATCH (n) WHERE n.label = 'Acme' OR n.label = 'Bolt' RETURN n")
+
+
+def test_run_cypher_memory_entity_label_covers_entity_types(memory_graph: graph_module.GraphService) -> None:
+    service = memory_graph
+    service.upsert_document("doc-types", "Typed Doc", {})
+    service.upsert_entity("ada", "Person", {"label": "Ada"})
+    service.upsert_entity("globex", "Organization", {"label": "Globex"})
+    service.merge_relation("doc-types", "MENTIONS", "ada", {"doc_id": "doc-types"})
+    service.merge_relation("doc-types", "MENTIONS", "globex", {"doc_id": "doc-types"})
+
+    scanned = service.run_cypher("MATCH (n:Entity) RETURN n.id ORDER BY n.id")
+    assert scanned["records"] == [{"n.id": "ada"}, {"n.id": "globex"}]
+    assert scanned["summary"]["plan"][0]["operator"] == "NodeByLabelScan"
+
+    mentioned = service.run_cypher("MATCH (d:Document {id: 'doc-types'})-[:MENTIONS]->(e:Entity) RETURN e.id")
+    assert {row["e.id"] for row in mentioned["records"]} == {"ada", "globex"}
+    people = service.run_cypher("MATCH (p:Person) RETURN p.id")
+    assert people["records"] == [{"p.id": "ada"}]
+
+    service.upsert_entity("globex", "Location", {})
+    assert service.run_cypher("MATCH (n:Organization) RETURN n.id")["records"] == []
+    assert {row["n.id"] for row in service.run_cypher("MATCH (n:Entity) RETURN n.id")["records"]} == {"ada", "globex"}
+
+
+def test_graph_export_streams_resumable_ndjson(memory_graph: graph_module.GraphService) -> None:
+    import gzip
+    import json
+
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    from backend.app.api import graph as graph_api
+
+    service = memory_graph
+    service.upsert_document("doc-export", "Export", {})
+    service.upsert_entity("entity-x", "Entity", {"label": "X"})
+    service.upsert_entity("entity-y", "Entity", {"label": "Y"})
+    service.merge_relation("doc-export", "MENTIONS", "entity-x", {"doc_id": "doc-export"})
+    service.merge_relation("entity-x", "KNOWS", "entity-y", {"doc_id": "doc-export"})
+
+    records = list(service.iter_export())
+    assert [record["cursor"] for record in records[:2]] == ["nodes:0", "nodes:1"]
+    assert len([record for record in records if record["kind"] == "node"]) == len(service._node_cache)
+    edge_cursors = [record["cursor"] for record in records if record["kind"] == "edge"]
+    assert edge_cursors[0] == "edges:0" and len(edge_cursors) == len(service._edge_cache)
+    resumed = list(service.iter_export(after=records[-2]["cursor"]))
+    assert resumed == records[-1:]
+    assert list(service.iter_export(after=records[-1]["cursor"])) == []
+    with pytest.raises(ValueError):
+        service.iter_export(after="bogus")
+
+    app = FastAPI()
+    app.include_router(graph_api.router)
+    app.dependency_overrides[graph_api.authorize_graph_read] = lambda: None
+    app.dependency_overrides[graph_api.get_graph_service] = lambda: service
+    client = TestClient(app)
+
+    response = client.get("/graph/export", params={"after": records[2]["cursor"]})
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert lines == records[3:]
+
+    compressed = client.get("/graph/subgraph/export", params={"ids": ["entity-y"], "compress": "true"})
+    assert compressed.headers["content-encoding"] == "gzip"
+    # TestClient already inflates Content-Encoding: gzip; re-check the raw stream too.
+    subgraph_lines = [json.loads(line) for line in compressed.text.splitlines()]
+    assert {line.get("id") for line in subgraph_lines if line["kind"] == "node"} == {"entity-x", "entity-y"}
+    raw = b"".join(graph_api._encode_ndjson(iter(records), compress=True))
+    assert gzip.decompress(raw).decode("utf-8").count("\n") == len(records)
+
+    assert client.get("/graph/export", params={"after": "edges:x"}).status_code == 400
+
+
+def test_graph_export_api_resumes_interrupted_gzip_stream(
+    memory_graph: graph_module.GraphService, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import json
+    import zlib
+
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    from backend.app.api import graph as graph_api
+
+    service = memory_graph
+    service.upsert_document("doc-resume", "Resume", {})
+    for index in range(8):
+        service.upsert_entity(f"entity-{index}", "Entity", {"label": f"Entity {index}"})
+        service.merge_relation("doc-resume", "MENTIONS", f"entity-{index}", {"doc_id": "doc-resume"})
+    monkeypatch.setattr(graph_api, "_EXPORT_FLUSH_LINES", 2)
+
+    app = FastAPI()
+    app.include_router(graph_api.router)
+    app.dependency_overrides[graph_api.authorize_graph_read] = lambda: None
+    app.dependency_overrides[graph_api.get_graph_service] = lambda: service
+    client = TestClient(app)
+    expected = [json.loads(line) for line in client.get("/graph/export").text.splitlines()]
+
+    with client.stream("GET", "/graph/export", params={"compress": "true"}) as response:
+        assert response.headers["content-encoding"] == "gzip"
+        raw = b"".join(response.iter_raw())
+    # Inflate a download cut off halfway and keep only the lines that arrived whole.
+    partial = zlib.decompressobj(wbits=31).decompress(raw[: len(raw) // 2])
+    received = [json.loads(line) for line in partial.split(b"\n")[:-1]]
+    assert 0 < len(received) < len(expected)
+    assert received == expected[: len(received)]
+
+    resumed = client.get("/graph/export", params={"after": received[-1]["cursor"], "compress": "true"})
+    assert received + [json.loads(line) for line in resumed.text.splitlines()] == expected
+
+    bad_cursor = client.get("/graph/subgraph/export", params={"ids": ["entity-0"], "after": "nodes:x"})
+    assert bad_cursor.status_code == 400
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import logging
+import os
+from pathlib import Path
+from types import SimpleNamespace
+
+from backend.app.services import ingestion as ingestion_module
+from backend.ingestion import fingerprints as fingerprints_module
+from backend.ingestion.fingerprints import FingerprintManifest
+
+
+def test_manifest_skips_unchanged_files_from_stat(tmp_path: Path, monkeypatch) -> None:
+    root = tmp_path / "source"
+    root.mkdir()
+    note = root / "note.txt"
+    note.write_text("first draft", encoding="utf-8")
+    manifest_path = tmp_path / "manifest.json"
+
+    manifest = FingerprintManifest(manifest_path, root)
+    fingerprint, unchanged = manifest.check(note)
+    assert not unchanged
+    manifest.save()
+    assert not manifest_path.exists()  # nothing is remembered until the caller commits
+    manifest.commit(note)
+    manifest.save()
+
+    hashed = []
+    original = fingerprints_module.compute_sha256
+    monkeypatch.setattr(fingerprints_module, "compute_sha256", lambda path: hashed.append(path) or original(path))
+    reopened = FingerprintManifest(manifest_path, root)
+    assert reopened.check(note) == (fingerprint, True)
+    assert hashed == []
+
+    stat = note.stat()
+    os.utime(note, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+    touched, unchanged = reopened.check(note)
+    assert unchanged and touched.sha256 == fingerprint.sha256
+    assert hashed == [note]
+
+    note.write_text("second draft", encoding="utf-8")
+    changed, unchanged = reopened.check(note)
+    assert not unchanged and changed.sha256 != fingerprint.sha256
+
+
+def test_manifest_hit_is_loaded_when_document_store_lacks_it(tmp_path: Path) -> None:
+    root = tmp_path / "source"
+    root.mkdir()
+    note = root / "note.txt"
+    note.write_text("first draft", encoding="utf-8")
+    manifest = FingerprintManifest(tmp_path / "manifest.json", root)
+    fingerprint, _ = manifest.check(note)
+    manifest.commit(note)
+    stored: dict[str, dict[str, object]] = {}
+
+    class _DocumentStore:
+        def read_document(self, doc_id: str) -> dict[str, object]:
+            if doc_id not in stored:
+                raise FileNotFoundError(doc_id)
+            return stored[doc_id]
+
+    service = ingestion_module.IngestionService.__new__(ingestion_module.IngestionService)
+    service.document_store = _DocumentStore()
+    service.loader_registry = SimpleNamespace(iter_workspace_paths=lambda _root: [note])
+    service.logger = logging.getLogger("test.fingerprints")
+    skipped: list[dict[str, str]] = []
+
+    # A reset document store must not turn manifest hits into permanently skipped files.
+    assert list(service._changed_files(root, manifest, skipped)) == [(note, fingerprint.sha256)]
+    assert skipped == []
+
+    stored[ingestion_module.sha256_id(note)] = {"checksum_sha256": fingerprint.sha256}
+    assert list(service._changed_files(root, manifest, skipped)) == []
+    assert skipped == [{"path": str(note), "reason": "unchanged_fingerprint"}]
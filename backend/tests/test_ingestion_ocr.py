@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import replace
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from PIL import Image
+
+from backend.app.config import get_settings
+from backend.ingestion import ocr as ocr_module
+from backend.ingestion import pipeline as pipeline_module
+from backend.ingestion.llama_index_factory import create_sentence_splitter
+from backend.ingestion.loader_registry import TEXT_EXCLUDED_METADATA_KEYS, LoaderRegistry
+from backend.ingestion.ocr import OcrEngine, OcrResult
+from backend.ingestion.ocr_tokens import OcrTokenStore
+from backend.ingestion.settings import OcrConfig, OcrProvider, build_runtime_config
+
+
+def _scanned_pdf(path: Path, pages: int) -> None:
+    images = [Image.new("RGB", (20 + index, 20), color=(255, 255, 255)) for index in range(pages)]
+    images[0].save(path, save_all=True, append_images=images[1:])
+
+
+def test_pdf_pages_are_ocred_in_parallel_in_order_and_cached(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    calls: list[int] = []
+
+    def fake_image_to_data(image, lang, config, output_type):
+        page = image.width - 20
+        calls.append(page)
+        # Early pages finish last so ordering has to come from the collector, not the pool.
+        time.sleep(0.02 * (6 - page))
+        return {"text": [f"page-{page}"], "conf": ["90"], "left": [0], "top": [0], "width": [5], "height": [5]}
+
+    monkeypatch.setattr(ocr_module.pytesseract, "image_to_data", fake_image_to_data)
+    pdf = tmp_path / "exhibit.pdf"
+    _scanned_pdf(pdf, 6)
+    config = OcrConfig(
+        provider=OcrProvider.TESSERACT,
+        languages="eng",
+        workers=3,
+        cache_path=tmp_path / "ocr.sqlite",
+        cache_max_entries=100,
+    )
+
+    first = OcrEngine(config, logging.getLogger("test.ocr")).extract_from_pdf(pdf)
+    assert first.text.split("\n\n") == [f"page-{index}" for index in range(6)]
+    assert sorted(calls) == list(range(6))
+
+    duplicate = tmp_path / "duplicate.pdf"
+    duplicate.write_bytes(pdf.read_bytes())
+    engine = OcrEngine(config, logging.getLogger("test.ocr"))
+    second = engine.extract_from_pdf(duplicate)
+    assert second.text == first.text
+    assert second.tokens == first.tokens
+    assert len(calls) == 6
+    assert (engine.cache.hits, engine.cache.misses) == (6, 0)
+
+
+def test_ocr_tokens_live_in_sidecar_not_chunk_text(tmp_path: Path) -> None:
+    tokens = [
+        {"text": "Acme", "confidence": 92.0, "left": 0, "top": 0, "width": 40, "height": 20, "source": None},
+        {"text": "invoice", "confidence": None, "left": 50, "top": 0, "width": 70, "height": 20, "source": None},
+    ]
+
+    class _Engine:
+        def extract_from_image(self, path):
+            return OcrResult(text="Acme invoice", engine="tesseract", confidence=92.0, tokens=tokens)
+
+    scan = tmp_path / "scan.png"
+    Image.new("RGB", (8, 8)).save(scan)
+    base = build_runtime_config(get_settings())
+    runtime_config = replace(base, llama_cache_dir=tmp_path / "cache")
+    registry = LoaderRegistry(runtime_config, _Engine(), logger=logging.getLogger("test.loader"))
+    source = SimpleNamespace(type="local", path=str(tmp_path), source_id="src-1", metadata={})
+
+    loaded = registry.load_path(scan, source, str(tmp_path))
+    assert "ocr_tokens" not in loaded.metadata
+    assert loaded.metadata["ocr_token_count"] == 2
+    columns = registry.ocr_tokens.read(loaded.metadata["ocr_tokens_ref"])
+    assert list(columns.start) == [0, 5]
+    assert columns.tokens() == [
+        {key: value for key, value in token.items() if key != "source"} for token in tokens
+    ]
+
+    prepared = pipeline_module._prepare_loaded_document(
+        loaded, create_sentence_splitter(runtime_config.tuning)
+    )
+    (_, chunk_text, chunk_metadata), = prepared.chunks
+    assert chunk_text.endswith("Acme invoice")
+    header_keys = {line.split(":", 1)[0] for line in chunk_text[: -len("Acme invoice")].splitlines() if line}
+    assert not header_keys & set(TEXT_EXCLUDED_METADATA_KEYS)
+    assert chunk_metadata["ocr_tokens_ref"] == loaded.metadata["ocr_tokens_ref"]
+
+
+def test_ocr_token_offsets_skip_embedded_text_pages(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    class _Page:
+        def __init__(self, text: str, images: list[bytes]) -> None:
+            self._text = text
+            self.images = [SimpleNamespace(data=data) for data in images]
+
+        def extract_text(self) -> str:
+            return self._text
+
+    def fake_image_to_data(image, lang, config, output_type):
+        return {
+            "text": ["The", "", "scan"],
+            "conf": ["90", "-1", "80"],
+            "left": [0, 0, 30],
+            "top": [0, 0, 0],
+            "width": [20, 0, 25],
+            "height": [10, 0, 10],
+        }
+
+    scan = tmp_path / "scan.png"
+    Image.new("RGB", (8, 8)).save(scan)
+    pages = [_Page("The first page is text.", []), _Page("", [scan.read_bytes()])]
+    monkeypatch.setattr(ocr_module, "PdfReader", lambda path: SimpleNamespace(pages=pages))
+    monkeypatch.setattr(ocr_module.pytesseract, "image_to_data", fake_image_to_data)
+    engine = OcrEngine(OcrConfig(provider=OcrProvider.TESSERACT, languages="eng"), logging.getLogger("test.ocr"))
+
+    result = engine.extract_from_pdf(tmp_path / "mixed.pdf")
+
+    assert result.text == "The first page is text.\n\nThe scan"
+    assert [token["start"] for token in result.tokens] == [25, 29]
+    store = OcrTokenStore(tmp_path / "tokens")
+    columns = store.read(store.write("mixed", result.text, result.tokens + [{"text": "missing"}]))
+    assert list(columns.start) == [25, 29, -1]
+    assert [token["text"] for token in columns.tokens()] == ["The", "scan", "missing"]
@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import logging
+from dataclasses import replace
+from pathlib import Path
+from types import SimpleNamespace
+from typing import List
+
+import pytest
+
+from backend.app.config import get_settings
+from backend.ingestion import pipeline as pipeline_module
+from backend.ingestion.embedding_cache import EmbeddingCache
+from backend.ingestion.loader_registry import LoaderRegistry
+from backend.ingestion.ocr import OcrEngine
+from backend.ingestion.pipeline import EmbeddingBatcher, PipelineNodeRecord
+from backend.ingestion.settings import PipelineTuning, build_runtime_config
+
+
+class _RecordingEmbedding:
+    def __init__(self) -> None:
+        self.batches: List[int] = []
+
+    def get_text_embedding(self, text: str) -> list[float]:  # pragma: no cover - must not be used
+        raise AssertionError("per-node embedding should not be called")
+
+    def get_text_embedding_batch(self, texts: list[str], **_: object) -> list[list[float]]:
+        self.batches.append(len(texts))
+        return [[float(len(text))] for text in texts]
+
+
+def _record(doc: str, index: int) -> PipelineNodeRecord:
+    return PipelineNodeRecord(
+        node_id=f"{doc}-{index}",
+        text=f"{doc} chunk {index}",
+        embedding=[],
+        metadata={},
+        chunk_index=index,
+    )
+
+
+def test_embedding_batches_span_documents(monkeypatch: pytest.MonkeyPatch) -> None:
+    recorded: List[int] = []
+    monkeypatch.setattr(
+        pipeline_module,
+        "record_embedding_batch",
+        lambda size, elapsed, **_: recorded.append(size),
+    )
+    model = _RecordingEmbedding()
+    batcher = EmbeddingBatcher(model, 4, source_type="local", job_id="job-1")
+    records = [_record("doc-a", index) for index in range(3)] + [_record("doc-b", index) for index in range(6)]
+    for record in records:
+        batcher.add(record)
+    batcher.flush()
+
+    assert model.batches == [4, 4, 1]
+    assert recorded == [4, 4, 1]
+    assert all(record.embedding == [float(len(record.text))] for record in records)
+
+
+def test_embedding_cache_skips_repeated_chunks_and_evicts_lru(tmp_path: Path) -> None:
+    path = tmp_path / "embeddings.sqlite"
+    cache = EmbeddingCache(path, model_id="huggingface:test", dimensions=1, max_entries=3)
+    model = _RecordingEmbedding()
+    first = [_record("doc-a", index) for index in range(2)]
+    batcher = EmbeddingBatcher(model, 8, source_type="local", job_id="job-1", cache=cache)
+    for record in first:
+        batcher.add(record)
+    batcher.flush()
+    cache.close()
+
+    reopened = EmbeddingCache(path, model_id="huggingface:test", dimensions=1, max_entries=3)
+    repeat = [_record("doc-a", 0), _record("doc-a", 0), _record("doc-c", 5)]
+    batcher = EmbeddingBatcher(model, 8, source_type="local", job_id="job-2", cache=reopened)
+    for record in repeat:
+        batcher.add(record)
+    batcher.flush()
+
+    assert model.batches == [2, 1]
+    assert (reopened.hits, reopened.misses) == (1, 1)
+    assert all(record.embedding == [float(len(record.text))] for record in repeat)
+
+    reopened.put_many({"fresh text": [1.0]})
+    assert len(reopened) == 3
+    assert reopened.get_many(["doc-a chunk 1"]) == {}
+    assert reopened.get_many(["doc-a chunk 0"])
+    other_model = EmbeddingCache(path, model_id="openai:other", dimensions=1, max_entries=3)
+    assert other_model.get_many(["doc-a chunk 0"]) == {}
+
+
+def test_stream_pipeline_bounds_documents_in_flight(monkeypatch: pytest.MonkeyPatch) -> None:
+    window = 2
+    loaded: List[str] = []
+
+    class _Registry:
+        def is_remote(self, source):
+            return False
+
+        def iter_workspace_paths(self, root):
+            return (Path(f"doc-{index}") for index in range(40))
+
+        def load_path(self, path, source, origin, *, checksum=None):
+            loaded.append(path.name)
+            return SimpleNamespace(name=path.name)
+
+    def _complete(document, batcher, llm_service):
+        records = [_record(document.name, index) for index in range(3)]
+        for record in records:
+            batcher.add(record)
+        return SimpleNamespace(loaded=document, nodes=records)
+
+    model = _RecordingEmbedding()
+    monkeypatch.setattr(pipeline_module, "configure_global_settings", lambda config: None)
+    monkeypatch.setattr(pipeline_module, "create_sentence_splitter", lambda tuning: None)
+    monkeypatch.setattr(pipeline_module, "create_embedding_model", lambda config: model)
+    monkeypatch.setattr(pipeline_module, "create_llm_service", lambda config: None)
+    monkeypatch.setattr(pipeline_module, "_prepare_loaded_document", lambda document, splitter: document)
+    monkeypatch.setattr(pipeline_module, "_complete_document", _complete)
+    runtime_config = SimpleNamespace(
+        embedding=None,
+        llm=None,
+        tuning=PipelineTuning(
+            chunk_size=400,
+            chunk_overlap=0,
+            max_triplets_per_chunk=0,
+            graph_batch_size=8,
+            embedding_batch_size=16,
+            pipeline_window=window,
+        ),
+    )
+
+    committed: List[str] = []
+    for result in pipeline_module.stream_ingestion_pipeline(
+        "job-1",
+        Path("."),
+        SimpleNamespace(type="local"),
+        "origin",
+        registry=_Registry(),
+        runtime_config=runtime_config,
+    ):
+        assert all(node.embedding for node in result.nodes)
+        committed.append(result.loaded.name)
+        # Queued, held by the blocked loader, and waiting on the batcher.
+        assert len(loaded) - len(committed) <= 2 * window + 1
+
+    assert committed == [f"doc-{index}" for index in range(40)]
+    assert max(model.batches) <= window * 3
+
+
+def test_process_pool_output_matches_in_process_run(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    workspace = tmp_path / "workspace"
+    workspace.mkdir()
+    for index in range(6):
+        (workspace / f"note-{index}.txt").write_text(
+            f"Alice Smith met Bob Jones in Paris on day {index}. " * (index + 5),
+            encoding="utf-8",
+        )
+
+    class _Llm:
+        def generate_text(self, prompt: str) -> str:
+            return "Correspondence, Travel"
+
+    monkeypatch.setattr(pipeline_module, "create_embedding_model", lambda config: _RecordingEmbedding())
+    monkeypatch.setattr(pipeline_module, "create_llm_service", lambda config: _Llm())
+    base = build_runtime_config(get_settings())
+    source = SimpleNamespace(type="local", path=str(workspace), source_id="src-1", metadata={})
+
+    def _run(workers: int) -> list:
+        runtime_config = replace(
+            base,
+            llama_cache_dir=tmp_path / "cache",
+            tuning=replace(base.tuning, chunk_size=64, chunk_overlap=8, process_workers=workers),
+        )
+        registry = LoaderRegistry(
+            runtime_config,
+            OcrEngine(runtime_config.ocr, logging.getLogger("test.ocr")),
+            logger=logging.getLogger("test.loader"),
+        )
+        return [
+            (
+                result.loaded.path.name,
+                result.loaded.checksum,
+                result.loaded.document.get_content(),
+                [(node.chunk_index, node.text, node.embedding) for node in result.nodes],
+                result.entities,
+                result.triples,
+                result.categories,
+            )
+            for result in pipeline_module.stream_ingestion_pipeline(
+                "job-1", workspace, source, str(workspace), registry=registry, runtime_config=runtime_config
+            )
+        ]
+
+    sequential = _run(1)
+    assert [entry[0] for entry in sequential] == [f"note-{index}.txt" for index in range(6)]
+    assert _run(2) == sequential
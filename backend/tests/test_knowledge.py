@@ -1,3 +1,7 @@
+import json
+from pathlib import Path
+
+import pytest
 from fastapi.testclient import TestClient
 
 
@@ -59,3 +63,76 @@ def test_knowledge_catalog_endpoints(client: TestClient, auth_headers_factory) -
     top_hit = search_payload["results"][0]
     assert "litigation" in top_hit["snippet"].lower()
     assert top_hit["lesson_id"] in {lesson["lesson_id"] for lesson in lessons}
+
+
+def test_knowledge_index_is_reused_until_content_changes(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    from llama_index.core.embeddings import MockEmbedding
+
+    from backend.app import config
+    from backend.app.services import knowledge as knowledge_module
+
+    repo_root = Path(__file__).resolve().parents[2]
+    catalog = tmp_path / "catalog.json"
+    content_dir = repo_root / "docs/knowledge"
+    payload = json.loads((content_dir / "catalog.json").read_text())
+    for lesson in payload["lessons"]:
+        lesson["content_path"] = str((content_dir / lesson["content_path"]).resolve())
+    catalog.write_text(json.dumps(payload))
+    monkeypatch.setenv("KNOWLEDGE_CATALOG_PATH", str(catalog))
+    monkeypatch.setenv("KNOWLEDGE_INDEX_DIR", str(tmp_path / "index"))
+    monkeypatch.setenv("KNOWLEDGE_PROGRESS_PATH", str(tmp_path / "progress.json"))
+    monkeypatch.setattr(knowledge_module, "create_embedding_model", lambda _: MockEmbedding(embed_dim=8))
+    config.reset_settings_cache()
+
+    first = knowledge_module.KnowledgeService()
+    assert first._index is not None
+
+    builds: list[str] = []
+    original_build = knowledge_module.KnowledgeService._build_index
+
+    def counting_build(self, lessons):
+        builds.append(self._index_hash)
+        return original_build(self, lessons)
+
+    monkeypatch.setattr(knowledge_module.KnowledgeService, "_build_index", counting_build)
+    reloaded = knowledge_module.KnowledgeService()
+    assert builds == []
+    assert reloaded.search("litigation holds", limit=3)["results"]
+
+    payload["lessons"][0]["summary"] = "Updated summary"
+    catalog.write_text(json.dumps(payload))
+    changed = knowledge_module.KnowledgeService()
+    assert changed._index is not None
+    assert changed._rebuild_thread is not None
+    changed._rebuild_thread.join(timeout=30)
+    assert builds == [changed._index_hash]
+    assert (tmp_path / "index" / changed._index_hash).is_dir()
+    assert not (tmp_path / "index" / first._index_hash).exists()
+    config.reset_settings_cache()
+
+
+def test_knowledge_fallback_search_uses_token_postings(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    from llama_index.core.embeddings import MockEmbedding
+
+    from backend.app import config
+    from backend.app.services import knowledge as knowledge_module
+
+    monkeypatch.setenv("KNOWLEDGE_INDEX_DIR", str(tmp_path / "index"))
+    monkeypatch.setenv("KNOWLEDGE_PROGRESS_PATH", str(tmp_path / "progress.json"))
+    monkeypatch.setattr(knowledge_module, "create_embedding_model", lambda _: MockEmbedding(embed_dim=8))
+    config.reset_settings_cache()
+    service = knowledge_module.KnowledgeService()
+    service._index = None
+
+    results = service.search("litigation hold litigation", limit=50)["results"]
+    assert results
+    for hit in results:
+        lesson = service._lessons[hit["lesson_id"]]
+        section = next(item for item in lesson.sections if item.id == hit["section_id"])
+        tokens = service._tokenize(section.markdown)
+        assert hit["score"] == 2 * tokens.count("litigation") + tokens.count("hold")
+    assert [hit["score"] for hit in results] == sorted((hit["score"] for hit in results), reverse=True)
+    assert service.search("zzzzqx", limit=5)["results"] == []
+    config.reset_settings_cache()
@@ -133,6 +133,7 @@ def test_build_trace_includes_graph_payload(retrieval_service: retrieval_module.
     assert graph_payload["edges"]
     assert graph_payload["events"]
     assert graph_payload["communities"]
+    assert graph_payload["community_status"]["stale"] is False
     assert doc_scope
     assert privilege_decisions == {}
 
@@ -230,6 +231,38 @@ def test_caselaw_adapter_uses_cassette(cassette_loader) -> None:
     assert "Miranda" in first.payload["case_name"]
 
 
+def test_caselaw_adapter_reuses_pooled_client() -> None:
+    adapter = retrieval_module.CaseLawApiAdapter(endpoint="https://api.case.law/v1/cases/", api_key=None)
+    adapter.open()
+    with adapter._client_factory() as first:
+        pass
+    with adapter._client_factory() as second:
+        pass
+    assert first is second
+    assert not first.is_closed
+    adapter.close()
+    assert first.is_closed
+
+
+def test_get_retrieval_service_returns_shared_instance(monkeypatch: pytest.MonkeyPatch) -> None:
+    built: list[object] = []
+
+    class _Service:
+        def __init__(self) -> None:
+            built.append(self)
+
+        def close(self) -> None:
+            pass
+
+    monkeypatch.setattr(retrieval_module, "RetrievalService", _Service)
+    retrieval_module.reset_retrieval_service()
+    try:
+        assert retrieval_module.get_retrieval_service() is retrieval_module.get_retrieval_service()
+        assert len(built) == 1
+    finally:
+        retrieval_module.reset_retrieval_service()
+
+
 def test_join_external_results_links_internal_case(
     retrieval_service: retrieval_module.RetrievalService,
 ) -> None:
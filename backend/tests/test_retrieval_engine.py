@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import List
 
 import pytest
 from qdrant_client.http import models as qmodels
 
 from backend.app.services import retrieval_engine as engine_module
+from backend.app.storage.keyword_index import KeywordIndex
 
 
 class _StubVectorAdapter:
@@ -121,3 +125,171 @@ def test_cross_encoder_fallback_when_unavailable(
     assert calls["count"] == 1
     assert bundle.reranker == "rrf"
     assert all("cross_encoder_score" not in (point.payload or {}) for point in bundle.fused_points)
+
+
+class _SlowKeywordAdapter(_StubKeywordAdapter):
+    def __init__(self, points: List[qmodels.ScoredPoint], delay: float):
+        super().__init__(points)
+        self._delay = delay
+
+    def retrieve(self, _query: str, *, top_k: int) -> List[qmodels.ScoredPoint]:
+        time.sleep(self._delay)
+        return super().retrieve(_query, top_k=top_k)
+
+
+def test_retriever_timeout_is_dropped_from_fusion(hybrid_engine: engine_module.HybridQueryEngine) -> None:
+    keyword_points = [
+        qmodels.ScoredPoint(
+            id="keyword::slow",
+            score=0.5,
+            payload={"doc_id": "doc-slow", "text": "Late keyword", "chunk_index": 0},
+            version=1,
+        )
+    ]
+    hybrid_engine.keyword = _SlowKeywordAdapter(keyword_points, delay=0.5)
+    hybrid_engine.retriever_timeouts = {"keyword": 0.05}
+
+    started = time.perf_counter()
+    bundle = hybrid_engine.retrieve(
+        "query",
+        top_k=3,
+        vector_window=3,
+        graph_window=3,
+        keyword_window=3,
+        use_cross_encoder=False,
+    )
+
+    assert time.perf_counter() - started < 0.4
+    assert bundle.timed_out_retrievers == ["keyword"]
+    assert bundle.keyword_points == []
+    assert {point.id for point in bundle.fused_points} == {"vector::1", "graph::edge"}
+    assert set(bundle.retriever_latency_ms) == {"vector", "graph"}
+
+
+class _SlowVectorAdapter(_StubVectorAdapter):
+    def __init__(self, points: List[qmodels.ScoredPoint], delay: float):
+        super().__init__(points)
+        self._delay = delay
+
+    def retrieve(self, _query: str, *, top_k: int) -> List[qmodels.ScoredPoint]:
+        time.sleep(self._delay)
+        return super().retrieve(_query, top_k=top_k)
+
+
+def test_retriever_deadline_excludes_queue_wait(
+    hybrid_engine: engine_module.HybridQueryEngine,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    pool = ThreadPoolExecutor(max_workers=1)
+    monkeypatch.setattr(engine_module, "_RETRIEVER_POOL", pool)
+    monkeypatch.setattr(engine_module, "_RETRIEVER_POOL_WORKERS", 1)
+    hybrid_engine.pool_workers = 1
+    hybrid_engine.vector = _SlowVectorAdapter(hybrid_engine.vector._points, delay=0.2)
+    hybrid_engine.keyword = _SlowKeywordAdapter(hybrid_engine.keyword._points, delay=0.2)
+    hybrid_engine.retriever_timeouts = {"keyword": 0.3}
+
+    # Keyword queues ~0.2s behind vector on the single worker, then runs for ~0.2s.
+    bundle = hybrid_engine.retrieve(
+        "query",
+        top_k=3,
+        vector_window=3,
+        graph_window=3,
+        keyword_window=3,
+        use_cross_encoder=False,
+    )
+    pool.shutdown(wait=True)
+
+    assert bundle.timed_out_retrievers == []
+    assert [point.id for point in bundle.keyword_points] == ["keyword::1"]
+
+
+def test_retriever_pool_grows_to_requested_workers(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(engine_module, "_RETRIEVER_POOL", None)
+    monkeypatch.setattr(engine_module, "_RETRIEVER_POOL_WORKERS", 0)
+    small = engine_module._retriever_pool(3)
+    assert engine_module._retriever_pool(2) is small
+    large = engine_module._retriever_pool(6)
+    assert large is not small and engine_module._RETRIEVER_POOL_WORKERS == 6
+    # A caller still holding the replaced pool can keep submitting to it.
+    assert small.submit(lambda: "done").result(timeout=1) == "done"
+    small.shutdown(wait=True)
+    large.shutdown(wait=True)
+
+
+class _ListingDocumentStore:
+    def __init__(self, documents: List[dict]):
+        self.documents = documents
+        self.calls = 0
+
+    def list_documents(self) -> List[dict]:
+        self.calls += 1
+        return list(self.documents)
+
+
+def test_keyword_adapter_bootstraps_index_once(tmp_path: Path) -> None:
+    store = _ListingDocumentStore(
+        [
+            {"id": "doc-1", "title": "Deposition of Jane Roe", "source_type": "local"},
+            {"id": "doc-2", "title": "Invoice", "entity_labels": ["Roe Holdings"]},
+        ]
+    )
+    adapter = engine_module.KeywordRetrieverAdapter(store, KeywordIndex(tmp_path))
+
+    first = adapter.retrieve("roe deposition", top_k=5)
+    second = adapter.retrieve("invoice", top_k=5)
+
+    assert store.calls == 1
+    assert [point.payload["doc_id"] for point in first] == ["doc-1", "doc-2"]
+    assert first[0].id == "keyword::doc-1::0"
+    assert first[0].payload["retriever"] == "keyword"
+    assert [point.payload["doc_id"] for point in second] == ["doc-2"]
+
+
+def test_keyword_adapter_bootstraps_despite_postings_added_by_ingestion(tmp_path: Path) -> None:
+    store = _ListingDocumentStore(
+        [
+            {"id": "doc-1", "title": "Deposition of Jane Roe"},
+            {"id": "doc-2", "title": "Invoice"},
+        ]
+    )
+    index = KeywordIndex(tmp_path)
+    index.index_document("doc-2", store.documents[1])
+    adapter = engine_module.KeywordRetrieverAdapter(store, index)
+
+    assert [point.payload["doc_id"] for point in adapter.retrieve("deposition", top_k=5)] == ["doc-1"]
+    assert store.calls == 1 and index.bootstrapped
+
+    restarted = engine_module.KeywordRetrieverAdapter(store, KeywordIndex(tmp_path))
+    restarted.retrieve("invoice", top_k=5)
+    assert store.calls == 1
+
+
+def test_graph_adapter_scores_by_hops_and_path_weight(monkeypatch: pytest.MonkeyPatch) -> None:
+    from backend.app import config
+    from backend.app.services import graph as graph_module
+
+    monkeypatch.setenv("NEO4J_URI", "memory://")
+    config.reset_settings_cache()
+    graph_module.reset_graph_service()
+    service = graph_module.GraphService()
+    for entity_id, label in (("acme", "Acme"), ("beta", "Beta"), ("gamma", "Gamma")):
+        service.upsert_entity(entity_id, "Entity", {"label": label})
+    service.merge_relation("acme", "OWNS", "beta", {"doc_id": "doc-1", "weight": 0.5})
+    service.merge_relation("beta", "OWNS", "gamma", {"doc_id": "doc-2"})
+    expand_calls: List[List[str]] = []
+    original_expand = service.expand
+
+    def tracking_expand(seed_ids, **kwargs):
+        expand_calls.append(list(seed_ids))
+        return original_expand(seed_ids, **kwargs)
+
+    monkeypatch.setattr(service, "expand", tracking_expand)
+    adapter = engine_module.GraphRetrieverAdapter(service, max_hops=2)
+
+    points, relations = adapter.retrieve("acme", top_k=5)
+
+    assert expand_calls == [["acme"]]
+    assert [point.payload["hops"] for point in points] == [1, 2]
+    assert points[0].score == pytest.approx(0.3)
+    assert points[1].score == pytest.approx(0.15)
+    assert [statement for statement, _ in relations] == ["Acme owns Beta", "Beta owns Gamma"]
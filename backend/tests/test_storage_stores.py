@@ -12,6 +12,7 @@ sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
 
 from backend.app.storage.document_store import DocumentStore
 from backend.app.storage.job_store import JobStore
+from backend.app.storage.keyword_index import KeywordIndex
 from backend.app.utils.storage import read_json
 
 
@@ -77,3 +78,21 @@ def test_job_store_retention_prunes_expired(tmp_path: Path) -> None:
     with pytest.raises(FileNotFoundError):
         store.read_job(job_id)
     assert store.list_jobs() == []
+
+
+def test_keyword_index_ranks_with_bm25_and_persists(tmp_path: Path) -> None:
+    index = KeywordIndex(tmp_path, compact_every=2)
+    index.index_document("doc-1", {"title": "Acme supply contract", "summary": "Acme breach of supply contract"})
+    index.index_document("doc-2", {"title": "Board minutes", "entity_labels": ["Acme"]})
+    index.index_document("doc-3", {"title": "Unrelated memo", "summary": "Lunch order"})
+
+    results = index.search("acme contract", top_k=5)
+    assert [payload["doc_id"] for _, payload in results] == ["doc-1", "doc-2"]
+    assert results[0][1]["text"] == "Acme breach of supply contract"
+
+    index.index_document("doc-1", {"title": "Renamed", "summary": "Nothing relevant"})
+    index.remove_document("doc-2")
+    reloaded = KeywordIndex(tmp_path)
+    assert len(reloaded) == 2
+    assert reloaded.search("acme", top_k=5) == []
+    assert [payload["doc_id"] for _, payload in reloaded.search("lunch", top_k=5)] == ["doc-3"]
@@ -156,6 +156,9 @@ class DummyGraphService:
     def communities_for_nodes(self, node_ids: List[str]) -> List[object]:
         return []
 
+    def community_status(self) -> Dict[str, object]:
+        return {"stale": False, "pending_nodes": 0}
+
 
 class DummyDocumentStore:
     def __init__(self) -> None:
@@ -88,3 +88,40 @@ def test_timeline_service_enriches_metadata(monkeypatch: pytest.MonkeyPatch, tim
     assert query_counter.calls
     assert enrichment_counter.calls[0][0] >= 1
     assert filter_counter.calls == []
+
+
+def test_timeline_service_pages_without_reenriching(timeline_store: TimelineStore) -> None:
+    class CountingGraphService(StubGraphService):
+        def __init__(self) -> None:
+            self.lookups: List[List[str]] = []
+
+        def document_entities(self, doc_ids):
+            self.lookups.append(list(doc_ids))
+            return super().document_entities(doc_ids)
+
+    timeline_store.append(
+        [
+            TimelineEvent(
+                id=f"doc-{index}::event::0",
+                ts=datetime(2024, 2, index + 1),
+                title="Filing",
+                summary="Routine filing",
+                citations=[f"doc-{index}"],
+            )
+            for index in range(2, 5)
+        ]
+    )
+    graph = CountingGraphService()
+    service = TimelineService(store=timeline_store, graph_service=graph)
+
+    first = service.list_events(limit=2)
+    assert [event.id for event in first.events] == ["doc-1::event::0", "doc-2::event::0"]
+    assert first.has_more and first.next_cursor
+    second = service.list_events(limit=2, cursor=first.next_cursor)
+    assert [event.id for event in second.events] == ["doc-3::event::0", "doc-4::event::0"]
+    assert not second.has_more
+
+    assert len(graph.lookups) == 1
+    by_entity = service.list_events(entity="Acme")
+    assert len(by_entity.events) == 4
+    assert all(event.entity_highlights for event in by_entity.events)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from dataclasses import replace
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -7,7 +8,7 @@ import json
 import sys
 sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
 
-from backend.app.storage.timeline_store import TimelineEvent, TimelineStore
+from backend.app.storage.timeline_store import TimelineEvent, TimelineQuery, TimelineStore
 
 def test_timeline_store_append_and_read(tmp_path: Path) -> None:
     store = TimelineStore(tmp_path / "timeline.jsonl")
@@ -58,3 +59,49 @@ def test_timeline_store_handles_empty_and_corrupt_lines(tmp_path: Path) -> None:
     assert [event.id for event in read_back] == ["evt-2"]
     assert read_back[0].entity_highlights == []
     assert read_back[0].relation_tags == []
+
+
+def test_timeline_store_query_pushes_down_filters_and_cursor(tmp_path: Path) -> None:
+    store_path = tmp_path / "timeline.jsonl"
+    store = TimelineStore(store_path)
+    store.append(
+        [
+            TimelineEvent(
+                id=f"evt-{index}",
+                ts=datetime(2024, 1, 1 + index),
+                title=f"Event {index}",
+                summary="Summary",
+                citations=[f"doc-{index % 2}"],
+                entity_highlights=[{"id": "entity::acme", "label": "Acme Corp"}] if index % 3 == 0 else [],
+                risk_band="high" if index % 2 else "low",
+            )
+            for index in range(8)
+        ]
+    )
+
+    window = TimelineQuery(from_ts=datetime(2024, 1, 2), to_ts=datetime(2024, 1, 7))
+    first = store.query(window, limit=2)
+    assert [event.id for event in first] == ["evt-1", "evt-2"]
+    after = (first[-1].ts, first[-1].id)
+    assert [event.id for event in store.query(replace(window, after=after), limit=10)] == [
+        "evt-3",
+        "evt-4",
+        "evt-5",
+        "evt-6",
+    ]
+    assert [event.id for event in store.query(TimelineQuery(risk_band="HIGH"), limit=10)] == [
+        "evt-1",
+        "evt-3",
+        "evt-5",
+        "evt-7",
+    ]
+    by_entity = store.query(TimelineQuery(entity_id="entity::none", entity_label="acme"), limit=10)
+    assert [event.id for event in by_entity] == ["evt-0", "evt-3", "evt-6"]
+    assert store.citations(TimelineQuery(from_ts=datetime(2024, 1, 2))) == ["doc-1", "doc-0"]
+
+    # Records appended by another writer are picked up incrementally; the last one wins.
+    with store_path.open("a", encoding="utf-8") as handle:
+        updated = TimelineEvent(id="evt-0", ts=datetime(2024, 2, 1), title="Moved", summary="Later")
+        handle.write(json.dumps(updated.to_record()) + "\n")
+    assert [event.id for event in store.query(TimelineQuery(from_ts=datetime(2024, 1, 31)), limit=5)] == ["evt-0"]
+    assert len(TimelineStore(store_path).read_all()) == 8
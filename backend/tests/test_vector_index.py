@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import math
+import random
+from pathlib import Path
+from typing import List, Sequence
+
+import pytest
+from qdrant_client.http import models as qmodels
+
+from backend.app.services.vector import InMemoryVectorIndex
+
+
+def _points(vectors: Sequence[Sequence[float]]) -> List[qmodels.PointStruct]:
+    return [
+        qmodels.PointStruct(id=f"point-{index}", vector=list(vector), payload={"chunk_index": index})
+        for index, vector in enumerate(vectors)
+    ]
+
+
+def _reference_ranking(query: Sequence[float], vectors: Sequence[Sequence[float]], top_k: int) -> List[str]:
+    def cosine(left: Sequence[float], right: Sequence[float]) -> float:
+        dot = sum(a * b for a, b in zip(left, right))
+        left_norm = math.sqrt(sum(a * a for a in left))
+        right_norm = math.sqrt(sum(b * b for b in right))
+        if left_norm == 0.0 or right_norm == 0.0:
+            return 0.0
+        return dot / (left_norm * right_norm)
+
+    scored = [(cosine(query, vector), f"point-{index}") for index, vector in enumerate(vectors)]
+    scored.sort(key=lambda item: item[0], reverse=True)
+    return [point_id for _, point_id in scored[:top_k]]
+
+
+def test_search_matches_full_sort_ranking() -> None:
+    rng = random.Random(7)
+    vectors = [[rng.uniform(-1.0, 1.0) for _ in range(8)] for _ in range(300)]
+    index = InMemoryVectorIndex(8)
+    index.upsert(_points(vectors))
+
+    query = [rng.uniform(-1.0, 1.0) for _ in range(8)]
+    results = index.search(query, top_k=10)
+
+    assert [str(point.id) for point in results] == _reference_ranking(query, vectors, 10)
+    assert results[0].payload["chunk_index"] == int(str(results[0].id).split("-")[1])
+
+
+def test_search_keeps_insertion_order_for_ties_and_zero_vectors() -> None:
+    vectors = [[1.0, 0.0], [0.0, 0.0], [2.0, 0.0], [1.0, 0.0], [0.0, 1.0]]
+    index = InMemoryVectorIndex(2)
+    index.upsert(_points(vectors))
+
+    results = index.search([1.0, 0.0], top_k=2)
+    assert [str(point.id) for point in results] == ["point-0", "point-2"]
+    assert index.search([0.0, 0.0], top_k=1)[0].score == 0.0
+
+
+def test_upsert_replaces_existing_point() -> None:
+    index = InMemoryVectorIndex(2)
+    index.upsert(_points([[1.0, 0.0], [0.0, 1.0]]))
+    index.upsert([qmodels.PointStruct(id="point-0", vector=[0.0, 1.0], payload={"chunk_index": 9})])
+
+    assert len(index) == 2
+    top = index.search([0.0, 1.0], top_k=2)
+    assert {str(point.id) for point in top} == {"point-0", "point-1"}
+    assert all(point.score == pytest.approx(1.0) for point in top)
+    with pytest.raises(ValueError):
+        index.upsert([qmodels.PointStruct(id="bad", vector=[1.0, 2.0, 3.0], payload={})])
+
+
+def test_persisted_index_reloads_without_reingest(tmp_path: Path) -> None:
+    rng = random.Random(11)
+    vectors = [[rng.uniform(-1.0, 1.0) for _ in range(4)] for _ in range(1500)]
+    index = InMemoryVectorIndex(4, storage_dir=tmp_path)
+    index.upsert(_points(vectors[:700]))
+    index.upsert(_points(vectors)[700:])
+    index.upsert([qmodels.PointStruct(id="point-3", vector=vectors[3], payload={"chunk_index": 3, "updated": True})])
+
+    query = [0.3, -0.2, 0.9, 0.1]
+    expected = [(str(point.id), point.score) for point in index.search(query, top_k=5)]
+
+    reloaded = InMemoryVectorIndex(4, storage_dir=tmp_path)
+    assert len(reloaded) == 1500
+    assert [(str(point.id), point.score) for point in reloaded.search(query, top_k=5)] == expected
+    assert reloaded.search(vectors[3], top_k=1)[0].payload == {"chunk_index": 3, "updated": True}
+
+    resized = InMemoryVectorIndex(6, storage_dir=tmp_path)
+    assert len(resized) == 0
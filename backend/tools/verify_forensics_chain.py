@@ -19,13 +19,22 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Emit verification summary as JSON",
     )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Verify every entry from genesis instead of resuming from the latest checkpoint",
+    )
     return parser
 
 
 def _load_ledger(path: Path | None) -> ForensicsChainLedger:
     settings = get_settings()
     ledger_path = Path(path) if path else settings.forensics_chain_path
-    return ForensicsChainLedger(ledger_path)
+    return ForensicsChainLedger(
+        ledger_path,
+        signing_key=settings.forensics_checkpoint_key,
+        checkpoint_interval=settings.forensics_chain_checkpoint_interval,
+    )
 
 
 def main(argv: list[str] | None = None, *, ledger_factory: Callable[[Path | None], ForensicsChainLedger] | None = None) -> int:
@@ -33,7 +42,7 @@ def main(argv: list[str] | None = None, *, ledger_factory: Callable[[Path | None
     args = parser.parse_args(argv)
     factory = ledger_factory or _load_ledger
     ledger = factory(Path(args.path) if args.path else None)
-    ok, issues = ledger.verify()
+    ok, issues = ledger.verify(full=args.full)
     entries = list(ledger.iter_entries())
     summary = {
         "path": str(ledger.path),
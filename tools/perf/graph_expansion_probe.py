@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""Measure in-memory graph expansion latency as the edge count grows.
+
+Retrieval expands matched entities with ``GraphService.subgraph``; with adjacency
+indexes its cost should track node degree rather than total edge count, so the
+reported latencies should stay flat across graph sizes.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import statistics
+import time
+from typing import Dict, List, Sequence
+
+
+def _build_graph(edge_count: int, degree: int, seed: int):
+    os.environ["NEO4J_URI"] = "memory://"
+    from backend.app import config
+    from backend.app.services import graph as graph_module
+
+    config.reset_settings_cache()
+    graph_module.reset_graph_service()
+    service = graph_module.GraphService()
+    rng = random.Random(seed)
+    node_count = max(2, edge_count // degree)
+    for index in range(node_count):
+        node_id = f"entity::{index}"
+        service._nodes[node_id] = graph_module.GraphNode(node_id, "Entity", {"label": f"Entity {index}"})
+    # Bulk load straight into the memory store: the probe measures expansion, not ingestion.
+    for index in range(edge_count):
+        source = f"entity::{index % node_count}"
+        target = f"entity::{rng.randrange(node_count)}"
+        doc_id = f"doc::{index // 50}"
+        edge = graph_module.GraphEdge(source, target, "RELATED_TO", {"doc_id": doc_id})
+        service._store_memory_edge((source, "RELATED_TO", target, doc_id), edge)
+    return service, node_count
+
+
+def _time_expansion(service, node_count: int, queries: int, seeds_per_query: int, seed: int) -> List[float]:
+    rng = random.Random(seed)
+    latencies: List[float] = []
+    for _ in range(queries):
+        seeds = [f"entity::{rng.randrange(node_count)}" for _ in range(seeds_per_query)]
+        start = time.perf_counter()
+        service.subgraph(seeds)
+        latencies.append((time.perf_counter() - start) * 1000.0)
+    return latencies
+
+
+def run(sizes: Sequence[int], degree: int, queries: int, seeds_per_query: int, seed: int) -> List[Dict[str, object]]:
+    results: List[Dict[str, object]] = []
+    for size in sizes:
+        service, node_count = _build_graph(size, degree, seed)
+        latencies = _time_expansion(service, node_count, queries, seeds_per_query, seed)
+        results.append(
+            {
+                "edges": size,
+                "nodes": node_count,
+                "mean_ms": statistics.fmean(latencies),
+                "p95_ms": sorted(latencies)[int(0.95 * (len(latencies) - 1))],
+                "max_ms": max(latencies),
+            }
+        )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark GraphService.subgraph against graph size.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--degree", type=int, default=8, help="Average out-degree of synthetic nodes")
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--seeds-per-query", type=int, default=6)
+    parser.add_argument("--seed", type=int, default=13)
+    args = parser.parse_args()
+
+    results = run(args.sizes, args.degree, args.queries, args.seeds_per_query, args.seed)
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()